@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+import pyunitwizard as puw
+from pyunitwizard._private.array_literals import READ_ARRAY_MIN_LENGTH, read_array
+
+SIZES = (1, 2, 4, 8, 16, 32, 64, 128, 256, 1024, 4096)
+
+
+def _time_once(func: Callable[[], object]) -> float:
+    t0 = perf_counter()
+    func()
+    return perf_counter() - t0
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def _per_call(func: Callable[[], object], calls: int, repeats: int) -> float:
+    return median(_time_once(lambda: [func() for _ in range(calls)]) for _ in range(repeats)) / calls
+
+
+def _size_sweep(sizes: Sequence[int], repeats: int) -> Dict[str, object]:
+    """Time `ast.literal_eval` against `read_array` on growing literals.
+
+    Float and integer literals are timed separately: integers are short to
+    write, so they cross over at fewer characters.
+    """
+
+    rng = np.random.default_rng(0)
+    sweep: Dict[str, object] = {}
+    crossover = {}
+
+    for kind in ("float", "int"):
+        rows = []
+        for size in sizes:
+            if kind == "float":
+                items = rng.random(size).tolist()
+            else:
+                items = list(range(size))
+            literal = repr(items)
+            if read_array(literal).tolist() != items:
+                raise AssertionError(f"read_array diverged from literal_eval on {literal[:40]!r}")
+            calls = max(1, 2000 // size)
+            rows.append({
+                "elements": size,
+                "characters": len(literal),
+                "literal_eval_seconds": _per_call(lambda: ast.literal_eval(literal), calls, repeats),
+                "read_array_seconds": _per_call(lambda: read_array(literal), calls, repeats),
+            })
+        sweep[kind] = rows
+        crossover[kind] = next(
+            (row["characters"] for row in rows if row["read_array_seconds"] < row["literal_eval_seconds"]),
+            None,
+        )
+
+    return {"rows": sweep, "crossover_characters": crossover}
+
+
+def run_benchmark(
+    n_elements: int = 10**6,
+    repeats: int = 3,
+    sizes: Sequence[int] = SIZES,
+) -> Dict[str, object]:
+    """Time reading array literals and a string round trip of a large quantity.
+
+    The size sweep locates the literal length past which `read_array` beats
+    `ast.literal_eval`, to check `READ_ARRAY_MIN_LENGTH` against. The round
+    trip writes an `n_elements` pint quantity to string form and parses it
+    back, checking that the values survive exactly; its read is compared with
+    `ast.literal_eval` on the same values written with commas, timed once.
+    """
+
+    puw.configure.reset()
+    puw.configure.load_library(["pint"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+
+    values = np.random.default_rng(0).random(n_elements)
+    quantity = puw.quantity(values, "nanometer", form="pint")
+
+    string = puw.convert(quantity, to_form="string")
+    if not np.array_equal(puw.get_value(puw.convert(string, to_form="pint")), values):
+        raise AssertionError("string round trip did not give back the same values")
+
+    comma_literal = repr(values.tolist())
+
+    round_trip = {
+        "to_string": _summary(
+            [_time_once(lambda: puw.convert(quantity, to_form="string")) for _ in range(repeats)]
+        ),
+        "from_string": _summary(
+            [_time_once(lambda: puw.convert(string, to_form="pint")) for _ in range(repeats)]
+        ),
+        "read_array": _summary([_time_once(lambda: read_array(comma_literal)) for _ in range(repeats)]),
+        "literal_eval": _summary([_time_once(lambda: ast.literal_eval(comma_literal))]),
+    }
+
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "n_elements": n_elements,
+        "repeats": repeats,
+        "read_array_min_length": READ_ARRAY_MIN_LENGTH,
+        "size_sweep": _size_sweep(sizes, repeats=max(repeats, 5)),
+        "round_trip": round_trip,
+        "speedup_median": (
+            round_trip["literal_eval"]["median_seconds"] / round_trip["read_array"]["median_seconds"]
+        ),
+    }
+
+
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser()
+    arguments.add_argument("--elements", type=int, default=10**6)
+    arguments.add_argument("--repeats", type=int, default=3)
+    options = arguments.parse_args()
+
+    print(json.dumps(run_benchmark(options.elements, options.repeats), indent=2, sort_keys=True))
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import pyunitwizard as puw
+
+
+def _time_per_call(func: Callable[[], object], number: int) -> float:
+    t0 = perf_counter()
+    for _ in range(number):
+        func()
+    return (perf_counter() - t0) / number
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def run_benchmark(number: int = 2_000, repeats: int = 5) -> Dict[str, object]:
+    """Time entering and leaving `context()` with and without a precompiled Policy.
+
+    Both variants switch to the same standard units and default form; the
+    plain one rebuilds the standards on every entry, the policy one selects
+    the state compiled when the policy was built.
+    """
+
+    puw.configure.reset()
+    puw.configure.load_library(["pint", "openmm.unit"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+    puw.configure.set_standard_units(["nm", "ps", "kJ/mol"])
+
+    standard_units = ["angstrom", "fs", "kcal/mol"]
+    policy = puw.configure.Policy(standard_units=standard_units, default_form="openmm.unit")
+
+    def with_arguments():
+        with puw.context(default_form="openmm.unit", standard_units=standard_units):
+            pass
+
+    def with_policy():
+        with puw.context(policy):
+            pass
+
+    arguments_samples = [_time_per_call(with_arguments, max(1, number // 20)) for _ in range(repeats)]
+    policy_samples = [_time_per_call(with_policy, number) for _ in range(repeats)]
+
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "number": number,
+        "repeats": repeats,
+        "results": {
+            "context_with_arguments": _summary(arguments_samples),
+            "context_with_policy": _summary(policy_samples),
+        },
+        "speedup_median": median(arguments_samples) / median(policy_samples),
+    }
+
+
+if __name__ == "__main__":
+    output = run_benchmark()
+    print(json.dumps(output, indent=2, sort_keys=True))
@@ -75,12 +75,14 @@ def run_baseline(iterations: int = 5000, repeats: int = 5) -> Dict[str, object]:
     quantity = puw.quantity(1.0, "nanometer")
     quantity_si = puw.quantity(1.0, "meter")
     unit = puw.unit("nanometer", form="pint")
+    to_angstrom = puw.compile_conversion("nanometer", "angstrom")
 
     benchmarks: Dict[str, Callable[[], None]] = {
         "convert_nm_to_angstrom": lambda: puw.convert(quantity, to_unit="angstrom"),
         "get_value_nm_to_angstrom": lambda: puw.get_value(
             quantity, to_unit="angstrom"
         ),
+        "compiled_plan_nm_to_angstrom": lambda: to_angstrom(quantity),
         "get_form_quantity": lambda: puw.get_form(quantity),
         "is_quantity_quantity": lambda: puw.is_quantity(quantity),
         "parse_string_quantity": lambda: puw.quantity("10 angstrom"),
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import numpy as np
+
+import pyunitwizard as puw
+
+
+def _time_once(func: Callable[[], object]) -> float:
+    t0 = perf_counter()
+    func()
+    return perf_counter() - t0
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def run_benchmark(n_items: int = 20000, repeats: int = 5) -> Dict[str, object]:
+    """Compare `convert_many` against looping over `convert` on small quantities.
+
+    The batch mixes three source units, which is the shape of a typical
+    ingestion frame: many small quantities, few distinct units. Both paths are
+    checked to give identical values before anything is timed.
+    """
+
+    puw.configure.reset()
+    puw.configure.load_library(["pint"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+
+    rng = np.random.default_rng(0)
+    units = ["nanometer", "picometer", "meter"]
+    items = [
+        puw.quantity(float(value), units[ii % len(units)])
+        for ii, value in enumerate(rng.random(n_items))
+    ]
+
+    def loop():
+        return [puw.convert(item, to_unit="angstrom", to_type="value") for item in items]
+
+    def batch():
+        return puw.convert_many(items, to_unit="angstrom", to_type="value")
+
+    if not np.array_equal(np.asarray(loop()), np.asarray(batch())):
+        raise AssertionError("convert_many diverged from looping over convert")
+
+    loop_samples = [_time_once(loop) for _ in range(repeats)]
+    batch_samples = [_time_once(batch) for _ in range(repeats)]
+
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "n_items": n_items,
+        "repeats": repeats,
+        "results": {
+            "convert_loop": _summary(loop_samples),
+            "convert_many": _summary(batch_samples),
+        },
+        "speedup_median": median(loop_samples) / median(batch_samples),
+    }
+
+
+if __name__ == "__main__":
+    output = run_benchmark()
+    print(json.dumps(output, indent=2, sort_keys=True))
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+import pyunitwizard as puw
+
+
+def _time_once(func: Callable[[], object]) -> float:
+    t0 = perf_counter()
+    func()
+    return perf_counter() - t0
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def run_benchmark(
+    n_elements: int = 50_000_000,
+    workers: Optional[Sequence[int]] = None,
+    repeats: int = 5,
+) -> Dict[str, object]:
+    """Time `get_value(to_unit=...)` into a preallocated array per worker count.
+
+    Writing into `out` keeps allocation out of the timings, so what scales is
+    the multiply itself. Every worker count is checked against the serial
+    result before anything is timed. The default worker counts are the powers
+    of two up to the CPU count of the machine, which is recorded alongside.
+    """
+
+    cpu_count = os.cpu_count() or 1
+    if workers is None:
+        workers = sorted({2**k for k in range(cpu_count.bit_length()) if 2**k <= cpu_count} | {cpu_count})
+
+    puw.configure.reset()
+    puw.configure.load_library(["pint"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+
+    source = puw.quantity(np.random.default_rng(0).random(n_elements), "nanometer")
+    out = np.empty(n_elements)
+    expected = puw.get_value(source, to_unit="angstrom")
+
+    results = {}
+    for n_workers in workers:
+        def scaled(n_workers=n_workers):
+            return puw.get_value(source, to_unit="angstrom", out=out, workers=n_workers)
+
+        if not np.array_equal(scaled(), expected):
+            raise AssertionError(f"workers={n_workers} diverged from the serial result")
+
+        results[str(n_workers)] = _summary([_time_once(scaled) for _ in range(repeats)])
+
+    serial = results[str(workers[0])]["median_seconds"]
+
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "cpu_count": cpu_count,
+        "n_elements": n_elements,
+        "repeats": repeats,
+        "results": results,
+        "speedup_median": {
+            key: serial / value["median_seconds"] for key, value in results.items()
+        },
+    }
+
+
+if __name__ == "__main__":
+    output = run_benchmark()
+    print(json.dumps(output, indent=2, sort_keys=True))
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import numpy as np
+
+import pyunitwizard as puw
+
+
+def _time_once(func: Callable[[], object]) -> float:
+    t0 = perf_counter()
+    func()
+    return perf_counter() - t0
+
+
+def _peak_bytes(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def run_benchmark(n_rows: int = 2_000_000, chunk_size: int = 131_072, repeats: int = 5) -> Dict[str, object]:
+    """Compare `convert_stream` against converting a whole array with `convert`.
+
+    Both paths reduce the converted coordinates to their sum, so the streamed
+    path never holds more than one chunk while the whole-array path holds the
+    full converted copy. Both are checked to agree before anything is timed;
+    peak traced allocation is reported next to the timings.
+    """
+
+    puw.configure.reset()
+    puw.configure.load_library(["pint"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+
+    source = np.random.default_rng(0).random((n_rows, 3))
+    source_quantity = puw.quantity(source, "nanometer")
+
+    def whole():
+        return puw.convert(source_quantity, to_unit="angstrom", to_type="value").sum()
+
+    def streamed():
+        return sum(
+            chunk.sum()
+            for chunk in puw.convert_stream(source, "nanometer", "angstrom", chunk_size=chunk_size)
+        )
+
+    if not np.isclose(whole(), streamed(), rtol=1e-12):
+        raise AssertionError("convert_stream diverged from whole-array convert")
+
+    whole_samples = [_time_once(whole) for _ in range(repeats)]
+    streamed_samples = [_time_once(streamed) for _ in range(repeats)]
+
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "n_rows": n_rows,
+        "chunk_size": chunk_size,
+        "repeats": repeats,
+        "results": {
+            "convert_whole_array": _summary(whole_samples),
+            "convert_stream": _summary(streamed_samples),
+        },
+        "peak_traced_bytes": {
+            "convert_whole_array": _peak_bytes(whole),
+            "convert_stream": _peak_bytes(streamed),
+        },
+        "speedup_median": median(whole_samples) / median(streamed_samples),
+    }
+
+
+if __name__ == "__main__":
+    output = run_benchmark()
+    print(json.dumps(output, indent=2, sort_keys=True))
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import pyunitwizard as puw
+from pyunitwizard.api.introspection import _form_adapter, get_form
+from pyunitwizard.forms import dict_get_unit, dict_get_value, dict_is_unit
+
+FORMS = ("pint", "openmm.unit", "unyt", "astropy.units")
+
+
+def _time_once(func: Callable[[], object]) -> float:
+    t0 = perf_counter()
+    func()
+    return perf_counter() - t0
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def _through_tables(quantities) -> None:
+    for quantity in quantities:
+        form = get_form(quantity)
+        if not dict_is_unit[form](quantity):
+            dict_get_value[form](quantity)
+            dict_get_unit[form](quantity)
+
+
+def _through_adapters(quantities) -> None:
+    for quantity in quantities:
+        adapter = _form_adapter(quantity)
+        if not adapter.is_unit(quantity):
+            adapter.get_value(quantity)
+            adapter.get_unit(quantity)
+
+
+def run_benchmark(n_quantities: int = 10**5, repeats: int = 7) -> Dict[str, object]:
+    """Time the dispatch of a value-and-unit read over mixed forms.
+
+    Each quantity is asked whether it is a unit and then for its value and
+    unit, as `get_value(..., to_unit=...)` and `has_unit` do, once resolving
+    the form and indexing the `dict_*` tables per operation, once through the
+    adapter of its type. The backend calls are the same on both sides, so the
+    difference is the dispatch alone; the public calls are timed too.
+    """
+
+    puw.configure.reset()
+    puw.configure.load_library(list(FORMS))
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+
+    samples = [puw.quantity(1.0, "nanometer", form=form) for form in FORMS]
+    quantities = [samples[i % len(samples)] for i in range(n_quantities)]
+
+    results = {
+        "tables": _summary([_time_once(lambda: _through_tables(quantities)) for _ in range(repeats)]),
+        "adapters": _summary([_time_once(lambda: _through_adapters(quantities)) for _ in range(repeats)]),
+    }
+
+    public_calls = {
+        "get_value": lambda: [puw.get_value(quantity) for quantity in quantities],
+        "has_unit": lambda: [puw.has_unit(quantity, "nm") for quantity in quantities],
+        "convert_to_pint": lambda: [puw.convert(quantity, to_form="pint") for quantity in quantities],
+    }
+    per_call = {
+        name: median(_time_once(call) for _ in range(repeats)) / n_quantities
+        for name, call in public_calls.items()
+    }
+
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "forms": list(FORMS),
+        "n_quantities": n_quantities,
+        "repeats": repeats,
+        "results": results,
+        "public_call_seconds": per_call,
+        "speedup_median": (
+            results["tables"]["median_seconds"] / results["adapters"]["median_seconds"]
+        ),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2, sort_keys=True))
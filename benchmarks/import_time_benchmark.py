@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from statistics import median
+from typing import Dict, List, Optional, Sequence
+
+# Modules `import pyunitwizard` must not load: they are paid for on first use.
+DEFERRED_MODULES = ("smonitor", "depdigest", "numpy", "pint", "importlib.metadata")
+
+BACKENDS = ("pint", "openmm.unit", "unyt", "astropy.units")
+
+# Run in a fresh interpreter per backend, so that every number is a true
+# first call: nothing imported, loaded or cached beforehand.
+_FIRST_CALL_SCRIPT = """
+import json
+import sys
+from time import perf_counter
+
+t0 = perf_counter()
+import pyunitwizard as puw
+t1 = perf_counter()
+form = sys.argv[1]
+puw.configure.load_library(["pint", form])
+puw.configure.set_default_parser("pint")
+t2 = perf_counter()
+q = puw.quantity(1.0, "nanometer", form=form)
+t3 = perf_counter()
+puw.convert(q, to_unit="angstrom")
+t4 = perf_counter()
+puw.get_form(q)
+t5 = perf_counter()
+print(json.dumps({
+    "import": t1 - t0,
+    "load_library": t2 - t1,
+    "quantity": t3 - t2,
+    "convert": t4 - t3,
+    "get_form": t5 - t4,
+}))
+"""
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def _import_time_once() -> Dict[str, object]:
+    """Return the cumulative `-X importtime` figure and what the import loaded."""
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, pyunitwizard; print(' '.join(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative_us = None
+    for line in completed.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "pyunitwizard":
+            cumulative_us = int(fields[1])
+
+    if cumulative_us is None:
+        raise RuntimeError("no `-X importtime` entry for pyunitwizard:\n" + completed.stderr)
+
+    loaded = set(completed.stdout.split())
+    return {
+        "seconds": cumulative_us / 1e6,
+        "deferred_modules_loaded": sorted(name for name in DEFERRED_MODULES if name in loaded),
+    }
+
+
+def _first_call_once(backend: str) -> Optional[Dict[str, float]]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _FIRST_CALL_SCRIPT, backend],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        return None
+    return json.loads(completed.stdout)
+
+
+def run_benchmark(
+    repeats: int = 7,
+    backends: Sequence[str] = BACKENDS,
+    budget_ms: Optional[float] = None,
+) -> Dict[str, object]:
+    """Time `import pyunitwizard` and the first API calls per backend.
+
+    The import is measured with `python -X importtime` in a fresh interpreter
+    per repeat, which also reports whether any of `DEFERRED_MODULES` was
+    loaded. First-call latencies are taken in a fresh interpreter per backend
+    and repeat. Backends that are not installed are reported as skipped.
+
+    With `budget_ms`, `within_budget` tells whether the median import time
+    stayed under it and no deferred module was loaded.
+    """
+
+    imports = [_import_time_once() for _ in range(repeats)]
+    import_samples = [sample["seconds"] for sample in imports]
+    deferred_loaded = sorted(
+        {name for sample in imports for name in sample["deferred_modules_loaded"]}
+    )
+
+    first_call: Dict[str, object] = {}
+    skipped = []
+    for backend in backends:
+        samples = [_first_call_once(backend) for _ in range(repeats)]
+        if any(sample is None for sample in samples):
+            skipped.append(backend)
+            continue
+        first_call[backend] = {
+            step: _summary([sample[step] for sample in samples]) for step in samples[0]
+        }
+
+    output: Dict[str, object] = {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "repeats": repeats,
+        "import": _summary(import_samples),
+        "deferred_modules_loaded": deferred_loaded,
+        "first_call": first_call,
+        "skipped_backends": skipped,
+    }
+
+    if budget_ms is not None:
+        output["budget_ms"] = budget_ms
+        output["within_budget"] = (
+            median(import_samples) * 1e3 <= budget_ms and not deferred_loaded
+        )
+
+    return output
+
+
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser()
+    arguments.add_argument("--repeats", type=int, default=7)
+    arguments.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="exit with status 1 when the median import time exceeds this budget",
+    )
+    options = arguments.parse_args()
+
+    output = run_benchmark(repeats=options.repeats, budget_ms=options.budget_ms)
+    print(json.dumps(output, indent=2, sort_keys=True))
+
+    if output.get("within_budget") is False:
+        sys.exit(1)
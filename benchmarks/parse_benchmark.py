@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import numpy as np
+
+import pyunitwizard as puw
+from pyunitwizard.parse import _parse_cached, parse
+
+
+def _time_once(func: Callable[[], object]) -> float:
+    t0 = perf_counter()
+    func()
+    return perf_counter() - t0
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def run_benchmark(n_strings: int = 5000, repeats: int = 5) -> Dict[str, object]:
+    """Time `parse` on distinct values in a few units against whole-string parsing.
+
+    Every string carries its own number, as lines of a text input file do, so
+    a cache keyed on the whole string misses every time; the baseline is that
+    whole-string parse. Both are checked to give the same quantities first.
+    """
+
+    puw.configure.reset()
+    puw.configure.load_library(["pint", "openmm.unit"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+
+    units = ["nm", "ps", "kJ/mol", "angstrom", "kcal/(mol*angstrom**2)"]
+    rng = np.random.default_rng(0)
+    strings = [
+        f"{value!r} {units[ii % len(units)]}"
+        for ii, value in enumerate(rng.random(n_strings).tolist())
+    ]
+
+    results = {}
+    speedup = {}
+    for form in ("pint", "openmm.unit"):
+        def whole(form=form):
+            _parse_cached.cache_clear()
+            return [_parse_cached(string, "pint", form) for string in strings]
+
+        def split(form=form):
+            return [parse(string, to_form=form) for string in strings]
+
+        expected, obtained = whole(), split()
+        if [str(q) for q in expected] != [str(q) for q in obtained]:
+            raise AssertionError(f"split parsing diverged from whole-string parsing to {form}")
+
+        results[form] = {
+            "whole_string": _summary([_time_once(whole) for _ in range(repeats)]),
+            "value_unit_split": _summary([_time_once(split) for _ in range(repeats)]),
+        }
+        speedup[form] = (
+            results[form]["whole_string"]["median_seconds"]
+            / results[form]["value_unit_split"]["median_seconds"]
+        )
+
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "n_strings": n_strings,
+        "repeats": repeats,
+        "results": results,
+        "speedup_median": speedup,
+    }
+
+
+if __name__ == "__main__":
+    output = run_benchmark()
+    print(json.dumps(output, indent=2, sort_keys=True))
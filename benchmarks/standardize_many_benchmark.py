@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import numpy as np
+
+import pyunitwizard as puw
+
+
+def _time_once(func: Callable[[], object]) -> float:
+    t0 = perf_counter()
+    func()
+    return perf_counter() - t0
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def run_benchmark(n_records: int = 5000, repeats: int = 5) -> Dict[str, object]:
+    """Compare `standardize_many` against looping over `standardize`.
+
+    Each record carries a length, a time and an energy in non-standard units,
+    plus one field already in standard units: the shape of a loader that
+    standardizes every field of every record. Both paths are checked to give
+    identical values before anything is timed.
+    """
+
+    puw.configure.reset()
+    puw.configure.load_library(["pint"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+    puw.configure.set_standard_units(["nm", "ps", "kJ/mol"])
+
+    rng = np.random.default_rng(0)
+    items = []
+    for value in rng.random(n_records):
+        value = float(value)
+        items += [
+            puw.quantity(value, "angstrom"),
+            puw.quantity(value, "fs"),
+            puw.quantity(value, "kcal/mol"),
+            puw.quantity(value, "nm"),
+        ]
+
+    def loop():
+        return [puw.standardize(item) for item in items]
+
+    def batch():
+        return puw.standardize_many(items)
+
+    values_loop = np.asarray([puw.get_value(item) for item in loop()])
+    values_batch = np.asarray([puw.get_value(item) for item in batch()])
+    if not np.allclose(values_loop, values_batch, rtol=1e-12, atol=0.0):
+        raise AssertionError("standardize_many diverged from looping over standardize")
+
+    loop_samples = [_time_once(loop) for _ in range(repeats)]
+    batch_samples = [_time_once(batch) for _ in range(repeats)]
+
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "n_items": len(items),
+        "repeats": repeats,
+        "results": {
+            "standardize_loop": _summary(loop_samples),
+            "standardize_many": _summary(batch_samples),
+        },
+        "speedup_median": median(loop_samples) / median(batch_samples),
+    }
+
+
+if __name__ == "__main__":
+    output = run_benchmark()
+    print(json.dumps(output, indent=2, sort_keys=True))
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import pyunitwizard as puw
+from pyunitwizard._private import caches, unit_keys
+
+# How users spell the same few units.
+SPELLINGS = {
+    "nm": ["nm", "nanometer", "nanometers", "nanometre", " nm", "1 nm"],
+    "angstrom": ["angstrom", "angstroms", "Å", "angstrom "],
+    "kJ/mol": ["kJ/mol", "kJ / mol", "kilojoule/mole", "kilojoules / mole", "kJ*mol**-1", "kJ*mol^-1"],
+    "nm**2": ["nm**2", "nm^2", "nm ** 2", "nanometer**2", "nanometers^2"],
+    "ps": ["ps", "picosecond", "picoseconds", "1 ps"],
+}
+
+_CACHES = ("unit_string", "conversion_factor")
+
+
+def _time_once(func: Callable[[], object]) -> float:
+    t0 = perf_counter()
+    func()
+    return perf_counter() - t0
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_seconds": median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+    }
+
+
+def _cold_pass(pairs) -> None:
+    from pyunitwizard.api.conversion import _parse_unit_string
+
+    for name in _CACHES + ("native_unit", "unit_key", "unit_name"):
+        caches.registry[name].clear()
+    for spelling, canonical in pairs:
+        _parse_unit_string(spelling, "pint", "openmm.unit")
+        puw.conversion_factor(spelling, canonical)
+
+
+def run_benchmark(repeats: int = 7) -> Dict[str, object]:
+    """Time a cold pass over many spellings of a few units.
+
+    Every spelling is used once as a conversion target and once in
+    `conversion_factor`, starting from empty caches, as a service meets them
+    in its first requests. The baseline runs the same pass with every
+    spelling as its own key, as before canonicalization. The cache sizes show
+    the memory side: one entry per unit rather than per spelling.
+    """
+
+    puw.configure.reset()
+    puw.configure.load_library(["pint", "openmm.unit"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+
+    pairs = [
+        (spelling, canonical)
+        for canonical, spellings in SPELLINGS.items()
+        for spelling in spellings
+    ]
+
+    results = {}
+    sizes = {}
+    spell = unit_keys._spell
+    spellers = (
+        ("per_spelling", lambda unit_string, parser: unit_string),
+        ("canonical_keys", spell),
+    )
+    for label, speller in spellers:
+        unit_keys._spell = speller
+        try:
+            results[label] = _summary([_time_once(lambda: _cold_pass(pairs)) for _ in range(repeats)])
+            sizes[label] = {name: len(caches.registry[name]) for name in _CACHES}
+        finally:
+            unit_keys._spell = spell
+
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "units": len(SPELLINGS),
+        "spellings": len(pairs),
+        "repeats": repeats,
+        "cache_sizes": sizes,
+        "results": results,
+        "speedup_median": (
+            results["per_spelling"]["median_seconds"]
+            / results["canonical_keys"]["median_seconds"]
+        ),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmark(), indent=2, sort_keys=True))
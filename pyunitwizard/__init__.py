@@ -14,24 +14,43 @@ try:
 except ImportError:
     # Only when the package was not built. `importlib.metadata` costs about
     # 32 ms to import -- it brings in `email.message`, `zipfile` and `quopri`
-    # to read package metadata -- so it stays out of the path that already has
-    # the answer in a file next to this one.
+    # to read package metadata -- so even then `__version__` is only looked up
+    # when first read, by `__getattr__` below.
+    pass
+
+
+def _metadata_version() -> str:
     try:
         from importlib.metadata import version
 
-        __version__ = version("pyunitwizard")
+        return version("pyunitwizard")
     except Exception:
-        __version__ = "0.0.0+unknown"
+        return "0.0.0+unknown"
+
+
+_smonitor_configured = False
+
 
-from smonitor.integrations import ensure_configured as _ensure_smonitor_configured
+def _ensure_smonitor_configured() -> None:
+    """Configure smonitor for PyUnitWizard, once, on first use.
 
-from ._private.smonitor import PACKAGE_ROOT as _SMONITOR_PACKAGE_ROOT
+    Deferred from import time so that importing the package loads neither
+    smonitor nor its catalog; every path into the API calls this first.
+    """
 
-_ensure_smonitor_configured(_SMONITOR_PACKAGE_ROOT)
+    global _smonitor_configured
+
+    if not _smonitor_configured:
+        from smonitor.integrations import ensure_configured
+
+        from ._private.smonitor import PACKAGE_ROOT
+
+        ensure_configured(PACKAGE_ROOT)
+        _smonitor_configured = True
 
 
 def __print_version__() -> None:
-    print("PyUnitWizard version " + __version__)
+    print("PyUnitWizard version " + __getattr__("__version__"))
 
 
 # Central lazy-loading registry mapping public API submodules and functions
@@ -48,8 +67,13 @@ _LAZY_ATTRIBUTES = {
     "compatibility": (".api", "compatibility"),
     "change_value": (".api", "change_value"),
     "check": (".api", "check"),
+    "compile_conversion": (".api", "compile_conversion"),
+    "conversion_affine": (".api", "conversion_affine"),
     "conversion_factor": (".api", "conversion_factor"),
     "convert": (".api", "convert"),
+    "convert_magnitude": (".api", "convert_magnitude"),
+    "convert_many": (".api", "convert_many"),
+    "convert_stream": (".api", "convert_stream"),
     "ensure_quantity": (".api", "ensure_quantity"),
     "get_dimensionality": (".api", "get_dimensionality"),
     "get_form": (".api", "get_form"),
@@ -61,11 +85,13 @@ _LAZY_ATTRIBUTES = {
     "is_dimensionless": (".api", "is_dimensionless"),
     "is_quantity": (".api", "is_quantity"),
     "is_unit": (".api", "is_unit"),
+    "parse_many": (".api", "parse_many"),
     "quantity": (".api", "quantity"),
     "similarity": (".api", "similarity"),
     "fast_track": (".api", "fast_track"),
     "register_fast_track": (".api", "register_fast_track"),
     "standardize": (".api", "standardize"),
+    "standardize_many": (".api", "standardize_many"),
     "to_string": (".api", "to_string"),
     "unit": (".api", "unit"),
     "context": (".api", "context"),
@@ -75,7 +101,12 @@ __all__ = sorted(list(_LAZY_ATTRIBUTES.keys()))
 
 
 def __getattr__(name: str):
+    if name == "__version__":
+        globals()[name] = globals().get(name) or _metadata_version()
+        return globals()[name]
+
     if name in _LAZY_ATTRIBUTES:
+        _ensure_smonitor_configured()
         target = _LAZY_ATTRIBUTES[name]
         if isinstance(target, str):
             mod = importlib.import_module(target, __name__)
@@ -0,0 +1,170 @@
+"""Reading and writing the value part of array string quantities.
+
+A string quantity such as ``"[[1.0 2.0] [3.0 4.0]] nm"`` carries its value as
+a bracketed literal, comma- or space-separated depending on who wrote it:
+Python lists print with commas, numpy arrays -- and with them the pint,
+openmm.unit, unyt and astropy quantities built on them -- without.
+
+``ast.literal_eval`` reads the first kind only, and builds a Python object per
+element on the way: past a few thousand elements it dominates the parse, and
+at 10^6 it takes seconds and hundreds of megabytes. :func:`read_array`
+instead checks the bracket structure with numpy, walking the brackets rather
+than every character, and hands the numbers to numpy's C-level conversion in
+one call.
+
+Writing has the mirror problem: numpy summarizes arrays past its print
+threshold as ``[0.0 1.0 2.0 ... 997.0 998.0 999.0]``, which cannot be read
+back. :func:`format_array` writes such arrays in full instead.
+"""
+
+from __future__ import annotations
+
+import ast
+from typing import Any, Optional
+
+import numpy as np
+
+#: Literals at least this long are read with :func:`read_array` first; below
+#: it ``ast.literal_eval`` is faster. See ``benchmarks/array_literal_benchmark.py``.
+READ_ARRAY_MIN_LENGTH = 256
+
+_OPENING = ord("[")
+_CLOSING = ord("]")
+
+_SEPARATOR = np.zeros(256, dtype=bool)
+_SEPARATOR[list(b" \t\n\r,[]")] = True
+
+_TO_SPACES = str.maketrans("[],", "   ")
+
+
+def read_array(literal: str) -> Optional[np.ndarray]:
+    """Read a bracketed numeric literal into an ndarray, or return ``None``.
+
+    Nested lists must be regular, every innermost list holding the same number
+    of elements. Integer literals give an integer array, anything else a float
+    array. ``None`` is returned for whatever else `literal` holds -- ragged
+    lists, strings, complex or boolean elements -- so that the caller can fall
+    back to ``ast.literal_eval``.
+
+    Parameters
+    ----------
+    literal : str
+        A literal opening with ``[`` and closing with its matching ``]``.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        The value, or ``None`` if `literal` is not a regular numeric array.
+    """
+
+    try:
+        chars = np.frombuffer(literal.encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        return None
+
+    if chars.size < 2 or chars[0] != _OPENING or chars[-1] != _CLOSING:
+        return None
+
+    # Nesting level after each bracket; only the brackets are walked.
+    brackets = np.flatnonzero((chars == _OPENING) | (chars == _CLOSING))
+    opening = chars[brackets] == _OPENING
+    level = np.cumsum(np.where(opening, 1, -1))
+    if level[-1] != 0 or (level[:-1] <= 0).any():
+        return None
+    depth = int(level.max())
+
+    # A number starts wherever a non-separator follows a separator. The last
+    # bracket before it must open an innermost list.
+    token = ~_SEPARATOR[chars]
+    starts = token.copy()
+    starts[1:] &= ~token[:-1]
+    owner = np.searchsorted(brackets, np.flatnonzero(starts)) - 1
+    if not (level[owner] == depth).all():
+        return None
+
+    # Every level must hold the same number of items in each of its lists.
+    shape = []
+    parents = np.zeros(1, dtype=np.intp)
+    for depth_level in range(2, depth + 1):
+        children = np.flatnonzero(opening & (level == depth_level))
+        per_parent = np.bincount(
+            np.searchsorted(parents, children, side="right") - 1, minlength=parents.size
+        )
+        if (per_parent != per_parent[0]).any():
+            return None
+        shape.append(int(per_parent[0]))
+        parents = children
+
+    per_list = np.bincount(np.searchsorted(parents, owner, side="right") - 1, minlength=parents.size)
+    if (per_list != per_list[0]).any():
+        return None
+    shape.append(int(per_list[0]))
+
+    tokens = literal.translate(_TO_SPACES).split()
+    try:
+        value = np.array(tokens, dtype=np.int64)
+    except (ValueError, OverflowError):
+        try:
+            value = np.array(tokens, dtype=float)
+        except ValueError:
+            return None
+
+    return value.reshape(shape)
+
+
+def literal_value(literal: str) -> Any:
+    """Return the value of a ``[...]`` or ``(...)`` literal.
+
+    Short literals go through ``ast.literal_eval`` and keep its result, a list
+    or a tuple. Long ``[...]`` literals are read with :func:`read_array`.
+    Either way, the other reader gets a go when the first one cannot make
+    sense of `literal`, so that space-separated numpy output reads at any
+    length.
+
+    Raises
+    ------
+    SyntaxError, ValueError
+        As ``ast.literal_eval`` does, if neither reader understands `literal`.
+    """
+
+    if not literal.startswith("["):
+        return ast.literal_eval(literal)
+
+    if len(literal) >= READ_ARRAY_MIN_LENGTH:
+        value = read_array(literal)
+        if value is not None:
+            return value
+        return ast.literal_eval(literal)
+
+    try:
+        return ast.literal_eval(literal)
+    except (ValueError, SyntaxError):
+        value = read_array(literal)
+        if value is None:
+            raise
+        return value
+
+
+def is_summarized(value: Any) -> bool:
+    """Whether numpy would print `value` with an ellipsis."""
+
+    return isinstance(value, np.ndarray) and value.size > np.get_printoptions()["threshold"]
+
+
+def format_array(value: np.ndarray) -> str:
+    """Write `value` as a space-separated literal :func:`read_array` reads back.
+
+    Every element is written in full, with the shortest representation that
+    round-trips, whatever numpy's print options.
+    """
+
+    if value.ndim == 0 or value.size == 0:
+        return np.array2string(value, threshold=value.size + 1)
+
+    items = [repr(item) for item in value.ravel().tolist()]
+    for size in reversed(value.shape):
+        items = [
+            "[" + " ".join(items[start:start + size]) + "]"
+            for start in range(0, len(items), size)
+        ]
+    return items[0]
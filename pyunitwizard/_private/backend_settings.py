@@ -51,3 +51,44 @@ def resolve_pint_cache_folder() -> Optional[str]:
         return setting
 
     return None
+
+
+#: ``None`` defers to ``PYUNITWIZARD_UNIT_CACHE``; ``False`` disables the cache;
+#: ``True`` selects the per-user cache folder; a string selects a folder.
+unit_cache: Optional[Union[bool, str]] = None
+
+
+def _default_unit_cache_folder() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pyunitwizard")
+
+
+def resolve_unit_cache_folder() -> Optional[str]:
+    """Return the folder PyUnitWizard should persist its derived unit data in.
+
+    Returns
+    -------
+    str or None
+        A folder, or ``None`` to disable the on-disk cache.
+    """
+
+    setting = unit_cache
+
+    if setting is None:
+        setting = os.environ.get("PYUNITWIZARD_UNIT_CACHE", "").strip()
+        if not setting:
+            return None
+
+    if setting is False:
+        return None
+    if setting is True:
+        return _default_unit_cache_folder()
+
+    if isinstance(setting, str):
+        if setting.lower() in _OFF:
+            return None
+        if setting.lower() in _AUTO:
+            return _default_unit_cache_folder()
+        return setting
+
+    return None
@@ -0,0 +1,177 @@
+"""Bounded, observable caches shared by every memoized path of the library.
+
+Each cache registers under a name when it is created, so the limits and the
+counters of all of them are reachable from one place:
+``puw.configure.cache_stats()`` and ``puw.configure.set_cache_limits()``.
+
+A cache evicts its oldest entry once it holds `maxsize` of them. Under the
+``'lru'`` policy a hit makes an entry the newest again; under ``'fifo'`` the
+order is insertion only, which saves the reordering on every hit for caches
+whose keys are equally likely to come back. ``maxsize=None`` disables eviction.
+
+Only `get` counts hits and misses. Plain indexing and ``in`` are left at
+dictionary speed for the few callers that already know the key is present.
+
+Caches are shared by every thread without a lock. Each dictionary operation is
+atomic, so the only races are between a lookup and an eviction -- a key can
+vanish between being found and being refreshed, or between two evictions --
+and both are tolerated rather than serialised. The counters may undercount
+under contention; a memoized value may be computed twice, never wrongly.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import update_wrapper
+from typing import Any, Callable, Dict, Hashable, Optional
+
+POLICIES = ("lru", "fifo")
+
+_MISSING = object()
+
+#: Every cache created so far, by name.
+registry: Dict[str, "BoundedCache"] = {}
+
+
+class BoundedCache(OrderedDict):
+    """Dictionary with a maximum size, an eviction policy and hit counters.
+
+    Parameters
+    ----------
+    name : str
+        Name the cache is registered and reported under.
+    maxsize : int or None
+        Entries kept before the oldest is evicted; ``None`` for no limit.
+    policy : {'lru', 'fifo'}, default 'lru'
+        Whether a hit refreshes an entry (``'lru'``) or not (``'fifo'``).
+    """
+
+    def __init__(
+        self, name: str, maxsize: Optional[int], policy: str = "lru", register: bool = True
+    ):
+        super().__init__()
+        self.name = name
+        self.default_maxsize = maxsize
+        self.default_policy = policy
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if register:
+            registry[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = OrderedDict.__getitem__(self, key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.policy == "lru":
+            try:
+                self.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread since the lookup.
+                pass
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        OrderedDict.__setitem__(self, key, value)
+        if self.maxsize is not None:
+            self._evict(self.maxsize)
+
+    def _evict(self, maxsize: int) -> None:
+        while len(self) > maxsize:
+            try:
+                self.popitem(last=False)
+            except KeyError:
+                # Another thread emptied it first.
+                break
+            self.evictions += 1
+
+    def set_limit(self, maxsize: Optional[int] = _MISSING, policy: Optional[str] = None) -> None:
+        """Change the size limit and/or policy, evicting down to the new limit."""
+
+        if policy is not None:
+            self.policy = policy
+        if maxsize is not _MISSING:
+            self.maxsize = maxsize
+            if maxsize is not None:
+                self._evict(maxsize)
+
+    def reset(self) -> None:
+        """Empty the cache and restore its default limit, policy and counters."""
+
+        self.clear()
+        self.maxsize = self.default_maxsize
+        self.policy = self.default_policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "policy": self.policy,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def fork(self) -> "BoundedCache":
+        """Return an unregistered copy with the same entries and limits.
+
+        For state private to one context: its entries must not leak into the
+        cache the rest of the process sees, nor replace it in the registry.
+        """
+
+        forked = BoundedCache(self.name, self.maxsize, self.policy, register=False)
+        OrderedDict.update(forked, self)
+        return forked
+
+    # Copies -- `context()` snapshots -- are plain data, not new registrations.
+    def copy(self) -> Dict[Hashable, Any]:
+        return dict(self)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+def memoize(
+    name: str, maxsize: Optional[int], policy: str = "lru", key: Optional[Callable] = None
+) -> Callable:
+    """Decorator caching a function of hashable arguments.
+
+    The bounded counterpart of ``functools.lru_cache`` for this library: the
+    cache is a registered :class:`BoundedCache`, so it is sized, counted and
+    cleared with all the others. The wrapper keeps ``cache_clear()``.
+
+    `key`, when given, is called with the function's arguments and returns
+    the cache key instead of them, so that arguments known to give the same
+    result -- two spellings of one unit -- share an entry. The function itself
+    still receives the arguments as passed.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        cache = BoundedCache(name, maxsize, policy)
+
+        def wrapper(*args, **kwargs):
+            if key is not None:
+                cache_key = key(*args, **kwargs)
+            elif kwargs:
+                cache_key = args + (_MISSING,) + tuple(kwargs.items())
+            else:
+                cache_key = args
+            value = cache.get(cache_key, _MISSING)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                cache[cache_key] = value
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return update_wrapper(wrapper, function)
+
+    return decorator
@@ -3,6 +3,11 @@ from __future__ import annotations
 from smonitor.integrations import CatalogException
 from ..functions import caller_name
 from ..smonitor.catalog import CATALOG, META
+from ... import _ensure_smonitor_configured
+
+# Every module that can raise or signal imports this one, which makes it the
+# first use of smonitor whichever way into the package a caller took.
+_ensure_smonitor_configured()
 
 
 class PyUnitWizardCatalogException(CatalogException):
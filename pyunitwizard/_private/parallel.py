@@ -0,0 +1,118 @@
+"""Multi-threaded scaling of large ndarray values.
+
+A unit change that is a pure scaling is one ``np.multiply`` over the value,
+and numpy releases the GIL for the duration of a ufunc loop. Splitting the
+array into contiguous slabs and multiplying them from a pool of threads
+therefore runs them on as many cores, with no copies and no pickling: every
+thread writes its own slice of the same output array.
+
+Threads are only worth it past a few megabytes per worker; below that the
+hand-off costs more than the multiply, and the array is scaled in the calling
+thread as before.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+
+from pyunitwizard import kernel
+
+#: Smallest slab handed to a worker thread.
+MIN_BYTES_PER_WORKER = 4 * 2**20
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Return the number of threads a call should use.
+
+    ``None`` defers to the configured default; ``-1`` means one per CPU.
+    """
+
+    if workers is None:
+        workers = kernel.conversion_workers
+    if workers == -1:
+        return os.cpu_count() or 1
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"workers must be a positive integer or -1, not {workers!r}.")
+    return workers
+
+
+def _pool(workers: int) -> ThreadPoolExecutor:
+    global _executor, _executor_workers
+
+    with _executor_lock:
+        if _executor is None or _executor_workers < workers:
+            # The smaller pool is dropped, never shut down: other threads may
+            # still be submitting to it. Its idle threads exit once the last
+            # call holding it lets go.
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pyunitwizard")
+            _executor_workers = workers
+
+        return _executor
+
+
+def _slabs(value: np.ndarray, out: np.ndarray, workers: int) -> List[tuple]:
+    # Contiguous arrays are split on their flat view, so that even a single
+    # huge row is shared out; anything else along its leading axis.
+    if value.flags.c_contiguous and out.flags.c_contiguous:
+        value, out = value.reshape(-1), out.reshape(-1)
+
+    bounds = np.linspace(0, len(value), workers + 1).astype(int)
+    return [
+        (value[start:stop], out[start:stop])
+        for start, stop in zip(bounds[:-1], bounds[1:])
+        if stop > start
+    ]
+
+
+def multiply(
+    value: np.ndarray,
+    factor: float,
+    out: Optional[np.ndarray] = None,
+    workers: int = 1,
+) -> np.ndarray:
+    """Return ``value * factor``, written into `out` and spread over threads.
+
+    Parameters
+    ----------
+    value : numpy.ndarray
+        Array to scale.
+    factor : float
+        Scaling factor.
+    out : numpy.ndarray, optional
+        Destination with the shape of `value`; allocated when omitted.
+    workers : int, default 1
+        Threads to spread the work over.
+
+    Returns
+    -------
+    numpy.ndarray
+        The scaled values; `out` itself when given.
+    """
+
+    workers = min(workers, max(1, value.nbytes // MIN_BYTES_PER_WORKER))
+    if workers <= 1 or value.ndim == 0:
+        if out is None:
+            return value * factor
+        return np.multiply(value, factor, out=out, casting="same_kind")
+
+    if out is None:
+        out = np.empty(value.shape, dtype=np.result_type(value, factor))
+
+    pool = _pool(workers)
+    futures = [
+        pool.submit(np.multiply, value_slab, factor, out=out_slab, casting="same_kind")
+        for value_slab, out_slab in _slabs(value, out, workers)
+    ]
+    for future in futures:
+        future.result()
+
+    return out
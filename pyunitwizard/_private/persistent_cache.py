@@ -0,0 +1,247 @@
+"""On-disk copy of the derived data a session accumulates in its caches.
+
+A worker process re-derives the same unit data every time it starts: parsed
+unit strings, conversion factors, the standard unit of each dimensionality.
+This module writes those entries to a file and merges them back into the
+in-memory caches of the next process, so that it starts warm.
+
+Only plain data travels. An entry is written when its key and its value are
+built from strings, numbers, fractions, tuples and dictionaries; entries keyed
+on backend objects -- a pint unit, a type -- stay in memory, because their
+identity is not meaningful in another process. The file is JSON with those
+types tagged, never a pickle: the folder may be shared, and reading a pickle
+written by someone else runs their code.
+
+The file name carries a digest of everything the entries depend on: the
+format, the versions of PyUnitWizard, Python and the installed backends, the
+default form and parser, and the standard units. A change to any of them
+selects another file rather than serving stale entries from this one. Which
+backends are *loaded* is left out: they load lazily, after the restore in
+`set_standard_units` and before the save at exit, so it would send the two to
+different files. Entries that depend on a backend name its form in their key.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from fractions import Fraction
+from typing import Any, Dict, Optional
+
+from pyunitwizard import kernel
+from pyunitwizard._private import caches
+
+FORMAT_VERSION = 2
+
+#: Caches whose entries are worth persisting.
+PERSISTED_CACHES = ("native_unit", "conversion_factor", "standard_units")
+
+_DISTRIBUTIONS = {
+    "pint": "pint",
+    "openmm.unit": "openmm",
+    "unyt": "unyt",
+    "astropy.units": "astropy",
+    "physipy": "physipy",
+    "quantities": "quantities",
+}
+
+_PLAIN_TYPES = (str, int, float, Fraction, bool, type(None))
+
+_save_registered = False
+_installed_backends: Optional[Dict[str, Optional[str]]] = None
+
+
+def _distribution_version(library: str) -> Optional[str]:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(_DISTRIBUTIONS.get(library, library))
+    except PackageNotFoundError:
+        return None
+
+
+def fingerprint() -> Dict[str, Any]:
+    """Return everything the persisted entries depend on."""
+
+    from pyunitwizard import __version__
+
+    global _installed_backends
+    if _installed_backends is None:
+        _installed_backends = {
+            library: _distribution_version(library) for library in sorted(_DISTRIBUTIONS)
+        }
+
+    return {
+        "format": FORMAT_VERSION,
+        "pyunitwizard": __version__,
+        "python": "%d.%d" % sys.version_info[:2],
+        "backends": _installed_backends,
+        "default_form": kernel.default_form,
+        "default_parser": kernel.default_parser,
+        "standards": list(kernel.standards),
+    }
+
+
+def cache_file(folder: str) -> str:
+    """Return the file holding the entries for the current fingerprint."""
+
+    digest = hashlib.sha256(repr(fingerprint()).encode()).hexdigest()[:16]
+    return os.path.join(folder, f"pyunitwizard-{digest}.json")
+
+
+def _is_plain(obj: Any) -> bool:
+    if isinstance(obj, _PLAIN_TYPES):
+        return True
+    if isinstance(obj, tuple):
+        return all(_is_plain(item) for item in obj)
+    if isinstance(obj, dict):
+        return all(_is_plain(key) and _is_plain(value) for key, value in obj.items())
+    return False
+
+
+def _encode(obj: Any) -> Any:
+    if isinstance(obj, tuple):
+        return {"tuple": [_encode(item) for item in obj]}
+    if isinstance(obj, Fraction):
+        return {"fraction": [obj.numerator, obj.denominator]}
+    if isinstance(obj, dict):
+        return {"dict": [[_encode(key), _encode(value)] for key, value in obj.items()]}
+    return obj
+
+
+def _decode(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        (tag, items), = obj.items()
+        if tag == "tuple":
+            return tuple(_decode(item) for item in items)
+        if tag == "fraction":
+            return Fraction(*items)
+        if tag == "dict":
+            return {_decode(key): _decode(value) for key, value in items}
+        raise ValueError(tag)
+    if isinstance(obj, list):
+        raise ValueError("list")
+    return obj
+
+
+def _cache_of(name: str) -> Optional[caches.BoundedCache]:
+    # The standard units belong to the active state, like the standards in
+    # the fingerprint: a context or a Policy has its own cache, and the
+    # registry holds only the global one.
+    if name == "standard_units":
+        return kernel.standard_units_by_dimensionality_cache
+    return caches.registry.get(name)
+
+
+def _stored_fingerprint() -> Any:
+    # Through JSON and back, so that it compares equal to the copy in a file.
+    return json.loads(json.dumps(fingerprint()))
+
+
+def _read(path: str) -> Dict[str, Dict[Any, Any]]:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if payload.get("fingerprint") != _stored_fingerprint():
+            return {}
+        return {
+            name: {_decode(key): _decode(value) for key, value in rows}
+            for name, rows in payload["entries"].items()
+        }
+    except (OSError, ValueError, TypeError, KeyError, AttributeError, ZeroDivisionError):
+        # Missing, truncated, tampered with or written by something else:
+        # start cold.
+        return {}
+
+
+def load(folder: str) -> int:
+    """Merge the persisted entries into the in-memory caches.
+
+    Returns
+    -------
+    int
+        Number of entries restored.
+    """
+
+    restored = 0
+
+    for name, entries in _read(cache_file(folder)).items():
+        cache = _cache_of(name)
+        if cache is None or name not in PERSISTED_CACHES:
+            continue
+        for key, value in entries.items():
+            if key not in cache:
+                cache[key] = value
+                restored += 1
+
+    return restored
+
+
+def save(folder: str) -> str:
+    """Write the plain-data entries of the persisted caches, atomically.
+
+    Entries already on disk for the same fingerprint are kept, so workers that
+    derived different units add up rather than overwrite each other.
+
+    Returns
+    -------
+    str
+        Path of the file written.
+    """
+
+    path = cache_file(folder)
+    entries = _read(path)
+
+    for name in PERSISTED_CACHES:
+        cache = _cache_of(name)
+        if cache is None:
+            continue
+        merged = entries.setdefault(name, {})
+        for key, value in list(cache.items()):
+            if _is_plain(key) and _is_plain(value):
+                merged[key] = value
+
+    os.makedirs(folder, exist_ok=True)
+    handle, temporary_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        payload = {
+            "fingerprint": fingerprint(),
+            "entries": {
+                name: [[_encode(key), _encode(value)] for key, value in rows.items()]
+                for name, rows in entries.items()
+            },
+        }
+        with os.fdopen(handle, "w", encoding="utf-8") as stream:
+            json.dump(payload, stream)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+    return path
+
+
+def _save_at_exit() -> None:
+    from pyunitwizard._private.backend_settings import resolve_unit_cache_folder
+
+    folder = resolve_unit_cache_folder()
+    if folder is not None:
+        try:
+            save(folder)
+        except OSError:
+            pass
+
+
+def register_save_at_exit() -> None:
+    """Arrange for the caches to be written when the interpreter exits."""
+
+    global _save_registered
+
+    if not _save_registered:
+        atexit.register(_save_at_exit)
+        _save_registered = True
@@ -0,0 +1,448 @@
+"""Backend-free unit algebra for magnitude and dimensionality questions.
+
+Every unit is a scale relative to SI plus a vector of exponents over
+``kernel.order_fundamental_units``. The table below only holds units whose SI
+definition is exact, so the engine can never disagree with a backend on a
+measured constant: a dalton or a Hartree is not "unknown" here by accident, it
+is deliberately left to the backend that owns its CODATA revision. Offset
+units (``degC``, ``degF``) are absent for the same reason: they are not a
+scale.
+
+Anything the engine does not understand -- an unknown name, an ambiguous
+expression, a numeric literal other than ``1`` -- makes it answer ``None``, and
+callers fall back to the backends. It is an accelerator, never an authority.
+"""
+
+from __future__ import annotations
+
+import re
+from fractions import Fraction
+from typing import Dict, Optional, Tuple, Union
+
+from pyunitwizard import kernel
+from pyunitwizard._private.caches import memoize
+
+Scale = Union[Fraction, float]
+Dimensions = Tuple[Fraction, ...]
+NativeUnit = Tuple[Scale, Dimensions]
+
+def _dims(L=0, M=0, T=0, K=0, mol=0, A=0, Cd=0) -> Dimensions:
+    return tuple(Fraction(exponent) for exponent in (L, M, T, K, mol, A, Cd))
+
+
+_DIMENSIONLESS = _dims()
+
+# name -> (scale relative to SI, dimensions, accepts SI prefixes)
+_DEFINITIONS: Dict[str, Tuple[Fraction, Dimensions, bool]] = {
+    "dimensionless": (Fraction(1), _DIMENSIONLESS, False),
+    # SI base units.
+    "meter": (Fraction(1), _dims(L=1), True),
+    "gram": (Fraction(1, 1000), _dims(M=1), True),
+    "second": (Fraction(1), _dims(T=1), True),
+    "kelvin": (Fraction(1), _dims(K=1), True),
+    "mole": (Fraction(1), _dims(mol=1), True),
+    "ampere": (Fraction(1), _dims(A=1), True),
+    "candela": (Fraction(1), _dims(Cd=1), True),
+    # Derived units with exact SI definitions.
+    "angstrom": (Fraction(1, 10**10), _dims(L=1), False),
+    "liter": (Fraction(1, 1000), _dims(L=3), True),
+    "minute": (Fraction(60), _dims(T=1), False),
+    "hour": (Fraction(3600), _dims(T=1), False),
+    "day": (Fraction(86400), _dims(T=1), False),
+    "hertz": (Fraction(1), _dims(T=-1), True),
+    "newton": (Fraction(1), _dims(L=1, M=1, T=-2), True),
+    "joule": (Fraction(1), _dims(L=2, M=1, T=-2), True),
+    "watt": (Fraction(1), _dims(L=2, M=1, T=-3), True),
+    "pascal": (Fraction(1), _dims(L=-1, M=1, T=-2), True),
+    "bar": (Fraction(10**5), _dims(L=-1, M=1, T=-2), True),
+    "atmosphere": (Fraction(101325), _dims(L=-1, M=1, T=-2), False),
+    "calorie": (Fraction("4.184"), _dims(L=2, M=1, T=-2), True),
+    "electron_volt": (Fraction("1.602176634e-19"), _dims(L=2, M=1, T=-2), True),
+    "coulomb": (Fraction(1), _dims(T=1, A=1), True),
+    "volt": (Fraction(1), _dims(L=2, M=1, T=-3, A=-1), True),
+}
+
+_ALIASES = {
+    "metre": "meter",
+    "litre": "liter",
+    "electronvolt": "electron_volt",
+}
+
+_SYMBOLS = {
+    "m": "meter",
+    "g": "gram",
+    "s": "second",
+    "K": "kelvin",
+    "mol": "mole",
+    "A": "ampere",
+    "cd": "candela",
+    "Å": "angstrom",
+    "L": "liter",
+    "l": "liter",
+    "min": "minute",
+    "h": "hour",
+    "hr": "hour",
+    "d": "day",
+    "Hz": "hertz",
+    "N": "newton",
+    "J": "joule",
+    "W": "watt",
+    "Pa": "pascal",
+    "atm": "atmosphere",
+    "cal": "calorie",
+    "eV": "electron_volt",
+    "C": "coulomb",
+    "V": "volt",
+}
+
+_PREFIXES = {
+    "yotta": Fraction(10**24),
+    "zetta": Fraction(10**21),
+    "exa": Fraction(10**18),
+    "peta": Fraction(10**15),
+    "tera": Fraction(10**12),
+    "giga": Fraction(10**9),
+    "mega": Fraction(10**6),
+    "kilo": Fraction(10**3),
+    "hecto": Fraction(10**2),
+    "deca": Fraction(10),
+    "deka": Fraction(10),
+    "deci": Fraction(1, 10),
+    "centi": Fraction(1, 10**2),
+    "milli": Fraction(1, 10**3),
+    "micro": Fraction(1, 10**6),
+    "nano": Fraction(1, 10**9),
+    "pico": Fraction(1, 10**12),
+    "femto": Fraction(1, 10**15),
+    "atto": Fraction(1, 10**18),
+    "zepto": Fraction(1, 10**21),
+    "yocto": Fraction(1, 10**24),
+}
+
+_SYMBOL_PREFIXES = {
+    "Y": _PREFIXES["yotta"],
+    "Z": _PREFIXES["zetta"],
+    "E": _PREFIXES["exa"],
+    "P": _PREFIXES["peta"],
+    "T": _PREFIXES["tera"],
+    "G": _PREFIXES["giga"],
+    "M": _PREFIXES["mega"],
+    "k": _PREFIXES["kilo"],
+    "h": _PREFIXES["hecto"],
+    "da": _PREFIXES["deca"],
+    "d": _PREFIXES["deci"],
+    "c": _PREFIXES["centi"],
+    "m": _PREFIXES["milli"],
+    "u": _PREFIXES["micro"],
+    "µ": _PREFIXES["micro"],
+    "μ": _PREFIXES["micro"],
+    "n": _PREFIXES["nano"],
+    "p": _PREFIXES["pico"],
+    "f": _PREFIXES["femto"],
+    "a": _PREFIXES["atto"],
+    "z": _PREFIXES["zepto"],
+    "y": _PREFIXES["yocto"],
+}
+
+
+def _lookup_full_name(name: str) -> Optional[NativeUnit]:
+    name = _ALIASES.get(name, name)
+    definition = _DEFINITIONS.get(name)
+    if definition is not None:
+        return definition[0], definition[1]
+
+    for prefix, factor in _PREFIXES.items():
+        if name.startswith(prefix):
+            base = _ALIASES.get(name[len(prefix) :], name[len(prefix) :])
+            definition = _DEFINITIONS.get(base)
+            if definition is not None and definition[2]:
+                return factor * definition[0], definition[1]
+
+    return None
+
+
+def _lookup_symbol(name: str) -> Optional[NativeUnit]:
+    base = _SYMBOLS.get(name)
+    if base is not None:
+        definition = _DEFINITIONS[base]
+        return definition[0], definition[1]
+
+    for prefix, factor in _SYMBOL_PREFIXES.items():
+        if name.startswith(prefix) and len(name) > len(prefix):
+            base = _SYMBOLS.get(name[len(prefix) :])
+            if base is not None and _DEFINITIONS[base][2]:
+                definition = _DEFINITIONS[base]
+                return factor * definition[0], definition[1]
+
+    return None
+
+
+def _lookup(name: str) -> Optional[NativeUnit]:
+    """Resolve a single unit name: exact names first, then prefixes, then plurals."""
+
+    found = _lookup_full_name(name)
+    if found is None:
+        found = _lookup_symbol(name)
+    if found is None and len(name) > 3 and name.endswith("s"):
+        found = _lookup_full_name(name[:-1])
+    return found
+
+
+_TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_µμÅ]+)"
+    r"|(?P<operator>\*\*|\^|\*|/|\(|\)|-|\+))"
+)
+
+
+def _tokenize(expression: str) -> Optional[list]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN_PATTERN.match(expression, position)
+        if match is None:
+            return None
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser for ``a * b / c ** 2`` style unit expressions.
+
+    Juxtaposition (``"J mol"``) is refused rather than guessed: backends do not
+    agree on its precedence next to ``/``, and a wrong guess would be a silent
+    wrong answer where a fallback is only a slower right one.
+    """
+
+    def __init__(self, tokens: list) -> None:
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def expression(self) -> Optional[NativeUnit]:
+        result = self.term()
+        while result is not None and self.peek()[1] in ("*", "/"):
+            operator = self.take()[1]
+            right = self.term()
+            if right is None:
+                return None
+            if operator == "*":
+                result = _multiply(result, right, 1)
+            else:
+                result = _multiply(result, right, -1)
+        return result
+
+    def term(self) -> Optional[NativeUnit]:
+        base = self.factor()
+        if base is None:
+            return None
+        if self.peek()[1] in ("**", "^"):
+            self.take()
+            exponent = self.exponent()
+            if exponent is None:
+                return None
+            return _power(base, exponent)
+        return base
+
+    def exponent(self) -> Optional[Fraction]:
+        sign = 1
+        if self.peek()[1] in ("-", "+"):
+            sign = -1 if self.take()[1] == "-" else 1
+        kind, value = self.take()
+        if kind == "number":
+            return sign * Fraction(value)
+        if value == "(":
+            exponent = self.exponent()
+            if exponent is None:
+                return None
+            if self.peek()[1] == "/":
+                self.take()
+                denominator = self.exponent()
+                if not denominator:
+                    return None
+                exponent = exponent / denominator
+            if self.take()[1] != ")":
+                return None
+            return sign * exponent
+        return None
+
+    def factor(self) -> Optional[NativeUnit]:
+        kind, value = self.take()
+        if kind == "name":
+            return _lookup(value)
+        if kind == "number" and Fraction(value) == 1:
+            return Fraction(1), _DIMENSIONLESS
+        if value == "(":
+            inner = self.expression()
+            if inner is None or self.take()[1] != ")":
+                return None
+            return inner
+        return None
+
+
+def _multiply(left: NativeUnit, right: NativeUnit, sign: int) -> NativeUnit:
+    scale = left[0] * right[0] if sign > 0 else left[0] / right[0]
+    dims = tuple(a + sign * b for a, b in zip(left[1], right[1]))
+    return scale, dims
+
+
+def _power(unit: NativeUnit, exponent: Fraction) -> NativeUnit:
+    if exponent.denominator == 1:
+        scale = unit[0] ** int(exponent)
+    else:
+        scale = float(unit[0]) ** float(exponent)
+    return scale, tuple(dim * exponent for dim in unit[1])
+
+
+# The table agrees with pint on which names exist and on the type of the
+# value it hands back. Under any other parser or form a string may hold a
+# unit that backend rejects (``eV`` in openmm.unit, ``kcal`` in astropy) or
+# come back as another type (``np.float64``, a 0-d array), so the engine stays
+# silent and the backend answers.
+_NATIVE_FORM = "pint"
+
+
+def answers_strings(parser: Optional[str] = None, form: Optional[str] = None) -> bool:
+    """Return whether a string may be answered natively under `parser` into `form`.
+
+    Both default to the configured ones; only pint for both qualifies. With no
+    form configured, the form a backend call would pick is resolved without
+    loading it, and an unset parser then follows that form.
+    """
+
+    resolved_form = form if form is not None else kernel.default_form
+    if resolved_form is None:
+        from pyunitwizard._private.forms import digest_form
+
+        resolved_form = digest_form(None, load=False)
+    resolved_parser = parser if parser is not None else kernel.default_parser
+    if resolved_parser is None:
+        resolved_parser = resolved_form
+    return resolved_parser == _NATIVE_FORM and resolved_form == _NATIVE_FORM
+
+
+@memoize("native_unit", 1024)
+def parse_unit(expression: str) -> Optional[NativeUnit]:
+    """Return ``(scale, dimensions)`` for a unit expression, or ``None``.
+
+    Parameters
+    ----------
+    expression : str
+        Unit expression such as ``"kJ/mol"`` or ``"nanometer ** 2"``.
+
+    Returns
+    -------
+    tuple or None
+        Scale relative to SI and exponents over
+        ``kernel.order_fundamental_units``, or ``None`` when the expression is
+        outside what the engine can answer exactly.
+    """
+
+    if not isinstance(expression, str) or not expression.strip():
+        return None
+
+    tokens = _tokenize(expression)
+    if not tokens:
+        return None
+
+    parser = _Parser(tokens)
+    result = parser.expression()
+    if result is None or parser.position != len(tokens):
+        return None
+
+    return result
+
+
+_QUANTITY_PATTERN = re.compile(
+    r"^\s*(?P<number>[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*(?P<unit>[A-Za-z_µμÅ(].*)$"
+)
+
+
+def split_quantity(string: str) -> Optional[Tuple[Union[int, float], str]]:
+    """Split ``"1.5 nm"`` into ``(1.5, "nm")``; ``None`` for anything else.
+
+    Integer literals stay integers, as they do when a backend parses them.
+    """
+
+    match = _QUANTITY_PATTERN.match(string)
+    if match is None:
+        return None
+
+    number = match.group("number")
+    try:
+        value = int(number)
+    except ValueError:
+        value = float(number)
+
+    return value, match.group("unit")
+
+
+def dimensionality(string: str) -> Optional[Dict[str, Union[int, float]]]:
+    """Return the dimensionality of a unit or scalar quantity string, or ``None``."""
+
+    unit = parse_unit(string)
+    if unit is None:
+        split = split_quantity(string)
+        if split is None:
+            return None
+        unit = parse_unit(split[1])
+        if unit is None:
+            return None
+
+    return {
+        name: int(exponent) if exponent.denominator == 1 else float(exponent)
+        for name, exponent in zip(kernel.order_fundamental_units, unit[1])
+    }
+
+
+def conversion_factor(from_unit: str, to_unit: str) -> Optional[float]:
+    """Return the factor between two compatible unit expressions, or ``None``.
+
+    ``None`` also covers incompatible units: the backend owns the error message.
+    """
+
+    source = parse_unit(from_unit)
+    target = parse_unit(to_unit)
+    if source is None or target is None or source[1] != target[1]:
+        return None
+
+    return float(source[0] / target[0])
+
+
+def convert_value(string: str, to_unit: str) -> Optional[Union[int, float]]:
+    """Return the magnitude of a scalar quantity string in `to_unit`, or ``None``.
+
+    An integer magnitude is returned as is when the units are the same scale,
+    and left to the backend otherwise: whether it stays an integer depends on
+    how the backend defines the units (pint gives ``7200`` for ``2 h`` in
+    seconds but ``2000.0`` for ``2 km`` in meters).
+    """
+
+    split = split_quantity(string)
+    if split is None:
+        return None
+
+    value, unit = split
+    source = parse_unit(unit)
+    target = parse_unit(to_unit)
+    if source is None or target is None or source[1] != target[1]:
+        return None
+
+    if source[0] == target[0]:
+        return value
+    if not isinstance(value, float):
+        return None
+
+    return value * float(source[0] / target[0])
@@ -0,0 +1,110 @@
+"""Canonical spelling of unit strings, for use as cache keys.
+
+``"nm"``, ``"nanometers"``, ``"nanometre"`` and ``" nm "`` name one unit, but
+as dictionary keys they are four: each spelling would pay for its own parse
+and hold its own cache entry. :func:`unit_key` maps them all to one string
+before a cache is consulted.
+
+Two rewrites are applied, neither of which can change what a parser reads:
+
+- Layout: runs of whitespace collapse to one space, spaces around ``*``,
+  ``/`` and ``**`` and inside parentheses are dropped, ``^`` becomes ``**``
+  and a leading ``1`` factor goes.
+- Names: every unit name is replaced by the canonical name the parser's own
+  registry reports for it -- pint's ``get_name``, astropy's unit registry --
+  so that aliases, symbols, prefixes and plurals are resolved by the backend
+  that will parse the string, never by a table of ours. A name the registry
+  does not know is kept as written, and the parse then fails as it would
+  have.
+
+The key is only ever used to look a result up; on a miss the function is
+called with the string as given.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Optional
+
+from pyunitwizard import kernel
+from pyunitwizard._private.caches import BoundedCache, memoize
+
+_SPACES = re.compile(r"\s+")
+_OPERATOR = re.compile(r" ?(\*\*|\^|\*|/) ?")
+_OPENING = re.compile(r"\( ")
+_CLOSING = re.compile(r" \)")
+_LEADING_ONE = re.compile(r"^1(?: |\*(?!\*))(?=[^\d\s*/.])")
+
+# A name never directly follows a digit or a dot, so the ``e`` of ``1e3`` is
+# left alone.
+_NAME = re.compile(r"(?<![\w.])[^\W\d]\w*")
+
+
+@memoize("unit_name", 1024)
+def canonical_name(name: str, parser: Optional[str]) -> str:
+    """Return the name `parser`'s registry gives the unit called `name`.
+
+    `name` itself when the parser has no registry or does not know it.
+    """
+
+    try:
+        if parser == "pint":
+            from pyunitwizard.forms.api_pint import ureg
+
+            # Empty for ``dimensionless``.
+            return ureg.get_name(name) or name
+
+        if parser == "astropy.units":
+            from astropy.units import get_current_unit_registry
+
+            unit = get_current_unit_registry().registry.get(name)
+            if unit is not None:
+                return unit.name
+    except Exception:
+        pass
+
+    return name
+
+
+def _spell(unit_string: str, parser: Optional[str]) -> str:
+    key = _SPACES.sub(" ", unit_string).strip()
+    key = _OPERATOR.sub(lambda match: "**" if match.group(1) == "^" else match.group(1), key)
+    key = _OPENING.sub("(", key)
+    key = _CLOSING.sub(")", key)
+    key = _LEADING_ONE.sub("", key)
+    return _NAME.sub(lambda match: canonical_name(match.group(), parser), key)
+
+
+# Read by plain indexing rather than `get`: this lookup sits in front of every
+# other one, so it skips the hit counting.
+_keys = BoundedCache("unit_key", 4096, policy="fifo")
+
+
+def unit_key(unit_string: Any, parser: Optional[str] = None) -> Any:
+    """Return the canonical spelling of `unit_string` under `parser`.
+
+    Parameters
+    ----------
+    unit_string : str
+        Unit expression such as ``"nanometers / ps^2"``. Anything that is not
+        a string is returned unchanged.
+    parser : str, optional
+        Parser whose registry resolves the names; the default parser if
+        omitted.
+
+    Returns
+    -------
+    str
+        The canonical spelling, e.g. ``"nanometer/picosecond**2"`` under pint.
+    """
+
+    if not isinstance(unit_string, str):
+        return unit_string
+    if parser is None:
+        parser = kernel.default_parser
+
+    try:
+        return _keys[unit_string, parser]
+    except KeyError:
+        key = _keys[unit_string, parser] = _spell(unit_string, parser)
+        return key
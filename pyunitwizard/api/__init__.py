@@ -8,7 +8,17 @@ from .introspection import (
     is_quantity,
     is_unit,
 )
-from .conversion import convert, conversion_factor, to_string
+from .conversion import (
+    compile_conversion,
+    conversion_affine,
+    conversion_factor,
+    convert,
+    convert_magnitude,
+    convert_many,
+    convert_stream,
+    parse_many,
+    to_string,
+)
 from .construction import quantity, unit
 from .extraction import change_value, get_unit, get_value, get_value_and_unit
 from .comparison import (
@@ -18,7 +28,7 @@ from .comparison import (
     compatibility,
     similarity,
 )
-from .standardization import get_standard_units, standardize
+from .standardization import get_standard_units, standardize, standardize_many
 from .specialized import fast_track, register_fast_track
 from .validation import check, ensure_quantity
 from .context import context
@@ -30,8 +40,13 @@ __all__ = [
     "change_value",
     "check",
     "compatibility",
+    "compile_conversion",
+    "conversion_affine",
     "conversion_factor",
     "convert",
+    "convert_magnitude",
+    "convert_many",
+    "convert_stream",
     "ensure_quantity",
     "get_dimensionality",
     "get_form",
@@ -43,11 +58,13 @@ __all__ = [
     "is_dimensionless",
     "is_quantity",
     "is_unit",
+    "parse_many",
     "quantity",
     "fast_track",
     "register_fast_track",
     "similarity",
     "standardize",
+    "standardize_many",
     "to_string",
     "unit",
     "context",
@@ -4,21 +4,22 @@ from __future__ import annotations
 
 import copy
 from contextlib import contextmanager
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import numpy as np
 from smonitor import signal
 
 from .. import kernel
 from ..configure import configure
+from ..configure.policy import Policy
 
 
 def _snapshot(value):
-    """Copy a kernel value deeply enough that restoring it actually restores it.
+    """Copy a kernel value deeply enough that changing it stays in the context.
 
     `copy.copy` is not sufficient for the standard maps: their values are
-    dictionaries and lists shared with the live state, so mutating one in place
-    inside a context survived the context. Only one level of nesting exists, so
+    dictionaries and lists shared with the outer state, so mutating one in place
+    inside a context would survive the context. Only one level of nesting exists, so
     that is the level copied — `copy.deepcopy` would also try to duplicate unit
     objects and registries, which are immutable and must stay shared.
     """
@@ -46,26 +47,48 @@ def _snapshot(value):
 @signal(tags=["context"])
 @contextmanager
 def context(
-    default_form: Optional[str] = None,
+    default_form: Optional[Union[str, Policy]] = None,
     default_parser: Optional[str] = None,
     standard_units: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    policy: Optional[Policy] = None,
 ):
     """
     Context manager to temporarily change PyUnitWizard configuration.
 
     Parameters
     ----------
-    default_form : str, optional
-        Temporary default form.
+    default_form : str or Policy, optional
+        Temporary default form. A :class:`~pyunitwizard.configure.Policy`
+        passed here, as in ``context(policy)``, is taken as `policy`.
     default_parser : str, optional
         Temporary default parser.
     standard_units : list of str, optional
         Temporary standard units.
+    workers : int, optional
+        Temporary number of threads large ndarray conversions are spread
+        over; see :func:`pyunitwizard.configure.set_conversion_workers`.
+    policy : Policy, optional
+        Precompiled configuration to activate. Selecting it costs
+        microseconds, where `standard_units` rebuilds the standards on every
+        entry. Other arguments given alongside apply on top of it.
+
+    Notes
+    -----
+    The configuration set inside the block belongs to the thread or asyncio
+    task that entered it, and to the tasks it creates: two threads in two
+    contexts never see each other's settings, and code outside any context
+    keeps seeing the global configuration. Fast-track registrations are the
+    exception: they are undone on exit but are visible process-wide meanwhile.
 
     Examples
     --------
     >>> with puw.context(default_form='pint', standard_units=['nm', 'ps']):
     >>>     q = puw.standardize(input_q)
+
+    >>> md = puw.configure.Policy(standard_units=['nm', 'ps'], name='md')
+    >>> with puw.context(md):
+    >>>     q = puw.standardize(input_q)
     """
     # Backend loading is deliberately absent. Loading a backend is a capability,
     # not a policy: Python cannot truly unload a module, and reverting
@@ -73,28 +96,22 @@ def context(
     # left the kernel claiming a backend was unloaded when it was not. A backend
     # loaded inside a context stays loaded, which is both honest and harmless.
     #
-    # The introspection caches are absent for the same kind of reason: a unit's
-    # dimensionality and a type's form are facts, not configuration. `reset()`
-    # clears them because it tears everything down for tests; a context has no
-    # cause to discard them.
-    state_names = (
-        "default_form",
-        "default_parser",
-        "standards",
-        "dimensional_fundamental_standards",
-        "dimensional_combinations_standards",
-        "adimensional_standards",
-        "tentative_base_standards",
-        "dimensional_fundamental_standards_matrix",
-        "dimensional_fundamental_standards_units",
-        "tentative_base_standards_matrix",
-        "tentative_base_standards_units",
-        "standard_units_by_dimensionality_cache",
-        "conversion_factor_cache",
-        "canonical_standards",
-        "policy_provenance",
-    )
-    old_state = {name: _snapshot(getattr(kernel, name)) for name in state_names}
+    # The introspection caches and the conversion factor cache are absent for
+    # the same kind of reason: a unit's dimensionality, a type's form and a
+    # factor keyed on its form and parser are facts, not configuration.
+    #
+    # Everything else is a private copy of the current state, selected through
+    # a context variable for as long as the block runs. Nothing is written back
+    # on exit -- the copy is simply dropped -- so concurrent contexts cannot
+    # restore over one another.
+    if isinstance(default_form, Policy):
+        policy, default_form = default_form, None
+
+    if policy is not None:
+        state = policy._activation_state()
+    else:
+        state = kernel.current_state().fork(_snapshot)
+    token = kernel.activate(state)
 
     # Fast tracks live on a module-level object rather than in the kernel, so
     # they need their own snapshot; without it a registration made inside a
@@ -110,12 +127,13 @@ def context(
             configure.set_default_parser(default_parser)
         if standard_units is not None:
             configure.set_standard_units(standard_units)
+        if workers is not None:
+            configure.set_conversion_workers(workers)
 
         yield
 
     finally:
-        for name, value in old_state.items():
-            setattr(kernel, name, value)
+        kernel.deactivate(token)
 
         for name in set(vars(fast_track)) - set(old_fast_tracks):
             delattr(fast_track, name)
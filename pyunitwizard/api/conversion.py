@@ -4,29 +4,38 @@ from __future__ import annotations
 
 import inspect
 import logging
-from functools import lru_cache
-from typing import Any, Optional, Union
+from operator import itemgetter
+from typing import Any, Iterable, List, Optional, Union
 
 import numpy as np
 from smonitor import signal
 
 from .. import kernel
+from .._private import parallel, unit_engine
+from .._private.caches import memoize
+from .._private.unit_keys import unit_key
 from .._private.exceptions import ArgumentError as BadCallError
-from .._private.forms import digest_to_form
+from .._private.forms import digest_form, digest_to_form
 from .._private.parsers import digest_parser
-from .._private.quantity_or_unit import QuantityOrUnit
+from .._private.quantity_or_unit import ArrayLike, QuantityOrUnit
 from ..forms import (
-    dict_convert,
+    dict_form_adapter,
     dict_get_unit,
     dict_get_value,
     dict_is_unit,
-    dict_translate_quantity,
-    dict_translate_unit,
+    dict_make_quantity,
 )
 from ..parse import parse as _parse
-from .introspection import get_form, has_unit
+from .introspection import (
+    _cache_key_for_unit,
+    _form_adapter,
+    get_form,
+    has_unit,
+    unit_matches_target,
+)
 
 _LOGGER = logging.getLogger(__name__)
+_NOT_CACHED = object()
 _REDUNDANT_CONVERSION_FALLBACK_EMITTED = False
 
 
@@ -90,6 +99,7 @@ def convert(
     to_form: Optional[str] = None,
     parser: Optional[str] = None,
     to_type: Optional[str] = "quantity",
+    workers: Optional[int] = None,
 ) -> Union[QuantityOrUnit, float, np.ndarray]:
     """Convert a quantity or unit across unit systems, forms, and output types.
 
@@ -107,6 +117,10 @@ def convert(
         Parser used when `quantity_or_unit` or `to_unit` is provided as a string.
     to_type : {"quantity", "unit", "value"}, optional, default="quantity"
         Output type to return.
+    workers : int, optional
+        Threads a large ndarray value is scaled over when the unit change is a
+        pure scaling within one form, ``-1`` for one per CPU. Defaults to
+        :func:`pyunitwizard.configure.get_conversion_workers`.
 
     Returns
     -------
@@ -127,7 +141,20 @@ def convert(
 
     output = None
 
-    form_in = get_form(quantity_or_unit)
+    adapter_in = _form_adapter(quantity_or_unit)
+    form_in = adapter_in.form
+
+    # A magnitude asked of a scalar string needs no backend object at all when
+    # both units are in the native table and pint is both parser and target.
+    if (
+        form_in == "string"
+        and to_type == "value"
+        and isinstance(to_unit, str)
+        and unit_engine.answers_strings(parser, to_form)
+    ):
+        native_value = unit_engine.convert_value(quantity_or_unit, to_unit)
+        if native_value is not None:
+            return native_value
 
     # --- High Performance Fast Path ---
     if (
@@ -178,6 +205,33 @@ def convert(
             )
             return quantity_or_unit
     # ----------------------------------
+
+    # A large ndarray changing unit within its form is scaled from a thread
+    # pool, when more than one worker is configured or asked for.
+    if (
+        isinstance(to_unit, str)
+        and form_in != "string"
+        and form_in == to_form
+        and to_type in ("value", "quantity")
+    ):
+        workers = parallel.resolve_workers(workers)
+        if workers > 1 and not adapter_in.is_unit(quantity_or_unit):
+            value = adapter_in.get_value(quantity_or_unit)
+            if (
+                isinstance(value, np.ndarray)
+                and value.nbytes >= 2 * parallel.MIN_BYTES_PER_WORKER
+            ):
+                factor = _stored_value_factor(
+                    form_in, adapter_in.get_unit(quantity_or_unit), to_unit, parser
+                )
+                if factor is not None:
+                    value = parallel.multiply(value, factor, workers=workers)
+                    if to_type == "value":
+                        return value
+                    return adapter_in.make_quantity(
+                        value, _parse_unit_string(to_unit, parser=parser, to_form=to_form)
+                    )
+
     if to_type not in ["unit", "value", "quantity"]:
         raise BadCallError("to_type")
 
@@ -188,69 +242,106 @@ def convert(
 
     if form_in == "string":
         if to_form == "string":
+            adapter = dict_form_adapter[parser]
             output = _parse(quantity_or_unit, parser=parser, to_form=parser)
 
             if to_unit is not None:
-                output = dict_convert[parser](output, to_unit)
+                output = adapter.convert(output, to_unit)
             if to_type == "unit":
-                if not dict_is_unit[parser](output):
-                    output = dict_get_unit[parser](output)
-                output = dict_translate_quantity[parser]["string"](output)
+                if not adapter.is_unit(output):
+                    output = adapter.get_unit(output)
+                output = adapter.translate_quantity["string"](output)
             elif to_type == "value":
-                output = dict_get_value[parser](output)
+                output = adapter.get_value(output)
                 output = str(output)
             else:
-                output = dict_translate_quantity[parser]["string"](output)
+                output = adapter.translate_quantity["string"](output)
         else:
+            adapter = dict_form_adapter[to_form]
             output = _parse(quantity_or_unit, parser=parser, to_form=to_form)
 
             if to_unit is not None:
-                output = dict_convert[to_form](output, to_unit)
+                output = adapter.convert(output, to_unit)
             if to_type == "unit":
-                if not dict_is_unit[to_form](output):
-                    output = dict_get_unit[to_form](output)
+                if not adapter.is_unit(output):
+                    output = adapter.get_unit(output)
             elif to_type == "value":
-                output = dict_get_value[to_form](output)
+                output = adapter.get_value(output)
     else:
         if to_form == "string":
             output = quantity_or_unit
 
             if to_unit is not None:
-                output = dict_convert[form_in](output, to_unit)
+                output = adapter_in.convert(output, to_unit)
 
             if to_type == "unit":
-                if not dict_is_unit[form_in](output):
-                    output = dict_get_unit[form_in](output)
-                output = dict_translate_unit[form_in]["string"](output)
+                if not adapter_in.is_unit(output):
+                    output = adapter_in.get_unit(output)
+                output = adapter_in.translate_unit["string"](output)
             elif to_type == "value":
-                output = dict_get_value[form_in](output)
+                output = adapter_in.get_value(output)
                 output = str(output)
             else:
-                output = dict_translate_quantity[form_in]["string"](output)
+                output = adapter_in.translate_quantity["string"](output)
         else:
             if form_in == to_form:
+                adapter_out = adapter_in
                 output = quantity_or_unit
             else:
-                if dict_is_unit[form_in](quantity_or_unit):
-                    output = dict_translate_unit[form_in][to_form](quantity_or_unit)
+                adapter_out = dict_form_adapter[to_form]
+                if adapter_in.is_unit(quantity_or_unit):
+                    output = adapter_in.translate_unit[to_form](quantity_or_unit)
                 else:
-                    output = dict_translate_quantity[form_in][to_form](quantity_or_unit)
+                    output = adapter_in.translate_quantity[to_form](quantity_or_unit)
 
             if to_unit is not None:
                 unit_form = target_unit_form or get_form(to_unit)
                 if unit_form != to_form:
-                    to_unit = dict_translate_unit[unit_form][to_form](to_unit)
-                output = dict_convert[to_form](output, to_unit)
+                    to_unit = dict_form_adapter[unit_form].translate_unit[to_form](to_unit)
+                output = adapter_out.convert(output, to_unit)
 
             if to_type == "unit":
-                if not dict_is_unit[to_form](output):
-                    output = dict_get_unit[to_form](output)
+                if not adapter_out.is_unit(output):
+                    output = adapter_out.get_unit(output)
             elif to_type == "value":
-                output = dict_get_value[to_form](output)
+                output = adapter_out.get_value(output)
 
     return output
 
 
+# Span of the second probe used to measure the scale of an affine pair. The
+# offset is subtracted from the converted probe, so a unit-sized probe would
+# leave the scale with the rounding error of the offset (274.15 - 273.15 is
+# not 1.0 in binary); a wide span divides that error away.
+_AFFINE_PROBE_SPAN = 1.0e6
+
+
+def _affine_coefficients(
+    from_unit: str, to_unit: str, parser: Optional[str]
+) -> tuple[float, float]:
+    """Measure ``(scale, offset)`` of a unit pair with two scalar conversions."""
+
+    from .construction import quantity
+
+    def converted(value: float) -> float:
+        return float(
+            convert(
+                quantity(value, from_unit, parser=parser),
+                to_unit=to_unit,
+                parser=parser,
+                to_type="value",
+            )
+        )
+
+    offset = converted(0.0)
+
+    if np.isclose(offset, 0.0):
+        return converted(1.0) - offset, offset
+
+    scale = (converted(_AFFINE_PROBE_SPAN) - offset) / _AFFINE_PROBE_SPAN
+    return scale, offset
+
+
 @signal(tags=["conversion"], exception_level="DEBUG")
 def conversion_factor(
     from_unit: str,
@@ -267,7 +358,8 @@ def conversion_factor(
 
     Only offset-free (purely multiplicative) unit pairs are supported. Affine pairs,
     such as ``degC`` -> ``kelvin``, carry an additive offset that no single factor can
-    express; those raise :class:`BadCallError` and must go through :func:`convert`.
+    express; those raise :class:`BadCallError` and go through
+    :func:`conversion_affine` instead.
 
     Parameters
     ----------
@@ -297,38 +389,793 @@ def conversion_factor(
 
     resolved_parser = digest_parser(parser)
     cache = kernel.conversion_factor_cache
-    key = (from_unit, to_unit, resolved_parser, kernel.default_form)
+    key = (
+        unit_key(from_unit, resolved_parser),
+        unit_key(to_unit, resolved_parser),
+        resolved_parser,
+        kernel.default_form,
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    scale, offset = conversion_affine(from_unit, to_unit, parser=resolved_parser)
+    if not np.isclose(offset, 0.0):
+        raise BadCallError(
+            f"conversion_factor requires offset-free units; '{from_unit}' -> "
+            f"'{to_unit}' is affine. Use conversion_affine() for offset-bearing units."
+        )
+
+    cache[key] = scale
+    return scale
+
+
+@signal(tags=["conversion"], exception_level="DEBUG")
+def conversion_affine(
+    from_unit: str,
+    to_unit: str,
+    parser: Optional[str] = None,
+) -> tuple[float, float]:
+    """Return the scale and offset converting magnitudes between two units.
+
+    The returned pair ``(s, o)`` satisfies
+    ``value_in_to_unit = s * value_in_from_unit + o``. Unlike
+    :func:`conversion_factor` it also covers offset-bearing pairs such as
+    ``degC`` -> ``kelvin``; for purely multiplicative pairs the offset is zero
+    and the scale is the conversion factor. The pair is cached in
+    ``kernel.conversion_factor_cache`` per
+    ``(from_unit, to_unit, parser, default_form)``, with both units in their
+    canonical spelling.
+
+    Parameters
+    ----------
+    from_unit : str
+        Source unit of the magnitude.
+    to_unit : str
+        Target unit of the magnitude.
+    parser : {"pint", "openmm.unit", "astropy.units"}, optional
+        Parser used to interpret the unit strings.
+
+    Returns
+    -------
+    tuple of float
+        The ``(scale, offset)`` pair.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> puw.conversion_affine('degC', 'kelvin')
+    (1.0, 273.15)
+    """
+
+    resolved_parser = digest_parser(parser)
+    cache = kernel.conversion_factor_cache
+    key = (
+        "affine",
+        unit_key(from_unit, resolved_parser),
+        unit_key(to_unit, resolved_parser),
+        resolved_parser,
+        kernel.default_form,
+    )
     cached = cache.get(key)
     if cached is not None:
         return cached
 
+    # Pairs of units in the native table are answered without a backend.
+    native_factor = None
+    if unit_engine.answers_strings(resolved_parser):
+        native_factor = unit_engine.conversion_factor(from_unit, to_unit)
+
+    if native_factor is not None:
+        coefficients = (native_factor, 0.0)
+    else:
+        coefficients = _affine_coefficients(from_unit, to_unit, resolved_parser)
+
+    cache[key] = coefficients
+    return coefficients
+
+
+@signal(tags=["conversion"], exception_level="DEBUG")
+def convert_magnitude(
+    magnitude: Union[float, ArrayLike],
+    from_unit: str,
+    to_unit: str,
+    parser: Optional[str] = None,
+    out: Optional[np.ndarray] = None,
+) -> Union[float, np.ndarray]:
+    """Convert a bare magnitude between two units, offsets included.
+
+    Applies the cached pair from :func:`conversion_affine` as
+    ``scale * magnitude + offset`` with NumPy, so a whole column converts in
+    two vectorized operations and no quantity is ever built. The offset step
+    is skipped for multiplicative pairs.
+
+    Parameters
+    ----------
+    magnitude : float or ArrayLike
+        Values expressed in `from_unit`.
+    from_unit : str
+        Source unit of the magnitude.
+    to_unit : str
+        Target unit of the magnitude.
+    parser : {"pint", "openmm.unit", "astropy.units"}, optional
+        Parser used to interpret the unit strings.
+    out : numpy.ndarray, optional
+        Array to write the result into. It may be `magnitude` itself to convert
+        in place.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The magnitude expressed in `to_unit`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pyunitwizard as puw
+    >>> puw.convert_magnitude(np.array([0.0, 25.0]), 'degC', 'kelvin')
+    array([273.15, 298.15])
+    """
+
+    scale, offset = conversion_affine(from_unit, to_unit, parser=parser)
+
+    result = np.multiply(magnitude, scale, out=out)
+    if offset != 0.0:
+        if isinstance(result, np.ndarray):
+            np.add(result, offset, out=result)
+        else:
+            result = result + offset
+
+    return result
+
+
+# Leading-axis rows per chunk when `convert_stream` slices an array source and
+# no `chunk_size` is given: about this many bytes of input at a time.
+_STREAM_CHUNK_BYTES = 16 * 2**20
+
+
+def _stream_chunks(source: Any, chunk_size: int):
+    for start in range(0, len(source), chunk_size):
+        yield source[start:start + chunk_size]
+
+
+def _stream_converted(chunks: Iterable[Any], scale: float, offset: float):
+    for chunk in chunks:
+        result = np.multiply(chunk, scale)
+        if offset != 0.0:
+            np.add(result, offset, out=result)
+        yield result
+
+
+@signal(tags=["conversion"], exception_level="DEBUG")
+def convert_stream(
+    source: Union[ArrayLike, Iterable[ArrayLike]],
+    from_unit: str,
+    to_unit: str,
+    chunk_size: Optional[int] = None,
+    parser: Optional[str] = None,
+):
+    """Lazily convert a large array, or a stream of chunks, between two units.
+
+    The ``(scale, offset)`` pair is resolved once through
+    :func:`conversion_affine` -- so offset-bearing units such as ``degC`` work
+    -- and then applied to one chunk at a time as the generator is consumed.
+    Only the chunk being converted is ever held in memory, which lets a
+    pipeline convert a memory map, an HDF5 dataset or a socket reader far
+    bigger than RAM.
+
+    Parameters
+    ----------
+    source : ArrayLike or iterable of ArrayLike
+        Either an array-like that supports ``len()`` and slicing along its
+        first axis (``numpy.ndarray``, ``numpy.memmap``, ``h5py.Dataset``...),
+        which is read in slices of `chunk_size` rows, or any other iterable,
+        whose items are converted as they are produced.
+    from_unit : str
+        Unit of the values in `source`.
+    to_unit : str
+        Unit of the yielded values.
+    chunk_size : int, optional
+        Rows per slice of an array-like source. Defaults to about 16 MiB of
+        input per slice. Ignored for other iterables.
+    parser : {"pint", "openmm.unit", "astropy.units"}, optional
+        Parser used to interpret the unit strings.
+
+    Returns
+    -------
+    generator of numpy.ndarray
+        Converted chunks, in order.
+
+    Raises
+    ------
+    BadCallError
+        If `chunk_size` is not a positive integer.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pyunitwizard as puw
+    >>> chunks = puw.convert_stream(np.arange(6.0), 'nanometer', 'angstrom', chunk_size=4)
+    >>> [chunk.tolist() for chunk in chunks]
+    [[0.0, 10.0, 20.0, 30.0], [40.0, 50.0]]
+    """
+
+    if chunk_size is not None and (
+        isinstance(chunk_size, bool) or not isinstance(chunk_size, (int, np.integer))
+        or chunk_size < 1
+    ):
+        raise BadCallError("chunk_size")
+
+    # Resolved before the generator starts, so bad units fail at the call.
+    scale, offset = conversion_affine(from_unit, to_unit, parser=parser)
+
+    if hasattr(source, "shape") and hasattr(source, "__getitem__") and len(source.shape):
+        if chunk_size is None:
+            row_bytes = int(np.prod(source.shape[1:], dtype=np.int64)) * np.dtype(source.dtype).itemsize
+            chunk_size = max(1, _STREAM_CHUNK_BYTES // max(row_bytes, 1))
+        chunks = _stream_chunks(source, chunk_size)
+    else:
+        chunks = iter(source)
+
+    return _stream_converted(chunks, scale, offset)
+
+
+def _resolve_scaling(
+    form_in: str,
+    source_unit: Any,
+    to_unit: Any,
+    to_form: str,
+    parser: Optional[str],
+) -> Optional[tuple[float, float, Any]]:
+    """Resolve the single factor taking `source_unit` magnitudes to `to_unit`.
+
+    Probes the conversion once through :func:`convert` with unit and zero
+    magnitudes. Returns ``(magnitude_factor, value_factor, target_unit)``: the
+    first scales a bare magnitude expressed in `source_unit`, the second scales
+    the stored value of a `form_in` quantity. They differ only for backends
+    whose stored value is not the value in their own unit (physipy keeps SI
+    magnitudes). Returns ``None`` when no single factor describes the
+    conversion: an additive offset, or an output backend that does not give
+    back the value it was built with.
+    """
+
+    make_quantity_in = dict_make_quantity[form_in]
+    get_value_out = dict_get_value[to_form]
+    make_quantity_out = dict_make_quantity[to_form]
+
+    probe = make_quantity_in(1.0, source_unit)
+    probe_out = convert(probe, to_unit=to_unit, to_form=to_form, parser=parser)
+    zero_out = convert(
+        make_quantity_in(0.0, source_unit),
+        to_unit=to_unit,
+        to_form=to_form,
+        parser=parser,
+    )
+
+    target_unit = dict_get_unit[to_form](probe_out)
+    magnitude_factor = get_value_out(probe_out)
+
+    if not np.isclose(get_value_out(zero_out), 0.0) or not np.isclose(
+        get_value_out(make_quantity_out(magnitude_factor, target_unit)),
+        magnitude_factor,
+    ):
+        return None
+
+    value_factor = magnitude_factor / dict_get_value[form_in](probe)
+
+    return magnitude_factor, value_factor, target_unit
+
+
+def _stored_value_factor(
+    form: str,
+    source_unit: Any,
+    to_unit: Any,
+    parser: Optional[str],
+) -> Optional[float]:
+    """Return the factor taking a `form` quantity's stored value to `to_unit`.
+
+    The answer of :func:`_resolve_scaling` is kept in
+    ``kernel.conversion_factor_cache``, so an extraction pays for the probe
+    once per unit pair; ``None`` (no single factor applies) is cached as well.
+    """
+
+    cache = kernel.conversion_factor_cache
+    key = (
+        "value",
+        form,
+        _cache_key_for_unit(source_unit),
+        _cache_key_for_unit(unit_key(to_unit, parser)),
+        parser,
+        kernel.default_form,
+    )
+
+    factor = cache.get(key, _NOT_CACHED)
+    if factor is not _NOT_CACHED:
+        return factor
+
+    try:
+        scaling = _resolve_scaling(form, source_unit, to_unit, form, parser)
+    except Exception:
+        scaling = None
+
+    factor = None if scaling is None else scaling[1]
+    cache[key] = factor
+    return factor
+
+
+def _convert_many_plan(
+    sample: Any,
+    form_in: str,
+    sample_is_unit: bool,
+    source_unit: Any,
+    to_unit: Any,
+    to_form: Optional[str],
+    parser: Optional[str],
+    to_type: str,
+):
+    """Resolve once how every object sharing `sample`'s form and unit converts.
+
+    Returns a callable applied to each member of the group. Whatever the group
+    cannot do with a single factor -- offset-bearing units, string output,
+    backends whose stored value is not the value in their unit -- is left to
+    :func:`convert` per object, so the result never depends on which path ran.
+    """
+
+    def convert_each(item):
+        return convert(
+            item, to_unit=to_unit, to_form=to_form, parser=parser, to_type=to_type
+        )
+
+    resolved_to_form = digest_to_form(to_form, form_in)
+
+    if sample_is_unit:
+        # Units are immutable, so the converted unit is shared by the group.
+        converted = convert_each(sample)
+        return lambda item: converted
+
+    if to_type == "quantity" and resolved_to_form == form_in:
+        if to_unit is None:
+            return lambda item: item
+        if unit_matches_target(source_unit, form_in, to_unit, parser=parser) is True:
+            return lambda item: item
+
+    if resolved_to_form == "string":
+        return convert_each
+
+    try:
+        scaling = _resolve_scaling(
+            form_in, source_unit, to_unit, resolved_to_form, parser
+        )
+    except Exception:
+        # Left for `convert` to raise, or succeed, item by item.
+        scaling = None
+
+    if scaling is None:
+        return convert_each
+
+    _, factor, target_unit = scaling
+    get_value_in = dict_get_value[form_in]
+    make_quantity_out = dict_make_quantity[resolved_to_form]
+    # A Python float, not a numpy one, so that a float32 value stays float32
+    # as it does through `convert`; and no multiply at all for a change of
+    # form or spelling only, which would turn integers into floats.
+    factor = float(factor)
+    unscaled = factor == 1.0
+
+    def convert_scaled(item):
+        value = get_value_in(item)
+        if isinstance(value, (list, tuple)):
+            return convert_each(item)
+        if not unscaled:
+            value = value * factor
+        if to_type == "value":
+            return value
+        if to_type == "unit":
+            return target_unit
+        return make_quantity_out(value, target_unit)
+
+    return convert_scaled
+
+
+@signal(tags=["conversion"], exception_level="DEBUG")
+def convert_many(
+    items: Iterable[Any],
+    to_unit: Optional[str] = None,
+    to_form: Optional[str] = None,
+    parser: Optional[str] = None,
+    to_type: Optional[str] = "quantity",
+) -> List[Union[QuantityOrUnit, float, np.ndarray]]:
+    """Convert a sequence of quantities or units with the arguments of :func:`convert`.
+
+    Objects are grouped by type and unit. Form, parser, target unit and the
+    multiplicative factor are resolved once per group, and each member is then
+    converted by scaling its magnitude, instead of paying the full dispatch of
+    :func:`convert` once per object. The output is what looping over
+    :func:`convert` gives, value types and dtypes included: a change of form
+    alone leaves integers integers, and a float32 value stays float32. Groups
+    that a single factor cannot express, such as offset-bearing units or
+    string inputs, are converted one by one.
+
+    Parameters
+    ----------
+    items : iterable
+        Quantities or units in any supported form. Forms and units may be mixed.
+    to_unit : str, optional
+        Target unit for every item.
+    to_form : {"unyt", "pint", "openmm.unit", "astropy.units", "string"}, optional
+        Target backend form. If omitted, the form of each item is preserved.
+    parser : {"pint", "openmm.unit", "astropy.units"}, optional
+        Parser used when an item or `to_unit` is provided as a string.
+    to_type : {"quantity", "unit", "value"}, optional, default="quantity"
+        Output type of each element.
+
+    Returns
+    -------
+    list
+        Converted objects, in input order.
+
+    Raises
+    ------
+    BadCallError
+        If `to_type` is not one of ``"quantity"``, ``"unit"``, or ``"value"``.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> items = [puw.quantity(1.0, "nanometer"), puw.quantity(2.0, "nanometer")]
+    >>> puw.convert_many(items, to_unit="angstrom", to_type="value")
+    """
+
+    if to_type not in ["unit", "value", "quantity"]:
+        raise BadCallError("to_type")
+
+    parser = digest_parser(parser)
+
+    forms_by_type = {}
+    plans = {}
+    output = []
+
+    for item in items:
+        item_type = type(item)
+        form_in = forms_by_type.get(item_type)
+        if form_in is None:
+            form_in = get_form(item)
+            forms_by_type[item_type] = form_in
+
+        if form_in == "string":
+            output.append(
+                convert(
+                    item,
+                    to_unit=to_unit,
+                    to_form=to_form,
+                    parser=parser,
+                    to_type=to_type,
+                )
+            )
+            continue
+
+        item_is_unit = dict_is_unit[form_in](item)
+        source_unit = item if item_is_unit else dict_get_unit[form_in](item)
+        key = (item_type, item_is_unit, _cache_key_for_unit(source_unit))
+
+        plan = plans.get(key)
+        if plan is None:
+            plan = _convert_many_plan(
+                item,
+                form_in,
+                item_is_unit,
+                source_unit,
+                to_unit,
+                to_form,
+                parser,
+                to_type,
+            )
+            plans[key] = plan
+
+        output.append(plan(item))
+
+    return output
+
+
+@signal(tags=["conversion"], exception_level="DEBUG")
+def parse_many(
+    strings: Iterable[str],
+    to_unit: Optional[str] = None,
+    to_form: Optional[str] = None,
+    parser: Optional[str] = None,
+) -> QuantityOrUnit:
+    """Parse a column of scalar string quantities into one array-valued quantity.
+
+    Strings such as ``"3.2 angstrom"`` and ``"0.4 nm"`` are split at their
+    first space into number and unit. The numbers are converted to floats by
+    numpy in one call, each distinct unit string is resolved once into a scale
+    and offset towards `to_unit`, and those are applied to the whole column
+    at once. Strings the split does not cover -- no separating space, a unit
+    part carrying numbers of its own -- are converted one by one with
+    :func:`convert`, with the same result.
+
+    Parameters
+    ----------
+    strings : iterable of str
+        Scalar string quantities, one per element. Units may differ between
+        elements but must be compatible.
+    to_unit : str, optional
+        Unit of the output. If omitted, the unit of the first string.
+    to_form : {"unyt", "pint", "openmm.unit", "astropy.units", "string"}, optional
+        Output form. If omitted, the configured default form.
+    parser : {"pint", "openmm.unit", "astropy.units"}, optional
+        Parser used to interpret the strings and `to_unit`.
+
+    Returns
+    -------
+    QuantityLike
+        A quantity whose value is a 1-D float ndarray in input order.
+
+    Raises
+    ------
+    BadCallError
+        If an element is not a string, or `strings` is empty and no `to_unit`
+        is given.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> puw.parse_many(["3.2 angstrom", "0.4 nm"], to_unit="nm")
+    """
+
     from .construction import quantity
 
-    offset = float(
-        convert(
-            quantity(0.0, from_unit, parser=resolved_parser),
-            to_unit=to_unit,
-            parser=resolved_parser,
-            to_type="value",
+    from ..parse import _is_unit_expression
+
+    if isinstance(strings, np.ndarray):
+        strings = strings.tolist()
+    else:
+        strings = list(strings)
+
+    parser = digest_parser(parser)
+
+    if to_unit is None:
+        if not strings:
+            raise BadCallError("to_unit")
+        if not isinstance(strings[0], str):
+            raise BadCallError("strings")
+        _, _, first_unit = strings[0].partition(" ")
+        if _is_unit_expression(first_unit.strip()):
+            to_unit = first_unit.strip()
+        else:
+            to_unit = convert(strings[0], to_form="string", parser=parser, to_type="unit")
+
+    if not strings:
+        return quantity(np.empty(0), to_unit, form=to_form, parser=parser)
+
+    # Split and code every string with C-level builtins only; the per-element
+    # work left in Python is one list comprehension.
+    try:
+        parts = [string.partition(" ") for string in strings]
+    except (AttributeError, TypeError):
+        raise BadCallError("strings")
+    numbers = list(map(itemgetter(0), parts))
+    unit_strings = list(map(itemgetter(2), parts))
+    units = list(dict.fromkeys(unit_strings))
+    code_of = {unit_string: code for code, unit_string in enumerate(units)}
+    codes = np.fromiter(map(code_of.__getitem__, unit_strings), dtype=np.intp, count=len(strings))
+
+    # One scale and offset per distinct unit string.
+    scales = np.ones(len(units))
+    offsets = np.zeros(len(units))
+    unit_is_single = np.zeros(len(units), dtype=bool)
+    for code, unit_string in enumerate(units):
+        unit_string = unit_string.strip()
+        if not _is_unit_expression(unit_string):
+            unit_is_single[code] = True
+            continue
+        scales[code], offsets[code] = conversion_affine(unit_string, to_unit, parser=parser)
+
+    single = unit_is_single[codes]
+
+    try:
+        values = np.array(numbers, dtype=float)
+    except ValueError:
+        values = np.empty(len(strings))
+        for index, number in enumerate(numbers):
+            try:
+                values[index] = float(number)
+            except ValueError:
+                single[index] = True
+
+    values *= scales[codes]
+    if offsets.any():
+        values += offsets[codes]
+
+    # No separating space, a unit part with numbers of its own, a number
+    # numpy does not read: left to `convert`, one string at a time.
+    for index in np.flatnonzero(single).tolist():
+        values[index] = convert(
+            strings[index], to_unit=to_unit, parser=parser, to_type="value"
         )
+
+    return quantity(values, to_unit, form=to_form, parser=parser)
+
+
+class ConversionPlan:
+    """Conversion between two fixed units, resolved once and applied many times.
+
+    Built by :func:`compile_conversion`. Forms, target unit and factor are
+    resolved when the plan is compiled, so calling it costs one multiplication
+    plus, for quantity output, wrapping the result in the target form.
+
+    A plan trusts its input: quantities are assumed to be in `from_unit` and
+    `from_form`, and bare magnitudes (numbers, lists, plain ndarrays) to be
+    expressed in `from_unit`. Nothing is checked per call; that is the point.
+
+    Attributes
+    ----------
+    from_unit : str or UnitLike
+        Source unit the plan was compiled for.
+    to_unit : str or UnitLike
+        Target unit the plan was compiled for.
+    from_form : str
+        Form of the quantities the plan accepts.
+    to_form : str
+        Form of the quantities the plan returns.
+    to_type : {"quantity", "unit", "value"}
+        Output type of the plan.
+    factor : float
+        Multiplicative factor applied to a magnitude expressed in `from_unit`.
+    """
+
+    __slots__ = (
+        "from_unit",
+        "to_unit",
+        "from_form",
+        "to_form",
+        "to_type",
+        "factor",
+        "_value_factor",
+        "_target_unit",
+        "_get_value",
+        "_make_quantity",
     )
-    unit_value = float(
-        convert(
-            quantity(1.0, from_unit, parser=resolved_parser),
-            to_unit=to_unit,
-            parser=resolved_parser,
-            to_type="value",
+
+    def __init__(
+        self,
+        from_unit: Any,
+        to_unit: Any,
+        from_form: str,
+        to_form: str,
+        to_type: str,
+        factor: float,
+        value_factor: float,
+        target_unit: Any,
+    ) -> None:
+        self.from_unit = from_unit
+        self.to_unit = to_unit
+        self.from_form = from_form
+        self.to_form = to_form
+        self.to_type = to_type
+        self.factor = factor
+        self._value_factor = value_factor
+        self._target_unit = target_unit
+        self._get_value = dict_get_value[from_form]
+        self._make_quantity = dict_make_quantity[to_form]
+
+    def __call__(self, quantity_or_value: Any) -> Union[QuantityOrUnit, float, np.ndarray]:
+        if type(quantity_or_value) is np.ndarray or isinstance(
+            quantity_or_value, (int, float, np.generic)
+        ):
+            value = quantity_or_value * self.factor
+        elif isinstance(quantity_or_value, (list, tuple)):
+            value = np.asarray(quantity_or_value) * self.factor
+        else:
+            value = self._get_value(quantity_or_value) * self._value_factor
+
+        if self.to_type == "value":
+            return value
+        if self.to_type == "unit":
+            return self._target_unit
+        return self._make_quantity(value, self._target_unit)
+
+    def __repr__(self) -> str:
+        return (
+            f"ConversionPlan({self.from_unit!r} -> {self.to_unit!r}, "
+            f"{self.from_form!r} -> {self.to_form!r}, to_type={self.to_type!r}, "
+            f"factor={self.factor!r})"
+        )
+
+
+@signal(tags=["conversion"], exception_level="DEBUG")
+def compile_conversion(
+    from_unit: Any,
+    to_unit: Any,
+    from_form: Optional[str] = None,
+    to_form: Optional[str] = None,
+    parser: Optional[str] = None,
+    to_type: Optional[str] = "quantity",
+) -> ConversionPlan:
+    """Resolve a unit conversion once and return it as a reusable callable.
+
+    Parsing both units, choosing the translation between forms and computing
+    the factor all happen here. The returned plan skips every branch of
+    :func:`convert` and every dispatch lookup when called, which makes it the
+    tool for converting the same unit pair many times in a loop.
+
+    Parameters
+    ----------
+    from_unit : str or UnitLike
+        Unit of the inputs the plan will receive.
+    to_unit : str or UnitLike
+        Target unit.
+    from_form : {"unyt", "pint", "openmm.unit", "astropy.units"}, optional
+        Form of the quantities the plan will receive. Defaults to the
+        configured default form.
+    to_form : {"unyt", "pint", "openmm.unit", "astropy.units"}, optional
+        Form of the quantities the plan returns. Defaults to `from_form`.
+    parser : {"pint", "openmm.unit", "astropy.units"}, optional
+        Parser used when a unit is provided as a string.
+    to_type : {"quantity", "unit", "value"}, optional, default="quantity"
+        Output type of the plan.
+
+    Returns
+    -------
+    ConversionPlan
+        Callable taking a quantity in `from_unit` or a bare magnitude.
+
+    Raises
+    ------
+    BadCallError
+        If `to_type` is not valid, if `to_form` is ``"string"``, or if the unit
+        pair is affine (offset-bearing) and no single factor converts it.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> to_angstroms = puw.compile_conversion("nm", "angstroms", to_type="value")
+    >>> to_angstroms(puw.quantity(1.0, "nm"))
+    10.0
+    """
+
+    if to_type not in ["unit", "value", "quantity"]:
+        raise BadCallError("to_type")
+
+    resolved_parser = digest_parser(parser)
+    from_form = digest_form(from_form)
+    to_form = digest_to_form(to_form, from_form)
+
+    if from_form == "string" or to_form == "string":
+        raise BadCallError(
+            "to_form" if to_form == "string" else "from_form",
+            value="string",
+            message="Conversion plans operate on magnitudes; use convert() for strings.",
         )
+
+    source_unit = convert(
+        from_unit, to_form=from_form, parser=resolved_parser, to_type="unit"
     )
-    if not np.isclose(offset, 0.0):
+    scaling = _resolve_scaling(from_form, source_unit, to_unit, to_form, resolved_parser)
+
+    if scaling is None:
         raise BadCallError(
-            f"conversion_factor requires offset-free units; '{from_unit}' -> "
-            f"'{to_unit}' is affine. Use convert() for offset-bearing units."
+            "to_unit",
+            value=to_unit,
+            message=(
+                f"compile_conversion requires offset-free units; '{from_unit}' -> "
+                f"'{to_unit}' is affine. Use convert_magnitude() or convert() for "
+                "offset-bearing units."
+            ),
         )
 
-    factor = unit_value - offset
-    cache[key] = factor
-    return factor
+    factor, value_factor, target_unit = scaling
+
+    return ConversionPlan(
+        from_unit,
+        to_unit,
+        from_form,
+        to_form,
+        to_type,
+        factor,
+        value_factor,
+        target_unit,
+    )
 
 
 @signal(tags=["conversion"], exception_level="DEBUG")
@@ -369,10 +1216,25 @@ def to_string(
     )
 
 
-__all__ = ["convert", "conversion_factor", "to_string"]
+__all__ = [
+    "ConversionPlan",
+    "compile_conversion",
+    "conversion_affine",
+    "conversion_factor",
+    "convert",
+    "convert_magnitude",
+    "convert_many",
+    "convert_stream",
+    "parse_many",
+    "to_string",
+]
 
 
-@lru_cache(maxsize=256)
+@memoize(
+    "unit_string",
+    256,
+    key=lambda unit_string, parser, to_form: (unit_key(unit_string, parser), parser, to_form),
+)
 def _parse_unit_string(unit_string: str, parser: str, to_form: str):
     """Parse a unit string robustly across parsers.
 
@@ -382,7 +1244,8 @@ def _parse_unit_string(unit_string: str, parser: str, to_form: str):
 
     Memoized because units are immutable and a conversion target is normally
     the same handful of strings over and over: resolving ``"angstrom"`` costs
-    about 2.1 us, against 0.1 us to look it up.
+    about 2.1 us, against 0.1 us to look it up. Spellings of one unit --
+    ``"nm"``, ``"nanometers"``, ``"nanometre"`` -- share an entry.
     """
     try:
         candidate = _parse(unit_string, parser=parser, to_form=to_form)
@@ -6,9 +6,11 @@ from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 
+from .._private import parallel
+from .._private.exceptions import ArgumentError as BadCallError
 from .._private.quantity_or_unit import QuantityLike, UnitLike
-from ..forms import dict_change_value, dict_get_value
-from .introspection import get_form
+from .conversion import _stored_value_factor
+from .introspection import _form_adapter
 
 
 from smonitor import signal
@@ -47,6 +49,48 @@ def _coerce_extracted_value(
 
     raise ValueError("Unsupported value_type.")
 
+def _inplace_target(value: Any) -> np.ndarray:
+    """Return `value` if converted numbers can be written over it."""
+
+    if not isinstance(value, np.ndarray):
+        raise BadCallError(
+            "inplace",
+            message="inplace=True requires a quantity whose value is a numpy.ndarray.",
+        )
+    if value.dtype.kind not in "fc":
+        raise BadCallError(
+            "inplace",
+            message=(
+                "inplace=True requires a floating-point or complex value; converted "
+                f"numbers cannot be written over a {value.dtype} array. Use out= or "
+                "omit inplace."
+            ),
+        )
+    return value
+
+
+# Rows converted per step when writing into `out`: bounded so that converting
+# one memory map into another never keeps more than this many bytes of either
+# dirty at once.
+_SCALE_CHUNK_BYTES = 64 * 2**20
+
+
+def _scale_into(
+    value: np.ndarray, factor: float, out: np.ndarray, workers: int = 1
+) -> np.ndarray:
+    if value.ndim == 0 or value.nbytes <= _SCALE_CHUNK_BYTES:
+        return parallel.multiply(value, factor, out=out, workers=workers)
+
+    rows = max(1, _SCALE_CHUNK_BYTES // (value.nbytes // len(value) or 1))
+    for start in range(0, len(value), rows):
+        block = slice(start, start + rows)
+        parallel.multiply(value[block], factor, out=out[block], workers=workers)
+        if isinstance(out, np.memmap):
+            out.flush()
+
+    return out
+
+
 @signal(tags=["extraction"])
 def get_value(
     quantity: QuantityLike,
@@ -55,6 +99,9 @@ def get_value(
     standardized: Optional[bool] = False,
     value_type: Optional[Any] = None,
     dtype: Optional[Any] = None,
+    out: Optional[np.ndarray] = None,
+    inplace: bool = False,
+    workers: Optional[int] = None,
 ) -> Union[np.ndarray, float, int, list, tuple]:
     """ Returns the value of a quantity.
 
@@ -66,11 +113,36 @@ def get_value(
         parser : {"unyt", "pint", "openmm.unit", "astropy.units"}, optional
             The parser to use.
 
+        out : numpy.ndarray, optional
+            Array the value is written into, instead of allocating a new one.
+            It must have the shape of the value and a dtype it can be cast to.
+
+        inplace : bool, default False
+            Write the converted value over the quantity's own array. The
+            quantity is left holding numbers expressed in `to_unit` under its
+            old unit, so it must not be used afterwards. Only for ndarray
+            values of a floating-point or complex dtype.
+
+        workers : int, optional
+            Threads a large ndarray value is scaled over, ``-1`` for one per
+            CPU. Defaults to :func:`pyunitwizard.configure.get_conversion_workers`.
+
         Returns
         -------
         np.ndarray or float or int
             An array with the quantity value or a a float or an int if it's a scalar.
 
+        Notes
+        -----
+        When the value is an ndarray and the unit change is a pure scaling, the
+        factor is resolved once per unit pair and cached, and the array is
+        multiplied by it directly -- into `out` or in place if requested -- with
+        no intermediate quantity. Writes into `out` proceed in blocks of
+        leading-axis rows, so a memory-mapped quantity converts into another
+        memory map without either being read into memory whole. With
+        ``workers`` above one, each multiply is split into slabs scaled from a
+        thread pool.
+
     """
 
     # --- High Performance Fast Path ---
@@ -81,6 +153,7 @@ def get_value(
         and type(quantity) is np.ndarray
         and value_type is None
         and dtype is None
+        and out is None
     ):
         return quantity
     # ----------------------------------
@@ -88,16 +161,57 @@ def get_value(
     from .conversion import convert
     from .standardization import standardize
 
+    if out is not None or inplace:
+        if out is not None and inplace:
+            raise BadCallError(
+                "out",
+                message="get_value accepts either out= or inplace=True, not both.",
+            )
+        if value_type is not None or dtype is not None:
+            raise BadCallError(
+                "out" if out is not None else "inplace",
+                message="value_type and dtype cannot be combined with out= or inplace=True.",
+            )
+
     if standardized:
         quantity = standardize(quantity)
         to_unit = None
 
     if to_unit is None:
-        form = get_form(quantity)
-        value = dict_get_value[form](quantity)
+        value = _form_adapter(quantity).get_value(quantity)
+        if out is not None:
+            np.copyto(out, value, casting="same_kind")
+            return out
         return _coerce_extracted_value(value, value_type=value_type, dtype=dtype)
 
+    adapter = _form_adapter(quantity)
+
+    if adapter.form != "string" and not adapter.is_unit(quantity):
+        value = adapter.get_value(quantity)
+        if isinstance(value, np.ndarray):
+            factor = _stored_value_factor(
+                adapter.form, adapter.get_unit(quantity), to_unit, parser
+            )
+            if factor is not None:
+                workers = parallel.resolve_workers(workers)
+                if inplace:
+                    out = _inplace_target(value)
+                if out is not None:
+                    return _scale_into(value, factor, out, workers)
+                return _coerce_extracted_value(
+                    parallel.multiply(value, factor, workers=workers),
+                    value_type=value_type,
+                    dtype=dtype,
+                )
+
     value = convert(quantity, to_unit=to_unit, parser=parser, to_type="value")
+
+    if inplace:
+        out = _inplace_target(adapter.get_value(quantity))
+    if out is not None:
+        np.copyto(out, value, casting="same_kind")
+        return out
+
     return _coerce_extracted_value(value, value_type=value_type, dtype=dtype)
 
 
@@ -204,8 +318,7 @@ def change_value(quantity: QuantityLike, value: Union[np.ndarray, float, int]) -
     >>> puw.change_value(q, 2.0)
     """
 
-    form = get_form(quantity)
-    return dict_change_value[form](quantity, value)
+    return _form_adapter(quantity).change_value(quantity, value)
 
 
 __all__ = [
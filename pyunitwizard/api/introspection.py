@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+import sys
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .. import kernel
+from .._private import unit_engine
+from .._private.caches import BoundedCache, memoize
+from .._private.unit_keys import unit_key
 from .._private.exceptions import NotImplementedFormError
 from .._private.quantity_or_unit import QuantityOrUnit
 from .._private.smonitor.emitter import emit_probe_miss
 from ..forms import (
-    dict_dimensionality,
+    FormAdapter,
+    _adapters_by_type,
     dict_get_unit,
     dict_is_form,
     dict_is_quantity,
     dict_is_unit,
+    dict_form_adapter,
     dict_translate_unit,
 )
 
@@ -24,8 +29,10 @@ if TYPE_CHECKING:  # pragma: no cover - circular import guard
 
 from smonitor import signal
 
-_TYPE_TO_FORM_CACHE: Dict[type, str] = {}
-_DIMENSIONALITY_CACHE: Dict[tuple[str, Any], Dict[str, int]] = {}
+# Few types ever reach `get_form` and all of them keep coming back, so the type
+# cache skips the LRU reordering on its hottest-path hit.
+_TYPE_TO_FORM_CACHE: Dict[type, str] = BoundedCache("type_to_form", 256, policy="fifo")
+_DIMENSIONALITY_CACHE: Dict[tuple[str, Any], Dict[str, int]] = BoundedCache("dimensionality", 4096)
 
 # Whether a unit type can key a dict directly. This is a property of the type,
 # not of the runtime configuration, so unlike the caches above it is never
@@ -60,14 +67,28 @@ def _cache_key_for_unit(unit: Any) -> Any:
     return unit if hashable else str(unit)
 
 
-@lru_cache(maxsize=256)
+@memoize(
+    "target_unit",
+    256,
+    key=lambda target_unit, form, parser: (unit_key(target_unit, parser), form, parser),
+)
 def _target_unit_from_string(target_unit: str, form: str, parser: Optional[str]):
     from .construction import unit
 
     return unit(target_unit, form=form, parser=parser)
 
 
-@lru_cache(maxsize=256)
+def _pint_registry_key(target_unit: str, registry):
+    # Only our own registry's names are known to mean the same in `registry`.
+    # Looked up in sys.modules: an import statement would cost more than the
+    # cache lookup this key is for.
+    api_pint = sys.modules.get("pyunitwizard.forms.api_pint")
+    if api_pint is not None and registry is api_pint.ureg:
+        return unit_key(target_unit, "pint"), registry
+    return target_unit, registry
+
+
+@memoize("pint_registry_unit", 256, key=_pint_registry_key)
 def _target_unit_from_pint_registry(target_unit: str, registry):
     return registry.Unit(target_unit)
 
@@ -80,6 +101,23 @@ def _register_detected_form(form: str) -> str:
     return form
 
 
+def _form_adapter(quantity_or_unit: QuantityOrUnit) -> FormAdapter:
+    """Return the adapter of an object's form.
+
+    One lookup keyed on the object's type once that type has been seen; the
+    first time, the form is found by :func:`get_form`, whose errors propagate.
+    """
+
+    try:
+        return _adapters_by_type[type(quantity_or_unit)]
+    except KeyError:
+        pass
+
+    adapter = dict_form_adapter[get_form(quantity_or_unit)]
+    _adapters_by_type[type(quantity_or_unit)] = adapter
+    return adapter
+
+
 @signal(tags=["introspection"], exception_level="DEBUG")
 def get_form(
     quantity_or_unit: QuantityOrUnit, raise_exception: bool = True
@@ -101,8 +139,9 @@ def get_form(
     """
 
     obj_type = type(quantity_or_unit)
-    if obj_type in _TYPE_TO_FORM_CACHE:
-        return _TYPE_TO_FORM_CACHE[obj_type]
+    form = _TYPE_TO_FORM_CACHE.get(obj_type)
+    if form is not None:
+        return form
 
     if isinstance(quantity_or_unit, str):
         _TYPE_TO_FORM_CACHE[obj_type] = "string"
@@ -178,7 +217,7 @@ def is_quantity(quantity_or_unit: QuantityOrUnit, parser: Optional[str] = None)
                     probe_input, "pyunitwizard.api.introspection.is_quantity"
                 )
                 return False
-            output = dict_is_quantity[form](quantity_or_unit)
+            output = dict_form_adapter[form].is_quantity(quantity_or_unit)
         except Exception:
             emit_probe_miss(probe_input, "pyunitwizard.api.introspection.is_quantity")
             return False
@@ -221,8 +260,7 @@ def is_unit(quantity_or_unit: QuantityOrUnit, parser: Optional[str] = None) -> b
             return False
     else:
         try:
-            form = get_form(quantity_or_unit)
-            output = dict_is_unit[form](quantity_or_unit)
+            output = _form_adapter(quantity_or_unit).is_unit(quantity_or_unit)
         except Exception:
             emit_probe_miss(probe_input, "pyunitwizard.api.introspection.is_unit")
             return False
@@ -271,15 +309,15 @@ def has_unit(
     if isinstance(quantity_or_unit, str):
         return None
 
-    object_type = type(quantity_or_unit)
-    form = _TYPE_TO_FORM_CACHE.get(object_type)
-    if form is None:
-        form = get_form(quantity_or_unit)
-
-    return unit_matches_target(
-        unit_of(quantity_or_unit, form), form, target_unit, parser=parser
+    adapter = _form_adapter(quantity_or_unit)
+    unit = (
+        quantity_or_unit
+        if adapter.is_unit(quantity_or_unit)
+        else adapter.get_unit(quantity_or_unit)
     )
 
+    return unit_matches_target(unit, adapter.form, target_unit, parser=parser)
+
 
 def unit_of(quantity_or_unit: QuantityOrUnit, form: str):
     """Return the unit of an object whose form is already known.
@@ -400,28 +438,36 @@ def get_dimensionality(quantity_or_unit: QuantityOrUnit) -> Dict[str, int]:
     from .conversion import convert
 
     if isinstance(quantity_or_unit, str):
+        # Strings the native engine understands are answered without parsing
+        # them into a backend object first.
+        if unit_engine.answers_strings():
+            native = unit_engine.dimensionality(quantity_or_unit)
+            if native is not None:
+                return native
+
         if is_quantity(quantity_or_unit):
             quantity_or_unit = convert(quantity_or_unit, to_type="quantity")
         elif is_unit(quantity_or_unit):
             quantity_or_unit = convert(quantity_or_unit, to_type="unit")
 
-    form = get_form(quantity_or_unit)
+    adapter = _form_adapter(quantity_or_unit)
     # The unit is only an ingredient of the cache key, so it is extracted
-    # through the form dispatch already resolved above. Routing this through
+    # through the form adapter already resolved above. Routing this through
     # the public `get_unit()` would re-enter `convert()` and resolve the same
     # form twice more, and it would render the unit in the default form while
-    # the key states `form`.
+    # the key states the form.
     unit = (
         quantity_or_unit
-        if dict_is_unit[form](quantity_or_unit)
-        else dict_get_unit[form](quantity_or_unit)
+        if adapter.is_unit(quantity_or_unit)
+        else adapter.get_unit(quantity_or_unit)
     )
-    cache_key = (form, _cache_key_for_unit(unit))
+    cache_key = (adapter.form, _cache_key_for_unit(unit))
 
-    if cache_key in _DIMENSIONALITY_CACHE:
-        return dict(_DIMENSIONALITY_CACHE[cache_key])
+    cached = _DIMENSIONALITY_CACHE.get(cache_key)
+    if cached is not None:
+        return dict(cached)
 
-    dim = dict_dimensionality[form](quantity_or_unit)
+    dim = adapter.dimensionality(quantity_or_unit)
     _DIMENSIONALITY_CACHE[cache_key] = dict(dim)
 
     return dict(dim)
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import math
+import re
+from fractions import Fraction
+from typing import Any, Iterable, List, Optional, Union
 
 import numpy as np
 from smonitor import signal
 
 from .. import kernel
+from .._private.caches import memoize
 from .._private.exceptions import NoStandardsError
 from .._private.forms import digest_form
 from .._private.parsers import digest_parser
 from .._private.quantity_or_unit import QuantityOrUnit, UnitLike
-from ..forms import dict_is_unit
+from ..forms import dict_get_unit, dict_is_unit
 from .comparison import are_compatible
-from .conversion import convert
+from .conversion import _convert_many_plan, convert, convert_many
 from .introspection import (
+    _cache_key_for_unit,
     _target_unit_from_string,
     get_dimensionality,
     get_form,
@@ -56,37 +61,282 @@ def _matching_configured_standard(
     return None
 
 
-def _standard_units_lstsq(solution: np.ndarray, standards: dict, 
-                          matrix: Optional[np.ndarray] = None, 
-                          units: Optional[list] = None) -> Optional[UnitLike]:
+def _exact_exponent(value: float) -> Union[int, Fraction]:
+    """Return a dimension exponent as an exact number, undoing float round-off."""
+
+    value = float(value)
+    if value.is_integer():
+        return int(value)
+    return Fraction(value).limit_denominator(1000)
+
+
+def _solve_exponents(
+    columns: List[tuple], target: tuple
+) -> Optional[List[Union[int, Fraction]]]:
+    """Solve ``sum(x[j] * columns[j]) == target`` exactly over the rationals.
+
+    Each equation is scaled to integers and eliminated fraction-free, so the
+    arithmetic stays on small Python ints; only non-integer answers come back
+    as fractions. When several solutions exist, the columns without a pivot get exponent
+    zero: earlier standards win over later ones of the same dimensionality.
+    Returns ``None`` when the system has no solution.
+    """
+
+    n_columns = len(columns)
+    rows = []
+    for ii, value in enumerate(target):
+        row = [_exact_exponent(column[ii]) for column in columns]
+        row.append(_exact_exponent(value))
+        scale = math.lcm(*(item.denominator for item in row))
+        rows.append([int(item * scale) for item in row])
+
+    pivots = []
+    rank = 0
+    for jj in range(n_columns):
+        pivot_row = next((ii for ii in range(rank, len(rows)) if rows[ii][jj] != 0), None)
+        if pivot_row is None:
+            continue
+        rows[rank], rows[pivot_row] = rows[pivot_row], rows[rank]
+        pivot_values = rows[rank]
+        pivot = pivot_values[jj]
+        for ii, row in enumerate(rows):
+            if ii != rank and row[jj] != 0:
+                factor = row[jj]
+                row = [pivot * a - factor * b for a, b in zip(row, pivot_values)]
+                divisor = math.gcd(*row)
+                rows[ii] = [a // divisor for a in row] if divisor > 1 else row
+        pivots.append(jj)
+        rank += 1
+        if rank == len(rows):
+            break
+
+    if any(row[n_columns] != 0 for row in rows[rank:]):
+        return None
+
+    exponents: List[Union[int, Fraction]] = [0] * n_columns
+    for ii, jj in enumerate(pivots):
+        quotient, remainder = divmod(rows[ii][n_columns], rows[ii][jj])
+        exponents[jj] = quotient if remainder == 0 else Fraction(rows[ii][n_columns], rows[ii][jj])
+
+    return exponents
+
+
+_UNIT_TOKEN = re.compile(r"\*\*|\^|[*/()]|[^\s*/^()]+")
+
+
+@memoize("unit_factors", 256)
+def _unit_factors(unit: str) -> Optional[dict]:
+    """Split a product of units such as ``'kilojoule / mole'`` into factors.
+
+    Returns ``{name: exponent}``, or ``None`` for strings this simple reading
+    does not cover, such as parenthesized groups. The result is shared
+    between callers and must not be modified.
+    """
+
+    tokens = _UNIT_TOKEN.findall(unit)
+    factors: dict = {}
+    sign = 1
+    position = 0
+
+    while position < len(tokens):
+        name = tokens[position]
+        if name in ("**", "^", "*", "/", "(", ")"):
+            return None
+        power: Union[int, Fraction] = 1
+        position += 1
+        if position < len(tokens) and tokens[position] in ("**", "^"):
+            try:
+                power = _exact_exponent(tokens[position + 1])
+            except (IndexError, ValueError):
+                return None
+            position += 2
+        if name != "1":
+            factors[name] = factors.get(name, 0) + sign * power
+        if position < len(tokens):
+            if tokens[position] not in ("*", "/"):
+                return None
+            sign = 1 if tokens[position] == "*" else -1
+            position += 1
+            if position == len(tokens):
+                return None
+
+    return factors
+
+
+def _compose_unit_string(units: List[str], exponents: List[Union[int, Fraction]]) -> str:
+    """Write the product of `units` raised to `exponents` as a unit string.
+
+    The units are split into their factors first, so that ``kJ/mol`` and
+    ``mol`` multiply into ``kJ``, and the result is laid out as pint's default
+    format: factors in alphabetical order, positive powers first and each
+    negative one as ``/ unit``. Fractional powers are written exactly, as
+    ``nanometer ** (1/3)``.
+    """
+
+    factors: dict = {}
+
+    for unit, exponent in zip(units, exponents):
+        if exponent == 0:
+            continue
+        unit_factors = _unit_factors(unit)
+        if unit_factors is None:
+            unit_factors = {f"({unit})": 1}
+        for name, power in unit_factors.items():
+            factors[name] = factors.get(name, 0) + power * exponent
+
+    numerator = []
+    denominator = []
+
+    for name, exponent in sorted(factors.items()):
+        if exponent == 0:
+            continue
+        power = abs(exponent)
+        if power != 1:
+            if power.denominator == 1:
+                name = f"{name} ** {power.numerator}"
+            else:
+                name = f"{name} ** ({power.numerator}/{power.denominator})"
+        (numerator if exponent > 0 else denominator).append(name)
+
+    output = " * ".join(numerator) if numerator else "1"
+    for name in denominator:
+        output += f" / {name}"
+
+    return output
+
+
+def _standard_units_exact(solution: np.ndarray, standards: dict,
+                          matrix: Optional[np.ndarray] = None,
+                          units: Optional[list] = None) -> Optional[str]:
     """ Auxiliary function for get_standard_units.
-        Returns standard units by using least squares method.
+        Returns the product of standard units with the dimensionality
+        `solution`, solved exactly, as a unit string.
+
+        `matrix` and `units` are the dimensionality rows and the unit strings
+        of `standards`, as precomputed by ``configure.set_standard_units``.
     """
 
     if matrix is None:
-        matrix_list = []
-        standard_units = []
-        for aux_unit, aux_dim_array in standards.items():
-            standard_units.append(convert(aux_unit, to_type="unit"))
-            matrix_list.append(aux_dim_array)
-        matrix = np.array(matrix_list)
-    else:
-        standard_units = units
+        matrix = list(standards.values())
+        units = [convert(unit, to_form="string", to_type="unit") for unit in standards]
+
+    exponents = _solve_exponents(matrix, solution)
 
-    x, _, _, _ = np.linalg.lstsq(matrix.T, solution, rcond=None)
+    if exponents is None:
+        return None
 
+    return _compose_unit_string(units, exponents)
 
-    x = x.round(4)
 
-    if np.allclose(np.dot(matrix.T, x), solution):
-        output: UnitLike = 1
-        for u, exponent in zip(standard_units, x):
-            if not np.isclose(0.0, exponent):
-                output *= u ** exponent
+def _solve_standard_unit(
+    solution: np.ndarray, n_dims_solution: int
+) -> tuple[Optional[UnitLike], bool]:
+    """Return the standard unit of a dimensional exponent vector.
 
-        return convert(output, to_form="string", to_type="unit")
+    The second item tells whether the answer is a declared combination
+    standard, which :func:`get_standard_units` returns verbatim instead of
+    resolving in the requested form. Dimensionless vectors are not handled
+    here: their standard depends on the quantity, not only on its exponents.
+    """
 
-    return None
+    if n_dims_solution == 1:
+        for standard_unit, dim_array in kernel.dimensional_fundamental_standards.items():
+            if np.allclose(solution, dim_array):
+                return standard_unit, False
+
+        if len(kernel.tentative_base_standards) == 0:
+            raise NoStandardsError
+
+        return _standard_units_exact(solution, kernel.tentative_base_standards, kernel.tentative_base_standards_matrix, kernel.tentative_base_standards_units), False
+
+    for standard_units, dim_array in kernel.dimensional_combinations_standards.items():
+        if np.allclose(solution, dim_array):
+            return standard_units, True
+
+    if len(kernel.dimensional_fundamental_standards) == 0:
+        raise NoStandardsError
+
+    output = _standard_units_exact(solution, kernel.dimensional_fundamental_standards, kernel.dimensional_fundamental_standards_matrix, kernel.dimensional_fundamental_standards_units)
+
+    if output is None:
+        if len(kernel.tentative_base_standards) == 0:
+            raise NoStandardsError
+
+        output = _standard_units_exact(solution, kernel.tentative_base_standards, kernel.tentative_base_standards_matrix, kernel.tentative_base_standards_units)
+
+    return output, False
+
+
+# Derived dimensionalities solved eagerly by `_build_standard_units_index`,
+# over [L], [M], [T], [K], [mol], [A], [Cd]: the ones a molecular or
+# materials workflow meets within its first few calls.
+_COMMON_DIMENSIONALITIES = (
+    (2, 0, 0, 0, 0, 0, 0),     # area
+    (3, 0, 0, 0, 0, 0, 0),     # volume
+    (0, 0, -1, 0, 0, 0, 0),    # frequency
+    (1, 0, -1, 0, 0, 0, 0),    # velocity
+    (1, 0, -2, 0, 0, 0, 0),    # acceleration
+    (2, 0, -1, 0, 0, 0, 0),    # diffusion coefficient
+    (1, 1, -1, 0, 0, 0, 0),    # momentum
+    (1, 1, -2, 0, 0, 0, 0),    # force
+    (2, 1, -2, 0, 0, 0, 0),    # energy
+    (2, 1, -3, 0, 0, 0, 0),    # power
+    (-1, 1, -2, 0, 0, 0, 0),   # pressure
+    (-3, 1, 0, 0, 0, 0, 0),    # density
+    (0, 1, -2, 0, 0, 0, 0),    # force constant / surface tension
+    (2, 1, 0, 0, 0, 0, 0),     # moment of inertia
+    (2, 1, -1, 0, 0, 0, 0),    # action
+    (0, 1, 0, 0, -1, 0, 0),    # molar mass
+    (-3, 0, 0, 0, 1, 0, 0),    # concentration
+    (2, 1, -2, 0, -1, 0, 0),   # molar energy
+    (1, 1, -2, 0, -1, 0, 0),   # force per mole
+    (0, 1, -2, 0, -1, 0, 0),   # force constant per mole
+    (2, 1, -2, -1, 0, 0, 0),   # entropy, heat capacity
+    (2, 1, -2, -1, -1, 0, 0),  # molar entropy, gas constant
+    (0, 0, 1, 0, 0, 1, 0),     # charge
+    (1, 0, 1, 0, 0, 1, 0),     # dipole moment
+    (2, 1, -3, 0, 0, -1, 0),   # electric potential
+    (1, 1, -3, 0, 0, -1, 0),   # electric field
+)
+
+
+def _build_standard_units_index() -> dict:
+    """Solve the standard unit of every declared and common dimensionality.
+
+    Called by ``configure.set_standard_units`` once the standard maps are
+    built. Keys are exponent tuples in the form `get_standard_units` looks
+    them up; values are ``(standard_unit, verbatim)`` as returned by
+    :func:`_solve_standard_unit`. Dimensionalities the standards cannot
+    express are left out, to raise on demand as before.
+    """
+
+    candidates = [
+        tuple(float(dim[unit]) for unit in kernel.order_fundamental_units)
+        for dim in kernel.standards.values()
+    ]
+    for position in range(len(kernel.order_fundamental_units)):
+        base = [0.0] * len(kernel.order_fundamental_units)
+        base[position] = 1.0
+        candidates.append(tuple(base))
+    candidates.extend(tuple(float(e) for e in dims) for dims in _COMMON_DIMENSIONALITIES)
+
+    index = {}
+    for key in candidates:
+        if key in index:
+            continue
+        n_dims_solution = sum(1 for exponent in key if abs(exponent) > 1e-08)
+        if n_dims_solution == 0:
+            continue
+        try:
+            standard_unit, verbatim = _solve_standard_unit(
+                np.array(key, dtype=float), n_dims_solution
+            )
+        except NoStandardsError:
+            continue
+        if standard_unit is not None:
+            index[key] = (standard_unit, verbatim)
+
+    return index
 
 
 @signal(tags=["standardization"])
@@ -138,6 +388,16 @@ def get_standard_units(
         # is the memoized form of exactly this conversion.
         return _target_unit_from_string(cached_output, form, parser)
 
+    # Dimensionalities solved when the standards were set: one more dict hit,
+    # and the answer moves into the cache for the next call.
+    indexed = kernel.standard_units_index.get(solution_key)
+    if indexed is not None:
+        standard_unit, verbatim = indexed
+        if verbatim:
+            return standard_unit
+        kernel.standard_units_by_dimensionality_cache[solution_key] = standard_unit
+        return _target_unit_from_string(standard_unit, form, parser)
+
     solution = np.array(exponents, dtype=float)
     # Equivalent to `np.isclose(exponent, 0.0)`, whose default tolerances
     # reduce to `abs(exponent) <= atol` when comparing against zero.
@@ -154,33 +414,10 @@ def get_standard_units(
                 output = standard_unit
                 break
 
-    elif n_dims_solution == 1:
-        for standard_unit, dim_array in kernel.dimensional_fundamental_standards.items():
-            if np.allclose(solution, dim_array):
-                output = standard_unit
-                break
-
-        if output is None:
-            if len(kernel.tentative_base_standards) == 0:
-                raise NoStandardsError
-
-            output = _standard_units_lstsq(solution, kernel.tentative_base_standards, kernel.tentative_base_standards_matrix, kernel.tentative_base_standards_units)
-
     else:
-        for standard_units, dim_array in kernel.dimensional_combinations_standards.items():
-            if np.allclose(solution, dim_array):
-                return standard_units
-
-        if len(kernel.dimensional_fundamental_standards) == 0:
-            raise NoStandardsError
-
-        output = _standard_units_lstsq(solution, kernel.dimensional_fundamental_standards, kernel.dimensional_fundamental_standards_matrix, kernel.dimensional_fundamental_standards_units)
-
-        if output is None:
-            if len(kernel.tentative_base_standards) == 0:
-                raise NoStandardsError
-
-            output = _standard_units_lstsq(solution, kernel.tentative_base_standards, kernel.tentative_base_standards_matrix, kernel.tentative_base_standards_units)
+        output, verbatim = _solve_standard_unit(solution, n_dims_solution)
+        if verbatim:
+            return output
 
     if output is None:
         raise NoStandardsError
@@ -255,4 +492,113 @@ def standardize(
     return convert(quantity_or_unit, to_unit=standard, to_form=to_form)
 
 
-__all__ = ["get_standard_units", "standardize"]
+def _standardize_many_plan(
+    sample: QuantityOrUnit,
+    form_in: str,
+    sample_is_unit: bool,
+    source_unit: Any,
+    to_form: str,
+    parser: Optional[str],
+):
+    """Resolve once how every object sharing `sample`'s form and unit standardizes.
+
+    Returns a callable applied to each member of the group, with the result of
+    :func:`standardize` on that member.
+    """
+
+    if _matching_configured_standard(sample, to_form, form_in=form_in) is not None:
+        return lambda item: item
+
+    standard = get_standard_units(sample, form=to_form)
+
+    if sample_is_unit:
+        return lambda item: standard
+
+    return _convert_many_plan(
+        sample, form_in, False, source_unit, standard, to_form, parser, "quantity"
+    )
+
+
+@signal(tags=["standardization"])
+def standardize_many(
+    items: Iterable[QuantityOrUnit],
+    to_form: Optional[str] = None,
+    to_unit: Optional[str] = None,
+) -> List[QuantityOrUnit]:
+    """Convert a sequence of quantities or units to standard units.
+
+    Objects are grouped by type and unit. The standard unit, and the factor
+    taking the group there, are resolved once per group, and each member is
+    then converted by scaling its magnitude, instead of paying the form
+    dispatch, standard lookup and conversion of :func:`standardize` once per
+    object. The output is what looping over :func:`standardize` gives, value
+    types and dtypes included. Groups that a single factor cannot express, such
+    as offset-bearing units or string inputs, are standardized one by one.
+
+    Parameters
+    ----------
+    items : iterable
+        Quantities or units in any supported form. Forms and units may be mixed.
+    to_form : str, optional
+        The form to transform to. When omitted the configured default form is
+        used.
+    to_unit : str, optional
+        Target unit for every item instead of its standard unit.
+
+    Returns
+    -------
+    list
+        Standardized objects, in input order.
+
+    Raises
+    ------
+    NoStandardsError
+        If no standard units were defined and `to_unit` was not supplied.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> puw.configure.set_standard_units(['nm', 'ps'])
+    >>> items = [puw.quantity(1.0, 'angstrom'), puw.quantity(2.0, 'fs')]
+    >>> puw.standardize_many(items)
+    """
+
+    to_form = digest_form(to_form)
+
+    if to_unit is not None:
+        return convert_many(items, to_unit=to_unit, to_form=to_form)
+
+    parser = digest_parser(None)
+
+    forms_by_type = {}
+    plans = {}
+    output = []
+
+    for item in items:
+        item_type = type(item)
+        form_in = forms_by_type.get(item_type)
+        if form_in is None:
+            form_in = get_form(item)
+            forms_by_type[item_type] = form_in
+
+        if form_in == "string":
+            output.append(standardize(item, to_form=to_form))
+            continue
+
+        item_is_unit = dict_is_unit[form_in](item)
+        source_unit = item if item_is_unit else dict_get_unit[form_in](item)
+        key = (item_type, item_is_unit, _cache_key_for_unit(source_unit))
+
+        plan = plans.get(key)
+        if plan is None:
+            plan = _standardize_many_plan(
+                item, form_in, item_is_unit, source_unit, to_form, parser
+            )
+            plans[key] = plan
+
+        output.append(plan(item))
+
+    return output
+
+
+__all__ = ["get_standard_units", "standardize", "standardize_many"]
@@ -1,8 +1,13 @@
 from .configure import get_libraries_loaded, get_libraries_supported, load_library
 from .configure import get_parsers_loaded, get_parsers_supported
 from .configure import get_default_form, set_default_form, get_default_parser, set_default_parser
+from .configure import get_conversion_workers, set_conversion_workers
 from .configure import get_standard_units, set_standard_units, add_standard_units
 from .configure import reset
 from .configure import has_active_policy, report
 from .configure import get_pint_registry_cache, set_pint_registry_cache
+from .configure import cache_stats, set_cache_limits
+from .configure import get_unit_cache, set_unit_cache, load_unit_cache, save_unit_cache
+from .configure import warmup
 from .configure import resolve_config_module
+from .policy import Policy
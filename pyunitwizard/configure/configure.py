@@ -85,14 +85,19 @@ def reset() -> None:
     kernel.dimensional_fundamental_standards_units = None
     kernel.tentative_base_standards_matrix = None
     kernel.tentative_base_standards_units = None
-    kernel.standard_units_by_dimensionality_cache = {}
-    kernel.conversion_factor_cache = {}
     kernel.canonical_standards = []
+    kernel.standard_units_index = {}
     kernel.policy_provenance = None
-    from pyunitwizard.api.introspection import _DIMENSIONALITY_CACHE, _TYPE_TO_FORM_CACHE
-    
-    _DIMENSIONALITY_CACHE.clear()
-    _TYPE_TO_FORM_CACHE.clear()
+    kernel.conversion_workers = 1
+    from pyunitwizard._private import caches
+    # Imported for its caches to be registered, and so reset, even if no
+    # introspection call has happened yet.
+    import pyunitwizard.api.introspection
+
+    # Every registered cache: the kernel's, the introspection ones, and the
+    # memoized parsers. Limits and counters return to their defaults too.
+    for cache in caches.registry.values():
+        cache.reset()
 
 def get_libraries_loaded() -> List[str]:
     """Return currently loaded backend libraries.
@@ -271,6 +276,50 @@ def set_default_parser(parser: str) -> None:
     """
     kernel.default_parser = digest_form(parser, load=False)
 
+def get_conversion_workers() -> int:
+    """Return the number of threads large ndarray conversions use.
+
+    Returns
+    -------
+    int
+        Configured number of worker threads; ``-1`` means one per CPU.
+    """
+    return kernel.conversion_workers
+
+def set_conversion_workers(workers: int) -> None:
+    """Spread the scaling of large ndarray values over several threads.
+
+    Applies to ``convert(..., to_unit=...)`` and ``get_value(to_unit=...)``
+    whenever the unit change is a pure scaling, unless a call passes its own
+    ``workers=``. numpy releases the GIL while it multiplies, so the threads
+    run on separate cores; arrays under a few megabytes per thread are still
+    scaled in the calling thread.
+
+    Parameters
+    ----------
+    workers : int
+        Number of threads, ``1`` to disable, or ``-1`` for one per CPU.
+
+    Returns
+    -------
+    None
+        Runtime setting is updated in place.
+
+    Raises
+    ------
+    ValueError
+        If `workers` is neither a positive integer nor ``-1``.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> puw.configure.set_conversion_workers(-1)
+    """
+    from pyunitwizard._private.parallel import resolve_workers
+
+    resolve_workers(workers)
+    kernel.conversion_workers = workers
+
 def get_standard_units() -> Dict[str, Dict[str, int]]:
     """Return configured standard units mapped to dimensionality definitions.
 
@@ -313,14 +362,25 @@ def set_standard_units(
 
     import numpy as np
 
+    from pyunitwizard._private import caches
     from pyunitwizard.api import convert, get_dimensionality
 
     kernel.standards={}
     kernel.dimensional_fundamental_standards={}
     kernel.dimensional_combinations_standards={}
     kernel.adimensional_standards={}
-    kernel.standard_units_by_dimensionality_cache = {}
+    cache = kernel.standard_units_by_dimensionality_cache
+    if caches.registry.get(cache.name) is cache:
+        cache.clear()
+    else:
+        # The cache of a context or a Policy, possibly shared with others in
+        # the same policy: replaced rather than cleared, so that none of them
+        # loses entries or gains ones computed for these new standards.
+        kernel.standard_units_by_dimensionality_cache = caches.BoundedCache(
+            cache.name, cache.maxsize, cache.policy, register=False
+        )
     kernel.canonical_standards = []
+    kernel.standard_units_index = {}
     kernel.policy_provenance = provenance
 
     n_dimensions = len(kernel.order_fundamental_units)
@@ -398,7 +458,7 @@ def set_standard_units(
 
     if len(kernel.dimensional_fundamental_standards) > 0:
         kernel.dimensional_fundamental_standards_units = [
-            convert(u, to_type="unit")
+            convert(u, to_form="string", to_type="unit")
             for u in kernel.dimensional_fundamental_standards.keys()
         ]
         kernel.dimensional_fundamental_standards_matrix = np.array(
@@ -410,7 +470,7 @@ def set_standard_units(
 
     if len(kernel.tentative_base_standards) > 0:
         kernel.tentative_base_standards_units = [
-            convert(u, to_type="unit")
+            convert(u, to_form="string", to_type="unit")
             for u in kernel.tentative_base_standards.keys()
         ]
         kernel.tentative_base_standards_matrix = np.array(
@@ -420,6 +480,16 @@ def set_standard_units(
         kernel.tentative_base_standards_units = None
         kernel.tentative_base_standards_matrix = None
 
+    # Every declared dimensionality, and the derived ones met first, resolved
+    # now so that a cold `get_standard_units` is a dictionary hit.
+    from pyunitwizard.api.standardization import _build_standard_units_index
+
+    kernel.standard_units_index = _build_standard_units_index()
+
+    # The standards complete the fingerprint of the on-disk cache, so this is
+    # the first point where its entries can be trusted.
+    _restore_unit_cache()
+
 def add_standard_units(
     standard_units: List[str], provenance: Optional[str] = None
 ) -> None:
@@ -632,3 +702,307 @@ def get_pint_registry_cache() -> Optional[str]:
     from pyunitwizard._private.backend_settings import resolve_pint_cache_folder
 
     return resolve_pint_cache_folder()
+
+
+def set_unit_cache(cache: Union[bool, str, None]) -> None:
+    """Persist parsed units, conversion factors and standard units on disk.
+
+    A short-lived worker otherwise re-derives the same few hundred units in
+    every process. With the cache on, :func:`set_standard_units` merges the
+    entries saved by earlier processes into the in-memory caches, and the
+    entries derived meanwhile are written back when the interpreter exits.
+
+    Entries are stored per fingerprint -- PyUnitWizard, Python and installed
+    backend versions, default form and parser, and standard units -- so a
+    process configured differently never reads them. Only entries made of
+    plain data are written, as JSON; those keyed on backend objects stay in
+    memory.
+
+    Parameters
+    ----------
+    cache : bool or str or None
+        ``True`` for the per-user cache folder (``$XDG_CACHE_HOME/pyunitwizard``
+        or ``~/.cache/pyunitwizard``), a path to choose one, ``False`` to
+        disable, and ``None`` to defer to the ``PYUNITWIZARD_UNIT_CACHE``
+        environment variable.
+
+    Returns
+    -------
+    None
+        The setting is recorded; it applies from the next
+        :func:`set_standard_units` call.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> puw.configure.set_unit_cache('/scratch/puw-cache')
+    >>> puw.configure.set_standard_units(['nm', 'ps', 'kJ/mol'])
+    """
+
+    from pyunitwizard._private import backend_settings
+
+    backend_settings.unit_cache = cache
+
+
+def get_unit_cache() -> Optional[str]:
+    """Return the folder the unit cache is persisted in.
+
+    Returns
+    -------
+    str or None
+        The resolved folder, or ``None`` when the on-disk cache is disabled.
+    """
+
+    from pyunitwizard._private.backend_settings import resolve_unit_cache_folder
+
+    return resolve_unit_cache_folder()
+
+
+def load_unit_cache() -> int:
+    """Merge the on-disk unit cache into the in-memory caches now.
+
+    :func:`set_standard_units` already does this when the cache is enabled;
+    call it directly after changing the default form or parser later on.
+
+    Returns
+    -------
+    int
+        Number of entries restored; 0 when the cache is disabled or empty.
+    """
+
+    from pyunitwizard._private import persistent_cache
+
+    folder = get_unit_cache()
+    if folder is None:
+        return 0
+
+    # Imported for its caches to be registered before they are filled.
+    import pyunitwizard.api.introspection
+
+    persistent_cache.register_save_at_exit()
+    return persistent_cache.load(folder)
+
+
+def save_unit_cache() -> Optional[str]:
+    """Write the current cache entries to the on-disk unit cache now.
+
+    This happens at interpreter exit anyway; call it directly from processes
+    that end without running exit handlers, such as forked workers that leave
+    through ``os._exit``.
+
+    Returns
+    -------
+    str or None
+        Path of the file written, or ``None`` when the cache is disabled.
+    """
+
+    from pyunitwizard._private import persistent_cache
+
+    folder = get_unit_cache()
+    if folder is None:
+        return None
+
+    return persistent_cache.save(folder)
+
+
+def _restore_unit_cache() -> None:
+    if get_unit_cache() is not None:
+        try:
+            load_unit_cache()
+        except OSError:
+            pass
+
+
+def cache_stats() -> Dict[str, Dict[str, Union[int, str, None]]]:
+    """Report the size, limit, policy and counters of every internal cache.
+
+    Returns
+    -------
+    dict
+        For each cache name, a dictionary with ``size``, ``maxsize``,
+        ``policy``, ``hits``, ``misses`` and ``evictions``. Caches of a backend
+        appear once that backend has been loaded.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> puw.configure.cache_stats()['conversion_factor']['maxsize']
+    4096
+    """
+
+    from pyunitwizard._private import caches
+    import pyunitwizard.api.introspection
+
+    return {name: cache.stats() for name, cache in sorted(caches.registry.items())}
+
+
+def set_cache_limits(
+    limits: Union[int, None, Dict[str, Optional[int]]] = None,
+    policy: Optional[str] = None,
+) -> None:
+    """Bound the internal caches and choose how they evict.
+
+    Every memoized path -- parsed strings, dimensionalities, conversion
+    factors, standard units, unit translations between backends -- keeps its
+    results in a cache with a maximum number of entries. Lowering a limit
+    evicts the oldest entries at once.
+
+    Parameters
+    ----------
+    limits : int or dict, optional
+        One limit for every cache, or a dictionary of limits by cache name (see
+        :func:`cache_stats`); ``None`` as a value removes that cache's limit.
+        Omitted, the limits are left as they are.
+    policy : {'lru', 'fifo'}, optional
+        Eviction policy for every cache named in `limits`, or for all of them
+        when `limits` is omitted or an int.
+
+    Returns
+    -------
+    None
+        The caches are updated in place. ``reset()`` restores the defaults.
+
+    Raises
+    ------
+    ValueError
+        If a cache name is unknown, a limit is negative or the policy is not
+        one of ``'lru'`` and ``'fifo'``.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> puw.configure.set_cache_limits({'parse': 10000, 'dimensionality': None})
+    >>> puw.configure.set_cache_limits(512, policy='fifo')
+    """
+
+    from pyunitwizard._private import caches
+    import pyunitwizard.api.introspection
+
+    if policy is not None and policy not in caches.POLICIES:
+        raise ValueError(f"Unknown cache policy '{policy}'; use one of {caches.POLICIES}.")
+
+    if isinstance(limits, dict):
+        unknown = sorted(set(limits) - set(caches.registry))
+        if unknown:
+            raise ValueError(
+                f"Unknown cache name(s) {unknown}; known caches are {sorted(caches.registry)}."
+            )
+        requested = dict(limits)
+    elif limits is None:
+        requested = None
+    else:
+        requested = {name: limits for name in caches.registry}
+
+    for maxsize in (requested or {}).values():
+        if maxsize is not None and (isinstance(maxsize, bool) or not isinstance(maxsize, int) or maxsize < 0):
+            raise ValueError(f"Cache limits must be non-negative integers or None, not {maxsize!r}.")
+
+    if requested is None:
+        for cache in caches.registry.values():
+            cache.set_limit(policy=policy)
+        return
+
+    for name, maxsize in requested.items():
+        caches.registry[name].set_limit(maxsize, policy=policy)
+
+
+def warmup(
+    units: Optional[List[str]] = None,
+    forms: Optional[List[str]] = None,
+    pairs: Optional[List[tuple]] = None,
+    parser: Optional[str] = None,
+) -> Dict[str, object]:
+    """Fill the caches for a declared unit vocabulary ahead of time.
+
+    The first time a service meets a unit it parses the string, derives its
+    dimensionality, resolves its standard unit and, for a conversion, the
+    factor -- each a one-off cost that then lands in some request's latency.
+    Calling this at start-up pays them all up front.
+
+    For every unit and form, the unit is parsed as a unit and as a conversion
+    target, its dimensionality is cached and, when standard units are set, its
+    standard unit is resolved. Every pair gets its conversion factor (or
+    scale and offset, for affine pairs) computed.
+
+    Parameters
+    ----------
+    units : list of str, optional
+        Unit strings the service will use. Defaults to the configured
+        standard units.
+    forms : list of str, optional
+        Forms to warm each unit in. Defaults to the loaded libraries.
+    pairs : list of tuple of str, optional
+        ``(from_unit, to_unit)`` pairs to precompute conversion factors for.
+    parser : str, optional
+        Parser to read the strings with. Defaults to the default parser.
+
+    Returns
+    -------
+    dict
+        ``'units'`` and ``'pairs'``: how many unit/form combinations and pairs
+        were warmed; ``'skipped'``: the ``(unit, form)`` combinations a form
+        could not handle.
+
+    Raises
+    ------
+    ValueError
+        If `units`, `forms` or `pairs` are not lists or tuples.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> puw.configure.load_library(['pint', 'openmm.unit'])
+    >>> puw.configure.set_standard_units(['nm', 'ps', 'kJ/mol'])
+    >>> puw.configure.warmup(units=['angstrom', 'kcal/mol'],
+    ...                      pairs=[('angstrom', 'nm'), ('kcal/mol', 'kJ/mol')])
+    """
+
+    from pyunitwizard._private.parsers import digest_parser
+    from pyunitwizard.api.conversion import (
+        _parse_unit_string,
+        conversion_affine,
+        conversion_factor,
+        convert,
+    )
+    from pyunitwizard.api.introspection import _target_unit_from_string, get_dimensionality
+    from pyunitwizard.api.standardization import get_standard_units
+
+    if units is None:
+        units = list(kernel.standards)
+    if forms is None:
+        forms = list(kernel.loaded_libraries)
+    if pairs is None:
+        pairs = []
+
+    for name, argument in (("units", units), ("forms", forms), ("pairs", pairs)):
+        if not is_list_or_tuple(argument):
+            raise ValueError(f"warmup() expects '{name}' as a list or tuple.")
+
+    parser = digest_parser(parser)
+    forms = [digest_form(form) for form in forms]
+
+    warmed = 0
+    skipped = []
+
+    for unit_string in units:
+        for form in forms:
+            if form == "string":
+                continue
+            try:
+                unit = convert(unit_string, to_form=form, parser=parser, to_type="unit")
+                _parse_unit_string(unit_string, parser=parser, to_form=form)
+                _target_unit_from_string(unit_string, form, parser)
+                get_dimensionality(unit)
+                if kernel.standards:
+                    get_standard_units(unit, form=form, parser=parser)
+            except Exception:
+                skipped.append((unit_string, form))
+            else:
+                warmed += 1
+
+    for from_unit, to_unit in pairs:
+        scale, offset = conversion_affine(from_unit, to_unit, parser=parser)
+        if offset == 0:
+            conversion_factor(from_unit, to_unit, parser=parser)
+
+    return {"units": warmed, "pairs": len(pairs), "skipped": skipped}
@@ -0,0 +1,110 @@
+"""Precompiled unit policies for cheap activation with ``context()``."""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pyunitwizard import kernel
+from . import configure
+
+
+class Policy:
+    """Named, immutable unit policy compiled once and activated in O(1).
+
+    Building a policy does all the work :func:`pyunitwizard.context` would do
+    on every entry: the standard units are parsed, their dimensionalities
+    derived and the exponent matrices built. ``with puw.context(policy):``
+    then only selects the compiled state, which costs microseconds, and every
+    activation of one policy shares -- and warms -- the same standard-unit
+    cache.
+
+    Settings left unspecified are taken from the configuration current when
+    the policy is built, not when it is activated.
+
+    Parameters
+    ----------
+    standard_units : list of str, optional
+        Standard units of the policy.
+    default_form : str, optional
+        Default form of the policy.
+    default_parser : str, optional
+        Default parser of the policy.
+    workers : int, optional
+        Threads large ndarray conversions are spread over.
+    name : str, optional
+        Name of the policy, reported as the provenance of its standard units.
+
+    Attributes
+    ----------
+    name : str or None
+        Name of the policy.
+    standard_units : tuple of str
+        Standard units of the policy.
+    default_form : str or None
+        Default form of the policy.
+    default_parser : str or None
+        Default parser of the policy.
+    workers : int
+        Threads large ndarray conversions are spread over.
+
+    Examples
+    --------
+    >>> import pyunitwizard as puw
+    >>> md = puw.configure.Policy(standard_units=['nm', 'ps', 'kJ/mol'],
+    ...                           default_form='openmm.unit', name='md')
+    >>> with puw.context(md):
+    ...     q = puw.standardize(input_q)
+    """
+
+    __slots__ = ("name", "standard_units", "default_form", "default_parser", "workers", "_state")
+
+    def __init__(
+        self,
+        standard_units: Optional[List[str]] = None,
+        default_form: Optional[str] = None,
+        default_parser: Optional[str] = None,
+        workers: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        from pyunitwizard.api.context import _snapshot
+
+        state = kernel.current_state().fork(_snapshot)
+        token = kernel.activate(state)
+        try:
+            if default_form is not None:
+                configure.set_default_form(default_form)
+            if default_parser is not None:
+                configure.set_default_parser(default_parser)
+            if workers is not None:
+                configure.set_conversion_workers(workers)
+            if standard_units is not None:
+                configure.set_standard_units(standard_units, provenance=name)
+            elif name is not None:
+                kernel.policy_provenance = name
+        finally:
+            kernel.deactivate(token)
+
+        set_slot = object.__setattr__
+        set_slot(self, "name", name)
+        set_slot(self, "standard_units", tuple(state.standards))
+        set_slot(self, "default_form", state.default_form)
+        set_slot(self, "default_parser", state.default_parser)
+        set_slot(self, "workers", state.conversion_workers)
+        set_slot(self, "_state", state)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Policy objects are immutable; build a new one instead.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Policy objects are immutable; build a new one instead.")
+
+    def __repr__(self) -> str:
+        return (
+            f"Policy(name={self.name!r}, standard_units={list(self.standard_units)!r}, "
+            f"default_form={self.default_form!r}, default_parser={self.default_parser!r})"
+        )
+
+    def _activation_state(self) -> kernel.KernelState:
+        # Shallow: the compiled maps are never mutated in place, because every
+        # configure call replaces them, so the policy itself stays untouched.
+        return self._state.fork(share_caches=True)
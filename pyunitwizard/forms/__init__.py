@@ -1,5 +1,8 @@
+from heapq import heappop as _heappop, heappush as _heappush
 from importlib import import_module as _import_module
 
+from pyunitwizard._private.caches import BoundedCache
+
 dict_is_form={} 
 # These dictionaries contain functions for each of the libraries loaded.
 # For instance, if loaded libraries are pint an openmm.unit dict_is_unit
@@ -16,6 +19,62 @@ dict_convert={}
 dict_dimensionality={}
 dict_compatibility={}
 
+class FormAdapter:
+    """ Every operation of one form, bound once.
+
+        The `dict_*` tables above answer one operation for one form per
+        lookup; a call needing four of them pays for four. An adapter holds
+        them all as slots, so a hot path resolves the form of its input once
+        -- `_adapters_by_type`, keyed on the concrete Python type -- and then
+        calls attributes directly. `translate_quantity` and `translate_unit`
+        are the form's own translation tables, so routes added when another
+        library loads reach existing adapters too.
+
+        Parameters
+        ----------
+        form : str
+            Name of a form whose `dict_*` entries are already filled.
+    """
+
+    __slots__ = ('form', 'is_form', 'is_unit', 'is_quantity', 'get_value', 'get_unit',
+                 'change_value', 'make_quantity', 'convert', 'translate_quantity',
+                 'translate_unit', 'dimensionality', 'compatibility')
+
+    def __init__(self, form: str) -> None:
+        self.form = form
+        self.is_form = dict_is_form[form]
+        self.is_unit = dict_is_unit[form]
+        self.is_quantity = dict_is_quantity[form]
+        self.get_value = dict_get_value[form]
+        self.get_unit = dict_get_unit[form]
+        self.change_value = dict_change_value[form]
+        self.make_quantity = dict_make_quantity[form]
+        self.convert = dict_convert[form]
+        self.translate_quantity = dict_translate_quantity[form]
+        self.translate_unit = dict_translate_unit[form]
+        self.dimensionality = dict_dimensionality[form]
+        self.compatibility = dict_compatibility[form]
+
+    def __repr__(self) -> str:
+        return f"FormAdapter({self.form!r})"
+
+dict_form_adapter={}
+
+# Adapter of each concrete type met so far, filled on first sight by
+# `pyunitwizard.api.introspection._form_adapter`. A plain-indexed FIFO cache:
+# few types ever show up and they all keep coming back.
+_adapters_by_type = BoundedCache("form_adapter", 256, policy="fifo")
+
+# Translation graph. Each loaded library contributes one edge per translator it
+# defines (`quantity_to_<form>` / `unit_to_<form>`), weighted by the cost the
+# adapter declares in its module-level `translation_costs` (1.0 when omitted).
+# An adapter that relays through another form internally declares the cost of
+# the whole relay, so that routing can see through it. The `dict_translate_*`
+# entries between loaded libraries are then the cheapest route over these edges.
+_quantity_translation_edges={} # {in_form: {out_form: (function, cost)}}
+_unit_translation_edges={}
+_translation_routes={} # {('quantity' or 'unit', in_form, out_form): (in_form, ..., out_form)}
+
 _base_package = __name__.replace('.base','')
 _forms_apis_modules = {
     'openmm.unit': 'api_openmm_unit',
@@ -63,73 +122,120 @@ def load_library(library: str) -> None:
     dict_translate_unit['string'][library]= getattr(api_string, 'unit_to_'+library.replace('.','_'))
     del(api_string)
 
-    for method in api.__dict__.keys():
-        if method.startswith('quantity_to_'):
-            out_form = method.replace('quantity_to_','').replace('_','.')
-            if out_form in loaded_libraries:
-                dict_translate_quantity[library][out_form] = getattr(api, method)
-        if method.startswith('unit_to_'):
-            out_form = method.replace('unit_to_','').replace('_','.')
-            if out_form in loaded_libraries:
-                dict_translate_unit[library][out_form] = getattr(api, method)
+    dict_form_adapter[library] = FormAdapter(library)
+    # Types seen before may belong to the adapter just replaced.
+    _adapters_by_type.clear()
 
     if api.parser:
         loaded_parsers.append(library)
 
+    loaded_libraries.append(library)
+
+    # Every loaded library may define a translator towards the new one, so
+    # their edges are collected again before routing.
     for library_loaded in loaded_libraries:
-        api = _import_module('.'+_forms_apis_modules[library_loaded], _base_package)
-        for method in api.__dict__.keys():
-            if method.startswith('quantity_to_'):
-                out_form=method.replace('quantity_to_','').replace('_','.')
-                if out_form == library:
-                    dict_translate_quantity[library_loaded][library]= getattr(api, method)
-                    break
+        _register_translation_edges(library_loaded)
+
+    _route_translations(loaded_libraries)
+
+    pass
+
+def _register_translation_edges(library: str) -> None:
+    """Record the translators a library defines towards the other loaded libraries.
+
+    Parameters
+    ----------
+    library : str
+        Name of a loaded library backend.
+
+    Returns
+    -------
+    None
+        The translation edge registries are updated in place.
+    """
+    from pyunitwizard.kernel import loaded_libraries
+
+    api = _import_module('.'+_forms_apis_modules[library], _base_package)
+    costs = getattr(api, 'translation_costs', {})
+
+    for kind, edges in (('quantity', _quantity_translation_edges), ('unit', _unit_translation_edges)):
+        library_edges = edges.setdefault(library, {})
+        prefix = kind+'_to_'
         for method in api.__dict__.keys():
-            if method.startswith('unit_to_'):
-                out_form=method.replace('unit_to_','').replace('_','.')
-                if out_form == library:
-                    dict_translate_unit[library_loaded][library]= getattr(api, method)
-                    break
+            if method.startswith(prefix):
+                out_form = method.replace(prefix,'').replace('_','.')
+                if out_form != library and out_form in loaded_libraries:
+                    library_edges[out_form] = (getattr(api, method), costs.get(out_form, 1.0))
 
-    loaded_libraries.append(library)
+def _shortest_translation_path(edges: dict, in_form: str, out_form: str, libraries: list):
+    """Return the cheapest chain of forms from `in_form` to `out_form`, or None.
 
-    # Build missing direct translators through Pint as an interoperability hub.
-    # This keeps cross-library conversions available when adapters only define
-    # `to_pint` / `from_pint` pairs.
-    for in_form in list(loaded_libraries):
-        for out_form in list(loaded_libraries):
-            if in_form == out_form:
+    Ties are broken by the number of hops, so a direct translator wins over a
+    relay of equal declared cost.
+    """
+    allowed = set(libraries)
+    best = {in_form: (0.0, 0)}
+    queue = [(0.0, 0, (in_form,))]
+
+    while queue:
+        cost, hops, path = _heappop(queue)
+        node = path[-1]
+        if node == out_form:
+            return path
+        if best.get(node, (cost, hops)) < (cost, hops):
+            continue
+        for next_form, (_, edge_cost) in edges.get(node, {}).items():
+            if next_form not in allowed:
                 continue
+            candidate = (cost+edge_cost, hops+1)
+            if candidate < best.get(next_form, (float('inf'), 0)):
+                best[next_form] = candidate
+                _heappush(queue, (candidate[0], candidate[1], path+(next_form,)))
 
-            if out_form not in dict_translate_quantity.get(in_form, {}):
-                if (
-                    in_form != 'pint'
-                    and 'pint' in dict_translate_quantity.get(in_form, {})
-                    and out_form in dict_translate_quantity.get('pint', {})
-                ):
-                    def _qty_bridge(x, _in=in_form, _out=out_form):
-                        return dict_translate_quantity['pint'][_out](
-                            dict_translate_quantity[_in]['pint'](x)
-                        )
-
-                    dict_translate_quantity[in_form][out_form] = _qty_bridge
-
-            if out_form not in dict_translate_unit.get(in_form, {}):
-                if (
-                    in_form != 'pint'
-                    and 'pint' in dict_translate_unit.get(in_form, {})
-                    and out_form in dict_translate_unit.get('pint', {})
-                ):
-                    def _unit_bridge(x, _in=in_form, _out=out_form):
-                        return dict_translate_unit['pint'][_out](
-                            dict_translate_unit[_in]['pint'](x)
-                        )
-
-                    dict_translate_unit[in_form][out_form] = _unit_bridge
-
-    del(api)
+    return None
 
-    pass
+def _compose_translation(edges: dict, path: tuple):
+    """Return one callable applying the translators along `path` in order."""
+
+    steps = tuple(edges[path[ii]][path[ii+1]][0] for ii in range(len(path)-1))
+
+    if len(steps) == 1:
+        return steps[0]
+
+    def _translate_along_route(quantity_or_unit, _steps=steps):
+        for step in _steps:
+            quantity_or_unit = step(quantity_or_unit)
+        return quantity_or_unit
+
+    return _translate_along_route
+
+def _route_translations(libraries: list) -> None:
+    """Fill `dict_translate_*` between loaded libraries with the cheapest routes.
+
+    Parameters
+    ----------
+    libraries : list of str
+        Names of the loaded library backends.
+
+    Returns
+    -------
+    None
+        The dispatch dictionaries are updated in place.
+    """
+
+    for kind, edges, dispatch in (('quantity', _quantity_translation_edges, dict_translate_quantity),
+                                  ('unit', _unit_translation_edges, dict_translate_unit)):
+        for in_form in libraries:
+            for out_form in libraries:
+                if in_form == out_form:
+                    continue
+                path = _shortest_translation_path(edges, in_form, out_form, libraries)
+                if path is None:
+                    continue
+                if _translation_routes.get((kind, in_form, out_form)) == path and out_form in dispatch[in_form]:
+                    continue
+                dispatch[in_form][out_form] = _compose_translation(edges, path)
+                _translation_routes[(kind, in_form, out_form)] = path
 
 # Load the string api.
 
@@ -147,5 +253,6 @@ dict_translate_quantity['string']={}
 dict_translate_unit['string']={}
 dict_dimensionality['string'] = api.dimensionality
 dict_compatibility['string'] = api.compatibility
+dict_form_adapter['string'] = FormAdapter('string')
 
 del(api)
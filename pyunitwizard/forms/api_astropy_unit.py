@@ -1,5 +1,8 @@
 from typing import Any, Dict, Union
 
+import numpy as np
+
+from pyunitwizard._private.array_literals import format_array, is_summarized
 from pyunitwizard._private.exceptions import LibraryNotFoundError
 from pyunitwizard._private.quantity_or_unit import ArrayLike
 
@@ -11,9 +14,18 @@ except Exception as exc:  # pragma: no cover - handled through exception
 AstropyQuantity = astropy_units.Quantity
 AstropyUnitBase = astropy_units.UnitBase
 
+# "Copy only if needed": `None` under NumPy 2, where `copy=False` forbids copies.
+_COPY_IF_NEEDED = None if np.lib.NumpyVersion(np.__version__) >= '2.0.0' else False
+
 form_name = 'astropy.units'
 parser = True
 
+# Translators below that relay through pint cost both hops.
+translation_costs = {
+    'openmm.unit': 2.0,
+    'unyt': 2.0,
+}
+
 #is_form = {
 #    AstropyQuantity: form_name,
 #    AstropyUnitBase: form_name,
@@ -146,10 +158,11 @@ def make_quantity(value: Union[int, float, ArrayLike],
     Returns
     -------
     astropy.units.Quantity
-        Constructed quantity.
+        Constructed quantity. A floating-point ndarray value is wrapped, not
+        copied; astropy casts integer arrays to float, which needs a new array.
     """
     unit_obj = astropy_units.Unit(unit)
-    return astropy_units.Quantity(value, unit_obj)
+    return astropy_units.Quantity(value, unit_obj, copy=_COPY_IF_NEEDED)
 
 
 def get_value(quantity: AstropyQuantity) -> Union[int, float, ArrayLike]:
@@ -272,6 +285,8 @@ def quantity_to_string(quantity: AstropyQuantity) -> str:
     str
         Quantity represented as string.
     """
+    if is_summarized(quantity.value):
+        return f"{format_array(quantity.value)} {unit_to_string(quantity.unit)}"
     return str(quantity)
 
 
@@ -1,3 +1,5 @@
+from pyunitwizard._private.array_literals import format_array, is_summarized
+from pyunitwizard._private.caches import BoundedCache
 from pyunitwizard._private.exceptions import *
 from pyunitwizard._private.quantity_or_unit import ArrayLike
 from typing import Any, Dict, Union
@@ -10,6 +12,11 @@ except:
 form_name = 'openmm.unit'
 parser = False
 
+# Translators below that relay through pint cost both hops.
+translation_costs = {
+    'astropy.units': 2.0,
+}
+
 #is_form={
 #    openmm_unit.Quantity:form_name,
 #    openmm_unit.Unit:form_name,
@@ -294,6 +301,8 @@ def quantity_to_string(quantity: openmm_unit.Quantity) -> str:
         str
             The quantitity as a string.
     """
+    if is_summarized(quantity._value):
+        return format_array(quantity._value)+' '+unit_to_string(quantity.unit)
     return quantity.__str__()
 
 def unit_to_string(unit: openmm_unit.Unit) -> str:
@@ -314,23 +323,21 @@ def unit_to_string(unit: openmm_unit.Unit) -> str:
 
 ## To Pint
 
-def quantity_to_pint(quantity: openmm_unit.Quantity):
-    """ Transform a quantity from openmm.unit to a pint quantity.
-        
-        Parameters
-        -----------
-        quantity : openmm.unit.Quantity
-            A quanitity.
-        
-        Returns
-        -------
-        pint.Quantity
-            The quantity.
-    """
-    from .api_pint import make_quantity as make_pint_quantity
+# openmm units are immutable and hashable, and a pipeline translates the same
+# handful of them over and over. Deriving the pint unit costs a dimensionality
+# walk plus a pint parse of the rendered name; looking it up costs a hash. The
+# table is keyed on the openmm unit itself, so two units cannot share a row.
+_PINT_UNITS_BY_OPENMM_UNIT: Dict[openmm_unit.Unit, Any] = BoundedCache("openmm_to_pint_unit", 1024)
 
-    value = get_value(quantity)
-    unit = get_unit(quantity)
+
+def _pint_unit_for(unit: openmm_unit.Unit):
+    """Return the pint unit an openmm unit translates to, deriving it once."""
+
+    pint_unit = _PINT_UNITS_BY_OPENMM_UNIT.get(unit)
+    if pint_unit is not None:
+        return pint_unit
+
+    from .api_pint import U_
 
     # MolSysSuite Mass Policy: Translate OpenMM Molar Mass to Pure Mass
     # OpenMM expresses atomic/molar mass as dalton = [M][mol]^-1.
@@ -340,14 +347,35 @@ def quantity_to_pint(quantity: openmm_unit.Quantity):
     # ensures we only match true molar-mass scalars (dalton, amu, g/mol…)
     # and not energy-per-mole quantities like kilojoule_per_mole which share
     # [M]=1 and [mol]=-1 but also carry [L]=2 and [T]=-2.
-    dim = dimensionality(quantity)
+    dim = dimensionality(unit)
     _other_dims = ("[L]", "[T]", "[K]", "[A]", "[Cd]")
     if (dim.get("[M]") == 1 and dim.get("[mol]") == -1
             and all(dim.get(d, 0) == 0 for d in _other_dims)):
         # OpenMM "dalton" ([M]/[mol]) -> Pint "dalton" ([M])
-        return make_pint_quantity(value, "dalton")
+        pint_unit = U_("dalton")
+    else:
+        pint_unit = U_(str(unit))
+
+    _PINT_UNITS_BY_OPENMM_UNIT[unit] = pint_unit
+    return pint_unit
 
-    return make_pint_quantity(value, str(unit))
+
+def quantity_to_pint(quantity: openmm_unit.Quantity):
+    """ Transform a quantity from openmm.unit to a pint quantity.
+        
+        Parameters
+        -----------
+        quantity : openmm.unit.Quantity
+            A quanitity.
+        
+        Returns
+        -------
+        pint.Quantity
+            The quantity.
+    """
+    from .api_pint import make_quantity as make_pint_quantity
+
+    return make_pint_quantity(get_value(quantity), _pint_unit_for(get_unit(quantity)))
 
 def unit_to_pint(unit: openmm_unit.Unit):
     """ Transform a unit from openmm.unit to a pint unit.
@@ -362,11 +390,8 @@ def unit_to_pint(unit: openmm_unit.Unit):
         pint.Unit
             The unit.
     """
-    from .api_pint import get_unit as get_pint_unit
-
-    quantity = quantity_to_pint(1.0*unit)
 
-    return get_pint_unit(quantity)
+    return _pint_unit_for(unit)
 
 
 ## To Unyt
@@ -15,6 +15,14 @@ except Exception as exc:  # pragma: no cover - optional dependency
 form_name = "physipy"
 parser = False
 
+# Translators below that relay through pint cost both hops.
+translation_costs = {
+    "openmm.unit": 2.0,
+    "unyt": 2.0,
+    "astropy.units": 2.0,
+    "quantities": 2.0,
+}
+
 _DIMENSIONS_TRANSLATOR = {
     "L": "[L]",
     "M": "[M]",
@@ -70,6 +78,14 @@ def unit_to_string(unit: PhysipyQuantity) -> str:
     return unit.dimension.str_SI_unit()
 
 
+def _physipy_quantity(value: Union[int, float, ArrayLike], unit: PhysipyQuantity) -> PhysipyQuantity:
+    # physipy stores SI magnitudes, so a value in a scaled unit has to be
+    # multiplied into a new array; in a unit of scale one it is wrapped as is.
+    scale = unit.value
+    value_si = value if scale == 1 else value * scale
+    return PhysipyQuantity(value_si, unit.dimension, favunit=unit)
+
+
 def make_quantity(value: Union[int, float, ArrayLike], unit: Union[str, PhysipyQuantity]) -> PhysipyQuantity:
     from .api_pint import make_quantity as make_pint_quantity
 
@@ -95,7 +111,7 @@ def get_unit(quantity: PhysipyQuantity) -> PhysipyQuantity:
 
 
 def change_value(quantity: PhysipyQuantity, value: Union[int, float, ArrayLike]) -> PhysipyQuantity:
-    return make_quantity(value, get_unit(quantity))
+    return _physipy_quantity(value, get_unit(quantity))
 
 
 def convert(quantity_or_unit: PhysipyQuantity, unit: Union[str, PhysipyQuantity]) -> PhysipyQuantity:
@@ -149,8 +165,7 @@ def quantity_to_physipy(quantity):
 
     unit_expr = f"{get_pint_unit(quantity):~}"
     physipy_unit = eval(unit_expr, {}, physipy_units)
-    value_si = get_pint_value(quantity) * physipy_unit.value
-    return PhysipyQuantity(value_si, physipy_unit.dimension, favunit=physipy_unit)
+    return _physipy_quantity(get_pint_value(quantity), physipy_unit)
 
 
 def unit_to_physipy(unit):
@@ -1,3 +1,5 @@
+from pyunitwizard._private.array_literals import format_array, is_summarized
+from pyunitwizard._private.caches import BoundedCache
 from pyunitwizard._private.exceptions import *
 
 try:
@@ -5,6 +7,7 @@ try:
 except:
     raise LibraryNotFoundError('pint')
 
+import numpy as np
 from typing import Any, Union, Dict
 from pyunitwizard._private.backend_settings import resolve_pint_cache_folder
 from pyunitwizard._private.quantity_or_unit import ArrayLike
@@ -308,6 +311,9 @@ def quantity_to_string(quantity_or_item) -> str:
         str
             The quantitity as a string.
     """
+    magnitude = getattr(quantity_or_item, 'magnitude', None)
+    if is_summarized(magnitude):
+        return format_array(magnitude)+' '+unit_to_string(quantity_or_item.units)
     return quantity_or_item.__str__()
 
 def unit_to_string(unit_or_item) -> str:
@@ -328,6 +334,58 @@ def unit_to_string(unit_or_item) -> str:
 
 ## To openmm.unit
 
+# The openmm unit each pint unit maps to is derived once -- re-parsing the
+# rendered name through `ParserHelper` and resolving every factor by attribute
+# lookup -- and then found by hash. Rows are keyed on the unit's container of
+# names rather than on the unit, because pint refuses to compare units from
+# different registries and other backends hand over units from their own.
+# Each row holds the openmm unit, the number openmm folds out of the product
+# when it mixes compatible units (``ps*fs`` is ``1000 fs**2``), which the value
+# has to be multiplied by, and the product itself. Scalars are multiplied by
+# the product, as they always were, so that they come out with the types
+# openmm's arithmetic gives them; arrays are wrapped without a copy. `None` as
+# unit records a dimensionless unit, which has always translated to a bare
+# value.
+_OPENMM_UNITS_BY_PINT_UNIT: Dict[Any, Any] = BoundedCache("pint_to_openmm_unit", 1024)
+_NOT_CACHED = object()
+
+
+def _openmm_unit_for(unit: pint.Unit):
+    """Return the openmm unit a pint unit translates to, the factor the value
+    takes with it and their product, deriving them once."""
+
+    key = unit._units
+    row = _OPENMM_UNITS_BY_PINT_UNIT.get(key, _NOT_CACHED)
+    if row is not _NOT_CACHED:
+        return row
+
+    from pint.util import ParserHelper as PintParserHelper
+    try:
+        import openmm.unit as openmm_unit
+    except:
+        raise LibraryNotFoundError('openmm')
+
+    pint_parser = PintParserHelper.from_string(unit.__str__())
+    tmp_quantity = 1
+    for unit_name, exponent in pint_parser.items():
+        if unit_name == 'unified_atomic_mass_unit':
+            unit_name = 'amu'
+        tmp_quantity *= getattr(openmm_unit, unit_name)**exponent
+
+    if isinstance(tmp_quantity, openmm_unit.Unit):
+        row = (tmp_quantity, 1, tmp_quantity)
+    elif isinstance(tmp_quantity, openmm_unit.Quantity):
+        row = (tmp_quantity.unit, tmp_quantity._value, tmp_quantity)
+    else:
+        row = (None, tmp_quantity, None)
+    if row[0] is not None and row[0].is_dimensionless():
+        # `dimensionless`, or units cancelling out (nm/angstrom), with the
+        # number they leave behind.
+        row = (None, row[1] * row[0].conversion_factor_to(openmm_unit.dimensionless), None)
+    _OPENMM_UNITS_BY_PINT_UNIT[key] = row
+    return row
+
+
 def quantity_to_openmm_unit(quantity: pint.Quantity):
     """ Transform a quantity from a pint quantity to a openmm.unit quantity.
         
@@ -341,24 +399,22 @@ def quantity_to_openmm_unit(quantity: pint.Quantity):
         openmm_unit.Quantity
             The quantity.
     """
-    from pint.util import ParserHelper as PintParserHelper
-    try:
-        import openmm.unit as openmm_unit
-    except:
-        raise LibraryNotFoundError('openmm')
 
     value = quantity.magnitude
+    openmm_unit_obj, factor, product = _openmm_unit_for(quantity.units)
 
-    pint_parser = PintParserHelper.from_string(quantity.units.__str__())
-    tmp_quantity = 1
-    for unit_name, exponent in pint_parser.items():
-        if unit_name == 'unified_atomic_mass_unit':
-            unit_name = 'amu'
-        tmp_quantity *= getattr(openmm_unit, unit_name)**exponent
+    if openmm_unit_obj is not None and not isinstance(value, np.ndarray):
+        return product * value
+
+    if factor != 1:
+        value = value * factor
+
+    if openmm_unit_obj is None:
+        return value
 
-    tmp_quantity *= value
+    from .api_openmm_unit import make_quantity as make_openmm_quantity
 
-    return tmp_quantity
+    return make_openmm_quantity(value, openmm_unit_obj)
 
 def unit_to_openmm_unit(unit: pint.Unit):
     """ Transform a unit from a pint unit to a openmm.unit unit.
@@ -374,11 +430,13 @@ def unit_to_openmm_unit(unit: pint.Unit):
             The unit.
     """
 
-    from .api_openmm_unit import get_unit as get_openmm_unit_unit
+    openmm_unit_obj = _openmm_unit_for(unit)[0]
 
-    quantity = quantity_to_openmm_unit(1.0*unit)
+    if openmm_unit_obj is None:
+        from .api_openmm_unit import openmm_unit
+        return openmm_unit.dimensionless
 
-    return get_openmm_unit_unit(quantity)
+    return openmm_unit_obj
 
 ## To Unyt
 
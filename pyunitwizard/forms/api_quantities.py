@@ -15,6 +15,14 @@ except Exception as exc:  # pragma: no cover - optional dependency
 form_name = "quantities"
 parser = False
 
+# Translators below that relay through pint cost both hops.
+translation_costs = {
+    "openmm.unit": 2.0,
+    "unyt": 2.0,
+    "astropy.units": 2.0,
+    "physipy": 2.0,
+}
+
 
 def _is_quantity_obj(obj: Any) -> bool:
     return isinstance(obj, QuantitiesQuantity)
@@ -57,6 +65,9 @@ def make_quantity(value: Union[int, float, ArrayLike], unit: Union[str, Quantiti
     if isinstance(unit, str):
         pint_quantity = make_pint_quantity(value, unit)
         return quantity_to_quantities(pint_quantity)
+    if _is_quantity_obj(unit) and _is_scalar_magnitude_one(unit):
+        # Wraps an ndarray value instead of multiplying it into a new array.
+        return QuantitiesQuantity(value, unit)
     return value * unit
 
 
@@ -1,4 +1,5 @@
 from sympy import im
+from pyunitwizard._private.array_literals import format_array, is_summarized
 from pyunitwizard._private.exceptions import *
 from pyunitwizard._private.quantity_or_unit import ArrayLike
 from typing import Any, Dict, Union
@@ -13,6 +14,12 @@ except:
 form_name = 'unyt'
 parser = False
 
+# Translators below that relay through pint cost both hops.
+translation_costs = {
+    'openmm.unit': 2.0,
+    'astropy.units': 2.0,
+}
+
 #is_form = {
 #    unyt_array:    form_name,
 #    unyt_quantity: form_name,
@@ -164,6 +171,9 @@ def get_value(quantity: Union[unyt_array,
         int, float or ArrrayLike
             The value.
     """
+    # `.value` copies; `.ndview` is the array the quantity wraps.
+    if quantity.ndim:
+        return quantity.ndview
     return quantity.value
 
 def get_unit(quantity: Union[unyt_array, 
@@ -282,6 +292,8 @@ def quantity_to_string(quantity: Union[unyt_array,
         str
             The quantitity as a string.
     """
+    if is_summarized(quantity.value):
+        return format_array(quantity.value)+' '+unit_to_string(quantity.units)
     return str(quantity)
 
 def unit_to_string(unit: unyt_unit) -> str:
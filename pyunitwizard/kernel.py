@@ -1,3 +1,120 @@
+"""Runtime state of PyUnitWizard.
+
+The library reads its configuration as ``kernel.<name>``: default form and
+parser, standard units and everything derived from them. Those names are held
+in a :class:`KernelState` picked through a context variable, so
+:func:`pyunitwizard.context` can hand one thread or asyncio task its own
+configuration without any other noticing. Outside every context all threads
+share one global state, and ``puw.configure`` changes it for all of them.
+
+Loaded backends and parsers are capabilities of the process, not
+configuration, and stay plain module globals, as does the conversion factor
+cache: its keys already carry the form and parser its answers depend on.
+"""
+
+import sys
+import types
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Optional
+
+from pyunitwizard._private.caches import BoundedCache
+
+#: Names isolated per context.
+STATE_NAMES = (
+    "default_form",
+    "default_parser",
+    "standards",
+    "dimensional_fundamental_standards",
+    "dimensional_combinations_standards",
+    "adimensional_standards",
+    "tentative_base_standards",
+    "dimensional_fundamental_standards_matrix",
+    "dimensional_fundamental_standards_units",
+    "tentative_base_standards_matrix",
+    "tentative_base_standards_units",
+    "standard_units_by_dimensionality_cache",
+    "standard_units_index",
+    "canonical_standards",
+    "policy_provenance",
+    "conversion_workers",
+)
+
+
+class KernelState:
+    """One complete configuration, as seen by the contexts that select it."""
+
+    __slots__ = STATE_NAMES
+
+    def fork(
+        self, copy: Optional[Callable[[Any], Any]] = None, share_caches: bool = False
+    ) -> "KernelState":
+        """Return an independent state for a context to change.
+
+        Parameters
+        ----------
+        copy : callable, optional
+            Applied to every value to decouple it from this state; values are
+            shared when omitted.
+        share_caches : bool, default False
+            Share the standard-units cache instead of copying it. Safe because
+            ``set_standard_units`` replaces a cache it does not own rather than
+            clearing it, so the forks of one state warm a single cache.
+        """
+
+        forked = KernelState.__new__(KernelState)
+        for name in STATE_NAMES:
+            value = getattr(self, name)
+            if isinstance(value, BoundedCache):
+                if not share_caches:
+                    value = value.fork()
+            elif copy is not None:
+                value = copy(value)
+            setattr(forked, name, value)
+        return forked
+
+
+_global_state = KernelState()
+_current_state: ContextVar = ContextVar("pyunitwizard_kernel_state", default=_global_state)
+
+
+def current_state() -> KernelState:
+    """Return the state selected in the running thread or task."""
+
+    return _current_state.get()
+
+
+def activate(state: KernelState) -> Token:
+    """Select `state` for the running thread or task until :func:`deactivate`."""
+
+    return _current_state.set(state)
+
+
+def deactivate(token: Token) -> None:
+    """Return to the state selected before the matching :func:`activate`."""
+
+    _current_state.reset(token)
+
+
+class _KernelModule(types.ModuleType):
+    """Module type routing the state names to the current state."""
+
+
+def _state_property(name: str) -> property:
+    def fget(module):
+        return getattr(_current_state.get(), name)
+
+    def fset(module, value):
+        setattr(_current_state.get(), name, value)
+
+    return property(fget, fset)
+
+
+for _name in STATE_NAMES:
+    setattr(_KernelModule, _name, _state_property(_name))
+
+sys.modules[__name__].__class__ = _KernelModule
+
+
 def initialize() -> None:
     """Initialize global runtime state containers.
 
@@ -14,39 +131,29 @@ def initialize() -> None:
 
     global loaded_libraries
     global loaded_parsers
-    global default_form
-    global default_parser
-    global standards
-    global dimensional_fundamental_standards
-    global dimensional_combinations_standards
-    global adimensional_standards
-    global tentative_base_standards
-    global dimensional_fundamental_standards_matrix
-    global dimensional_fundamental_standards_units
-    global tentative_base_standards_matrix
-    global tentative_base_standards_units
-    global standard_units_by_dimensionality_cache
     global conversion_factor_cache
-    global canonical_standards
-    global policy_provenance
 
     loaded_libraries = []
     loaded_parsers = []
-    default_form = None
-    default_parser = None
-    standards = {}
-    dimensional_fundamental_standards = {}
-    dimensional_combinations_standards = {}
-    adimensional_standards = {}
-    tentative_base_standards = {}
-    dimensional_fundamental_standards_matrix = None
-    dimensional_fundamental_standards_units = None
-    tentative_base_standards_matrix = None
-    tentative_base_standards_units = None
-    standard_units_by_dimensionality_cache = {}
-    conversion_factor_cache = {}
-    canonical_standards = []
-    policy_provenance = None
+    conversion_factor_cache = BoundedCache("conversion_factor", 4096)
+
+    state = _global_state
+    state.default_form = None
+    state.default_parser = None
+    state.standards = {}
+    state.dimensional_fundamental_standards = {}
+    state.dimensional_combinations_standards = {}
+    state.adimensional_standards = {}
+    state.tentative_base_standards = {}
+    state.dimensional_fundamental_standards_matrix = None
+    state.dimensional_fundamental_standards_units = None
+    state.tentative_base_standards_matrix = None
+    state.tentative_base_standards_units = None
+    state.standard_units_by_dimensionality_cache = BoundedCache("standard_units", 1024)
+    state.standard_units_index = {}
+    state.canonical_standards = []
+    state.policy_provenance = None
+    state.conversion_workers = 1
 
 
 order_fundamental_units = ['[L]', '[M]', '[T]', '[K]', '[mol]', '[A]', '[Cd]']
@@ -4,30 +4,36 @@ from ._private.forms import digest_to_form
 from ._private.parsers import digest_parser
 from .forms import dict_translate_quantity
 from . import kernel
-import ast
-from typing import Optional
-from functools import lru_cache
+import re
+from typing import Any, Optional, Tuple
+from ._private.array_literals import literal_value
+from ._private.caches import memoize
+from ._private.unit_keys import unit_key
+
+# Only the brackets are visited, not every character of a long literal.
+_BRACKETS = re.compile(r"[\[\]]")
+_PARENTHESES = re.compile(r"[()]")
 
 def _find_closing_bracket_position(string):
     stack = 0
-    for i, char in enumerate(string):
-        if char == '[':
+    for match in _BRACKETS.finditer(string):
+        if match.group() == '[':
             stack += 1
-        elif char == ']':
+        else:
             stack -= 1
             if stack == 0:
-                return i
+                return match.start()
     raise ValueError  # If there is no closing bracket
 
 def _find_closing_parenthesis_position(string):
     stack = 0
-    for i, char in enumerate(string):
-        if char == '(':
+    for match in _PARENTHESES.finditer(string):
+        if match.group() == '(':
             stack += 1
-        elif char == ')':
+        else:
             stack -= 1
             if stack == 0:
-                return i
+                return match.start()
     raise ValueError  # If there is no closing parenthesis
 
 def _parse_with_pint(string: str):
@@ -50,7 +56,7 @@ def _parse_with_pint(string: str):
         value_string = string[:(end_list+1)]
         unit_string = string[(end_list+1):]
 
-        return ast.literal_eval(value_string)*dict_translate_quantity['string']['pint'](unit_string)
+        return literal_value(value_string)*dict_translate_quantity['string']['pint'](unit_string)
 
     elif string.startswith('('):
 
@@ -58,11 +64,97 @@ def _parse_with_pint(string: str):
         value_string = string[:(end_list+1)]
         unit_string = string[(end_list+1):]
 
-        return ast.literal_eval(value_string)*dict_translate_quantity['string']['pint'](unit_string)
+        return literal_value(value_string)*dict_translate_quantity['string']['pint'](unit_string)
 
     else:
        return dict_translate_quantity['string']['pint'](string)
 
+# A scalar literal followed by its unit, as in "1.5 nm" or "-2e-3 kJ/mol".
+_SCALAR_PREFIX = re.compile(r"\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)(?![\d.])\s*")
+
+# Exponents are the only numbers a plain unit expression may carry.
+_UNIT_EXPONENT = re.compile(r"(?:\*\*|\^)\s*\(?\s*[+-]?\d+(?:\.\d+)?(?:\s*/\s*\d+)?\s*\)?")
+_NOT_A_UNIT = re.compile(r"[\d.+\-]")
+
+
+def _is_unit_expression(unit_string: str) -> bool:
+    """Whether `unit_string` is units only, with no numbers but exponents.
+
+    Only then is ``value unit_string`` the same as ``value * (unit_string)``:
+    in ``"5 m / 2 s"`` the unit part would bring its own factor.
+    """
+
+    if not unit_string or unit_string[0] in "*/":
+        return False
+    return _NOT_A_UNIT.search(_UNIT_EXPONENT.sub("", unit_string)) is None
+
+
+def _split_value(string: str) -> Optional[Tuple[Any, str]]:
+    """Split a string quantity into its value and its unit string.
+
+    Handles a scalar, a ``[...]`` list or a ``(...)`` tuple followed by a plain
+    unit expression. Returns ``None`` for anything else -- expressions, bare
+    numbers or units, malformed input -- which is then parsed whole.
+    """
+
+    if string.startswith('[') or string.startswith('('):
+        try:
+            if string.startswith('['):
+                end_list = _find_closing_bracket_position(string)
+            else:
+                end_list = _find_closing_parenthesis_position(string)
+            unit_string = string[(end_list+1):].strip()
+            if not _is_unit_expression(unit_string):
+                return None
+            return literal_value(string[:(end_list+1)]), unit_string
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+            return None
+
+    match = _SCALAR_PREFIX.match(string)
+    if match is None:
+        return None
+
+    unit_string = string[match.end():].strip()
+    if not _is_unit_expression(unit_string):
+        return None
+
+    number = match.group(1)
+    if any(symbol in number for symbol in ".eE"):
+        return float(number), unit_string
+    return int(number), unit_string
+
+
+def _parse_split(string: str, parser: str, to_form: str):
+    """Parse `string` as its value times its cached unit, or return ``None``.
+
+    Only the unit part goes through the parser, so ``"1.0 nm"`` and
+    ``"2.0 nm"`` share one cache entry. The value is multiplied onto the unit
+    in the parser's form and the product translated, as a whole-string parse
+    would, so that it comes out with the type that parse gives it: pint's
+    ``2 * kJ / mol`` divides into ``2.0``, openmm keeps the ``1`` of
+    ``1 kJ/mol``.
+    """
+
+    split = _split_value(string)
+    if split is None:
+        return None
+
+    value, unit_string = split
+
+    try:
+        unit_quantity = _parse_unit_cached(unit_string, parser, parser)
+        if unit_quantity is None:
+            return None
+        quantity = value * unit_quantity
+        if to_form == parser:
+            return quantity
+        return dict_translate_quantity[parser][to_form](quantity)
+    except Exception:
+        # Unknown names, unsupported forms and the like: the whole-string
+        # parse raises exactly the error it always has.
+        return None
+
+
 def _resolve_parser(string: str, parser: Optional[str], to_form: Optional[str]) -> str:
     if parser is not None:
         return digest_parser(parser)
@@ -76,7 +168,7 @@ def _resolve_parser(string: str, parser: Optional[str], to_form: Optional[str])
     return digest_parser(None)
 
 
-@lru_cache(maxsize=1024)
+@memoize("parse", 1024)
 def _parse_cached(string: str, parser: str, to_form: str):
     if not isinstance(string, str):
         raise BadCallError('string')
@@ -139,6 +231,30 @@ def _parse_cached(string: str, parser: str, to_form: str):
         raise NotImplementedParserError(parser, to_form)
 
 
+@memoize(
+    "parse_unit",
+    256,
+    key=lambda unit_string, parser, to_form: (unit_key(unit_string, parser), parser, to_form),
+)
+def _parse_unit_cached(unit_string: str, parser: str, to_form: str):
+    """Return the quantity ``1 unit_string`` in `to_form`.
+
+    ``None`` when a value cannot simply multiply the unit, as with offset
+    units such as ``degC``: ``5 * degC`` is ambiguous in pint, while some
+    forms would quietly turn it into an absolute temperature.
+    """
+
+    unit_quantity = _parse_cached(unit_string, parser, parser)
+    try:
+        2 * unit_quantity
+    except Exception:
+        return None
+
+    if to_form == parser:
+        return unit_quantity
+    return _parse_cached(unit_string, parser, to_form)
+
+
 from smonitor import signal
 
 
@@ -166,4 +282,12 @@ def parse(string: str, parser: Optional[str]=None, to_form: Optional[str]=None):
 
     to_form = digest_to_form(to_form)
     parser = _resolve_parser(string, parser, to_form)
+
+    # Values vary far more than units do: caching whole strings would spend
+    # one entry, and one full parse, per distinct number.
+    if parser == 'pint' and isinstance(string, str):
+        quantity = _parse_split(string, parser, to_form)
+        if quantity is not None:
+            return quantity
+
     return _parse_cached(string, parser, to_form)
@@ -12,6 +12,7 @@ from .vstack import vstack
 from .column_stack import column_stack
 from .repeat import repeat
 from .ops import mean, std, sum, var, linalg_norm, dot, trapz
+from .memmap import memmap_quantity, save_quantity
 
 _NUMPY_PATCH_STATE = {
     "enabled": False,
@@ -154,6 +155,8 @@ __all__ = [
     "linalg_norm",
     "dot",
     "trapz",
+    "memmap_quantity",
+    "save_quantity",
     "setup_numpy",
     "numpy_context",
 ]
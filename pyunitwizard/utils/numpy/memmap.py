@@ -0,0 +1,122 @@
+import json
+
+import numpy as np
+
+from pyunitwizard import convert, get_unit, get_value, quantity
+
+
+UNIT_METADATA_SUFFIX = ".unit.json"
+
+
+def _metadata_path(path):
+    return str(path) + UNIT_METADATA_SUFFIX
+
+
+def _write_unit(path, unit):
+    unit_name = convert(unit, to_form="string", to_type="unit")
+    with open(_metadata_path(path), "w") as handle:
+        json.dump({"unit": unit_name}, handle)
+
+
+def _is_npy_file(path):
+    with open(path, "rb") as handle:
+        return handle.read(6) == b"\x93NUMPY"
+
+
+def _read_unit(path):
+    try:
+        with open(_metadata_path(path), "r") as handle:
+            metadata = json.load(handle)
+    except FileNotFoundError:
+        raise ValueError(
+            f"No unit metadata found for '{path}'. Pass unit= explicitly or save the "
+            "array with save_quantity()."
+        ) from None
+
+    return metadata["unit"]
+
+
+def save_quantity(path, quantity_like):
+    """Write a quantity as a ``.npy`` value file plus a unit metadata sidecar.
+
+    The value goes to `path` exactly as given -- no ``.npy`` suffix is appended
+    -- and the unit, as a string, to ``path + '.unit.json'``. The pair reopens
+    with :func:`memmap_quantity`.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Destination of the value array.
+    quantity_like : QuantityLike
+        Quantity to save. Its value is written in its own unit.
+
+    Returns
+    -------
+    None
+    """
+
+    value = np.asarray(get_value(quantity_like))
+
+    with open(path, "wb") as handle:
+        np.save(handle, value)
+
+    _write_unit(path, get_unit(quantity_like))
+
+
+def memmap_quantity(path, unit=None, mode="r", form=None, dtype=None, shape=None, offset=0):
+    """Open an array file as a quantity without reading it into memory.
+
+    ``.npy`` files are mapped with ``np.load(mmap_mode=mode)`` -- or created
+    with ``np.lib.format.open_memmap`` when `mode` is ``'w+'`` and the path
+    ends in ``.npy`` -- and any other file is mapped as raw binary with
+    ``np.memmap``. The map is then wrapped,
+    not copied, as a quantity of the requested form, so values are paged in
+    only when touched.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Array file.
+    unit : UnitLike, optional
+        Unit of the stored values. Read from the sidecar written by
+        :func:`save_quantity` when omitted. Required to create a file, and
+        then saved next to it.
+    mode : {'r', 'r+', 'w+', 'c'}, default 'r'
+        Memory-map mode, as in ``np.memmap``.
+    form : str, optional
+        Form of the returned quantity; the default form when omitted.
+    dtype : data-type, optional
+        Element type of a created or raw binary file; ``float64`` by default.
+        Ignored when reading ``.npy`` files, which record their own.
+    shape : tuple of int, optional
+        Array shape. Required to create a file.
+    offset : int, default 0
+        Byte offset of the data in a raw binary file.
+
+    Returns
+    -------
+    QuantityLike
+        Quantity whose value is the memory map. Backends that store scaled
+        magnitudes (physipy with a non-SI unit) need a converted copy instead.
+    """
+
+    if dtype is None:
+        dtype = np.float64
+
+    if mode == "w+":
+        if unit is None or shape is None:
+            raise ValueError("memmap_quantity with mode='w+' requires unit and shape.")
+        _write_unit(path, unit)
+        if str(path).endswith(".npy"):
+            array = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+        else:
+            array = np.memmap(path, dtype=dtype, mode="w+", shape=shape, offset=offset)
+    elif _is_npy_file(path):
+        array = np.load(path, mmap_mode=mode)
+    else:
+        array = np.memmap(path, dtype=dtype, mode=mode, shape=shape, offset=offset)
+
+    if unit is None:
+        unit = _read_unit(path)
+
+    return quantity(array, unit, form=form)
@@ -25,3 +25,23 @@ def test_api_openmm_unit_translation_helpers():
 
     astropy_unit = puw.forms.api_openmm_unit.unit_to_astropy_units(unit)
     assert "m" in str(astropy_unit)
+
+
+def test_api_openmm_to_pint_reuses_the_translated_unit():
+    api = puw.forms.api_openmm_unit
+    openmm_unit = api.openmm_unit
+    unit = openmm_unit.nanometer/openmm_unit.picosecond
+
+    quantity = api.quantity_to_pint(openmm_unit.Quantity(2.5, unit))
+    assert quantity.magnitude == 2.5
+    assert str(quantity.units) == "nanometer / picosecond"
+    assert api._PINT_UNITS_BY_OPENMM_UNIT[unit] == quantity.units
+    assert api.unit_to_pint(unit) is api._PINT_UNITS_BY_OPENMM_UNIT[unit]
+
+
+def test_api_openmm_to_pint_keeps_the_molar_mass_policy():
+    api = puw.forms.api_openmm_unit
+    openmm_unit = api.openmm_unit
+
+    assert str(api.unit_to_pint(openmm_unit.dalton)) == "dalton"
+    assert str(api.unit_to_pint(openmm_unit.kilojoule_per_mole)) == "kilojoule / mole"
@@ -18,3 +18,55 @@ def test_api_pint_string_to_unit_and_translation_helpers():
 
     astropy_unit = api.unit_to_astropy_units(ureg.nanometer)
     assert "nm" in str(astropy_unit).lower() or "nanometer" in str(astropy_unit).lower()
+
+
+def test_api_pint_to_openmm_reuses_the_translated_unit():
+    import numpy as np
+
+    api = puw.forms.api_pint
+    openmm_unit = puw.forms.api_openmm_unit.openmm_unit
+    value = np.array([1.0, 2.0])
+
+    quantity = api.quantity_to_openmm_unit(api.Q_(value, "nanometer/picosecond"))
+    assert quantity.unit == openmm_unit.nanometer/openmm_unit.picosecond
+    assert np.array_equal(quantity._value, value)
+    assert api.unit_to_openmm_unit(api.U_("nanometer/picosecond")) is quantity.unit
+
+    assert api.unit_to_openmm_unit(api.U_("dalton")) == openmm_unit.amu
+
+
+def test_api_pint_to_openmm_keeps_the_factor_of_mixed_units():
+    import numpy as np
+    import pytest
+
+    api = puw.forms.api_pint
+
+    for unit, value, expected in [
+        ("kilojoule/(mole*nanometer*angstrom)", 3.0, 0.3),
+        ("picosecond*femtosecond", 2.0, 2000.0),
+        ("nanometer**2/angstrom", 2.0, 20.0),
+    ]:
+        # Twice: the second call reads the translated unit from the table.
+        for _ in range(2):
+            quantity = api.quantity_to_openmm_unit(api.Q_(value, unit))
+            assert quantity._value == pytest.approx(expected)
+
+    quantity = api.quantity_to_openmm_unit(api.Q_(np.array([1.0, 2.0]), "picosecond*femtosecond"))
+    assert np.allclose(quantity._value, [1000.0, 2000.0])
+    back = puw.forms.api_openmm_unit.quantity_to_pint(quantity)
+    assert np.allclose(back.to("picosecond*femtosecond").magnitude, [1.0, 2.0])
+
+
+def test_api_pint_to_openmm_gives_bare_values_for_dimensionless_units():
+    api = puw.forms.api_pint
+    openmm_unit = puw.forms.api_openmm_unit.openmm_unit
+
+    for _ in range(2):
+        assert api.quantity_to_openmm_unit(api.Q_(2.0, "dimensionless")) == 2.0
+        assert type(api.quantity_to_openmm_unit(api.Q_(2.0, "dimensionless"))) is float
+    assert api.quantity_to_openmm_unit(api.Q_(2.0, "nanometer/angstrom")) == 20.0
+    assert api.unit_to_openmm_unit(api.U_("dimensionless")) == openmm_unit.dimensionless
+
+    quantity = puw.forms.api_openmm_unit.quantity_to_pint(2.0*openmm_unit.dimensionless)
+    assert quantity == api.Q_(2.0, "dimensionless")
+    assert api.quantity_to_openmm_unit(quantity) == 2.0
@@ -0,0 +1,51 @@
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard import forms
+from tests.helpers import loaded_libraries
+
+
+def test_translation_graph_routes_missing_translators_through_the_cheapest_hub():
+    pytest.importorskip("physipy")
+
+    with loaded_libraries(["pint", "openmm.unit", "physipy"]):
+        assert forms._translation_routes[("quantity", "openmm.unit", "physipy")] == (
+            "openmm.unit", "pint", "physipy")
+
+        openmm_unit = puw.forms.api_openmm_unit.openmm_unit
+        physipy_quantity = forms.dict_translate_quantity["openmm.unit"]["physipy"](
+            2.0*openmm_unit.nanometer)
+        assert puw.get_form(physipy_quantity) == "physipy"
+        pint_quantity = forms.dict_translate_quantity["physipy"]["pint"](physipy_quantity)
+        assert pint_quantity.to("nanometer").magnitude == pytest.approx(2.0)
+
+
+def test_translation_graph_keeps_direct_translators_on_ties():
+    with loaded_libraries(["pint", "openmm.unit", "astropy.units"]):
+        api = puw.forms.api_openmm_unit
+        assert forms._translation_routes[("quantity", "openmm.unit", "astropy.units")] == (
+            "openmm.unit", "astropy.units")
+        assert forms.dict_translate_quantity["openmm.unit"]["astropy.units"] is api.quantity_to_astropy_units
+        assert forms.dict_translate_unit["openmm.unit"]["pint"] is api.unit_to_pint
+
+
+def test_shortest_translation_path_prefers_cheaper_relays():
+    edges = {
+        "a": {"b": (None, 5.0), "c": (None, 1.0)},
+        "c": {"b": (None, 1.0), "d": (None, 1.0)},
+        "d": {"b": (None, 0.5)},
+    }
+
+    assert forms._shortest_translation_path(edges, "a", "b", ["a", "b", "c", "d"]) == ("a", "c", "b")
+    assert forms._shortest_translation_path(edges, "a", "b", ["a", "b", "d"]) == ("a", "b")
+    assert forms._shortest_translation_path(edges, "b", "a", ["a", "b", "c", "d"]) is None
+
+
+def test_compose_translation_applies_every_step_in_order():
+    edges = {
+        "a": {"b": (lambda x: x+1, 1.0)},
+        "b": {"c": (lambda x: x*10, 1.0)},
+    }
+
+    assert forms._compose_translation(edges, ("a", "b"))(1) == 2
+    assert forms._compose_translation(edges, ("a", "b", "c"))(1) == 20
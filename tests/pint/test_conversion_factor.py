@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 import pyunitwizard as puw
@@ -35,22 +36,99 @@ def test_conversion_factor_is_cached():
     puw.configure.reset()
     puw.configure.load_library(['pint'])
 
+    # Keys hold the canonical spelling of each unit.
     assert not any(
-        k[0] == 'nm' and k[1] == 'angstroms'
+        k[0] == 'nanometer' and k[1] == 'angstrom'
         for k in kernel.conversion_factor_cache
     )
     first = puw.conversion_factor('nm', 'angstroms')
     assert any(
-        k[0] == 'nm' and k[1] == 'angstroms'
+        k[0] == 'nanometer' and k[1] == 'angstrom'
         for k in kernel.conversion_factor_cache
     )
     second = puw.conversion_factor('nm', 'angstroms')
     assert first == second
 
 
+def test_conversion_factor_spellings_share_a_cache_entry():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+
+    first = puw.conversion_factor('nm', 'angstroms')
+    size = len(kernel.conversion_factor_cache)
+    for from_unit, to_unit in [('nanometer', 'angstrom'), ('nanometres', 'Å'), (' nm ', '1 angstrom')]:
+        assert puw.conversion_factor(from_unit, to_unit) == first
+    assert len(kernel.conversion_factor_cache) == size
+
+    assert puw.conversion_factor('nm^2', 'angstrom ** 2') == pytest.approx(100.0)
+    grown = len(kernel.conversion_factor_cache)
+    assert grown > size
+    puw.conversion_factor('nanometer**2', 'angstroms^2')
+    assert len(kernel.conversion_factor_cache) == grown
+
+
 def test_conversion_factor_affine_units_raise():
     puw.configure.reset()
     puw.configure.load_library(['pint'])
 
     with pytest.raises(ArgumentError):
         puw.conversion_factor('degC', 'kelvin')
+
+
+def test_conversion_affine_temperature():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+
+    scale, offset = puw.conversion_affine('degC', 'kelvin')
+    assert scale == 1.0
+    assert offset == pytest.approx(273.15)
+
+    scale, offset = puw.conversion_affine('degF', 'degC')
+    assert scale == pytest.approx(5.0 / 9.0)
+    assert offset == pytest.approx(-32.0 * 5.0 / 9.0)
+
+
+def test_conversion_affine_of_multiplicative_pair_matches_factor():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+
+    assert puw.conversion_affine('nm', 'angstroms') == (
+        puw.conversion_factor('nm', 'angstroms'),
+        0.0,
+    )
+
+
+def test_conversion_affine_is_cached_alongside_factors():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+
+    first = puw.conversion_affine('degC', 'kelvin')
+    assert any(
+        k[0] == 'affine' and k[1] == 'degree_Celsius' and k[2] == 'kelvin'
+        for k in kernel.conversion_factor_cache
+    )
+    assert puw.conversion_affine('degC', 'kelvin') is first
+
+
+def test_convert_magnitude_matches_convert_for_offset_units():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+
+    values = np.array([-40.0, 0.0, 25.0, 100.0])
+    expected = puw.get_value(puw.quantity(values, 'degC'), to_unit='kelvin')
+
+    np.testing.assert_allclose(
+        puw.convert_magnitude(values, 'degC', 'kelvin'), expected
+    )
+    assert puw.convert_magnitude(25.0, 'degC', 'kelvin') == pytest.approx(298.15)
+
+
+def test_convert_magnitude_writes_into_out_buffer():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+
+    values = np.array([0.0, 25.0])
+    output = puw.convert_magnitude(values, 'degC', 'kelvin', out=values)
+
+    assert output is values
+    np.testing.assert_allclose(values, [273.15, 298.15])
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private.array_literals import (
+    READ_ARRAY_MIN_LENGTH,
+    format_array,
+    literal_value,
+    read_array,
+)
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+def test_read_array_reads_commas_and_spaces_alike():
+    expected = np.array([[1.5, -2e-3], [3.0, 4.0]])
+
+    for literal in ("[[1.5, -2e-3], [3.0, 4.0]]", "[[1.5 -2e-3] [3.0 4.0]]", "[[1.5 -2e-3]\n [3.0 4.0]]"):
+        value = read_array(literal)
+        assert value.shape == (2, 2)
+        assert np.array_equal(value, expected)
+
+    assert read_array("[1, 2, 3]").dtype == np.int64
+
+
+@pytest.mark.parametrize(
+    "literal",
+    ["[[1 2] [3]]", "[[1 2] 3]", "[1 [2 3]]", "[[1 2] []]", "[1 2]]", "[1 2] [3]", "[True]", "['a']", "[1+2j]"],
+)
+def test_read_array_leaves_anything_else_to_literal_eval(literal):
+    assert read_array(literal) is None
+
+
+def test_literal_value_keeps_literal_eval_below_threshold_only():
+    assert literal_value("[1, 2, 3]") == [1, 2, 3]
+    assert literal_value("(1, 2)") == (1, 2)
+    assert np.array_equal(literal_value("[1 2 3]"), [1, 2, 3])
+
+    long_literal = repr(list(range(READ_ARRAY_MIN_LENGTH)))
+    value = literal_value(long_literal)
+    assert isinstance(value, np.ndarray)
+    assert value.tolist() == list(range(READ_ARRAY_MIN_LENGTH))
+
+    with pytest.raises(SyntaxError):
+        literal_value("[1 2 'a']")
+
+
+def test_format_array_is_read_back_exactly():
+    values = np.random.default_rng(0).random((3, 5, 4))
+    assert np.array_equal(read_array(format_array(values)), values)
+
+
+@pytest.mark.parametrize("form", ["pint", "openmm.unit", "unyt", "astropy.units"])
+def test_large_array_quantities_round_trip_through_string(form):
+    puw.configure.reset()
+    puw.configure.load_library(["pint", form])
+    puw.configure.set_default_parser("pint")
+
+    values = np.random.default_rng(1).random((50, 40))
+    quantity = puw.quantity(values, "nanometer", form=form)
+
+    string = puw.convert(quantity, to_form="string")
+    assert "..." not in string
+
+    output = puw.convert(string, to_form=form)
+    assert np.array_equal(puw.get_value(output), values)
+    assert puw.get_unit(output, to_form="string") == puw.get_unit(quantity, to_form="string")
+
+
+def test_small_array_quantities_keep_their_string_form():
+    puw.configure.reset()
+    puw.configure.load_library(["pint"])
+
+    quantity = puw.quantity(np.array([1.0, 2.0]), "nanometer", form="pint")
+    assert puw.convert(quantity, to_form="string") == str(quantity)
+    assert np.array_equal(puw.get_value(puw.convert(str(quantity), to_form="pint")), [1.0, 2.0])
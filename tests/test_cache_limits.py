@@ -0,0 +1,105 @@
+import pytest
+
+import pyunitwizard as puw
+
+
+def setup_function():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+def test_cache_stats_counts_hits_and_misses():
+    puw.convert('nm', to_form='pint')
+    puw.convert('nm', to_form='pint')
+
+    stats = puw.configure.cache_stats()['parse']
+    assert stats['size'] == 1
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+    assert stats['maxsize'] == 1024
+    assert stats['policy'] == 'lru'
+
+
+def test_set_cache_limits_evicts_oldest_entries():
+    puw.configure.set_cache_limits({'parse': 2})
+
+    for unit in ('nm', 'ps', 'fs'):
+        puw.convert(unit, to_form='pint')
+
+    stats = puw.configure.cache_stats()['parse']
+    assert stats['size'] == 2
+    assert stats['evictions'] == 1
+
+
+def test_lru_policy_keeps_recently_used_entries():
+    from pyunitwizard.parse import _parse_cached
+
+    puw.configure.set_cache_limits({'parse': 2}, policy='lru')
+    puw.convert('nm', to_form='pint')
+    puw.convert('ps', to_form='pint')
+    puw.convert('nm', to_form='pint')
+    puw.convert('fs', to_form='pint')
+
+    assert [key[0] for key in _parse_cached.cache] == ['nm', 'fs']
+
+
+def test_fifo_policy_evicts_in_insertion_order():
+    from pyunitwizard.parse import _parse_cached
+
+    puw.configure.set_cache_limits({'parse': 2}, policy='fifo')
+    puw.convert('nm', to_form='pint')
+    puw.convert('ps', to_form='pint')
+    puw.convert('nm', to_form='pint')
+    puw.convert('fs', to_form='pint')
+
+    assert [key[0] for key in _parse_cached.cache] == ['ps', 'fs']
+
+
+def test_reset_restores_default_limits():
+    puw.configure.set_cache_limits(8, policy='fifo')
+    puw.configure.reset()
+
+    stats = puw.configure.cache_stats()
+    assert stats['conversion_factor']['maxsize'] == 4096
+    assert stats['parse']['policy'] == 'lru'
+    assert stats['type_to_form']['policy'] == 'fifo'
+
+
+def test_set_cache_limits_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        puw.configure.set_cache_limits({'no_such_cache': 10})
+    with pytest.raises(ValueError):
+        puw.configure.set_cache_limits(-1)
+    with pytest.raises(ValueError):
+        puw.configure.set_cache_limits(policy='random')
+
+
+def test_bounded_cache_tolerates_concurrent_eviction():
+    import threading
+
+    from pyunitwizard._private.caches import BoundedCache
+
+    cache = BoundedCache('concurrency_test', 8, register=False)
+    errors = []
+
+    def hammer(offset):
+        try:
+            for i in range(20000):
+                key = (offset + i) % 32
+                if cache.get(key) is None:
+                    cache[key] = i
+        except Exception as error:  # pragma: no cover - reported below
+            errors.append(error)
+
+    threads = [threading.Thread(target=hammer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(cache) <= 8
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private.exceptions import ArgumentError
+
+
+def _configure(libraries=("pint",)):
+    puw.configure.reset()
+    puw.configure.load_library(list(libraries))
+
+
+def test_compiled_plan_matches_convert_for_quantities():
+    _configure()
+
+    plan = puw.compile_conversion("nm", "angstroms")
+    quantity = puw.quantity(np.array([0.1, 1.5, 2.0]), "nm")
+
+    output = plan(quantity)
+    expected = puw.convert(quantity, to_unit="angstroms")
+
+    assert puw.get_form(output) == "pint"
+    assert str(puw.get_unit(output)) == str(puw.get_unit(expected))
+    np.testing.assert_array_equal(puw.get_value(output), puw.get_value(expected))
+
+
+def test_compiled_plan_scales_bare_magnitudes():
+    _configure()
+
+    plan = puw.compile_conversion("nm", "angstroms", to_type="value")
+
+    assert plan(1.5) == pytest.approx(15.0)
+    np.testing.assert_allclose(plan(np.array([1.0, 2.0])), [10.0, 20.0])
+    np.testing.assert_allclose(plan([1.0, 2.0]), [10.0, 20.0])
+    assert plan.factor == pytest.approx(puw.conversion_factor("nm", "angstroms"))
+
+
+def test_compiled_plan_translates_between_forms():
+    _configure(("pint", "openmm.unit"))
+
+    plan = puw.compile_conversion(
+        "nm", "angstroms", from_form="openmm.unit", to_form="pint"
+    )
+    output = plan(puw.quantity(2.0, "nm", form="openmm.unit"))
+
+    assert puw.get_form(output) == "pint"
+    assert puw.get_value(output) == pytest.approx(20.0)
+
+    unit_plan = puw.compile_conversion("nm", "angstroms", to_type="unit")
+    assert str(unit_plan(3.0)) == "angstrom"
+
+
+def test_compile_conversion_rejects_affine_units():
+    _configure()
+
+    with pytest.raises(ArgumentError):
+        puw.compile_conversion("degC", "kelvin")
+
+
+def test_compile_conversion_rejects_string_form_and_invalid_type():
+    _configure()
+
+    with pytest.raises(ArgumentError):
+        puw.compile_conversion("nm", "angstroms", to_form="string")
+
+    with pytest.raises(ArgumentError):
+        puw.compile_conversion("nm", "angstroms", to_type="invalid")
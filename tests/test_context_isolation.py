@@ -0,0 +1,90 @@
+import asyncio
+import threading
+
+import pyunitwizard as puw
+from pyunitwizard import kernel
+
+
+def setup_function():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+    puw.configure.set_default_form('pint')
+    puw.configure.set_standard_units(['nm', 'ps'])
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+def test_contexts_in_concurrent_threads_do_not_see_each_other():
+    barrier = threading.Barrier(2, timeout=10)
+    seen = {}
+    errors = []
+
+    def worker(name, standards):
+        try:
+            with puw.context(standard_units=standards):
+                barrier.wait()
+                length = puw.standardize(puw.quantity(1.0, 'angstrom'))
+                barrier.wait()
+                seen[name] = (list(kernel.standards), str(puw.get_unit(length)))
+        except Exception as error:  # pragma: no cover - reported below
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=worker, args=('a', ['angstrom', 'fs'])),
+        threading.Thread(target=worker, args=('b', ['m', 's'])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert seen['a'] == (['angstrom', 'fs'], 'angstrom')
+    assert seen['b'] == (['m', 's'], 'meter')
+    assert list(kernel.standards) == ['nm', 'ps']
+
+
+def test_contexts_in_concurrent_tasks_do_not_see_each_other():
+    async def task(standards, started, proceed):
+        with puw.context(standard_units=standards):
+            started.set()
+            await proceed.wait()
+            return list(kernel.standards)
+
+    async def main():
+        started_a, started_b, proceed = asyncio.Event(), asyncio.Event(), asyncio.Event()
+        a = asyncio.create_task(task(['angstrom'], started_a, proceed))
+        b = asyncio.create_task(task(['m'], started_b, proceed))
+        await started_a.wait()
+        await started_b.wait()
+        outside = list(kernel.standards)
+        proceed.set()
+        return await a, await b, outside
+
+    assert asyncio.run(main()) == (['angstrom'], ['m'], ['nm', 'ps'])
+
+
+def test_global_configuration_is_shared_by_new_threads():
+    puw.configure.set_standard_units(['angstrom', 'fs'])
+    seen = []
+
+    thread = threading.Thread(target=lambda: seen.append(list(kernel.standards)))
+    thread.start()
+    thread.join()
+
+    assert seen == [['angstrom', 'fs']]
+
+
+def test_context_keeps_its_standard_unit_cache_private():
+    puw.get_standard_units(puw.quantity(1.0, 'angstrom'))
+    global_cache = kernel.standard_units_by_dimensionality_cache
+    before = dict(global_cache)
+
+    with puw.context(standard_units=['m', 's']):
+        assert kernel.standard_units_by_dimensionality_cache is not global_cache
+        puw.get_standard_units(puw.quantity(1.0, 'angstrom'))
+
+    assert kernel.standard_units_by_dimensionality_cache is global_cache
+    assert dict(global_cache) == before
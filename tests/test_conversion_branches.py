@@ -101,13 +101,19 @@ def test_string_target_unit_reuses_the_resolved_target_form(monkeypatch):
     _configure_pint()
     quantity = puw.quantity(1.0, "nanometer", form="pint")
     conversion_module = importlib.import_module("pyunitwizard.api.conversion")
+    original_form_adapter = conversion_module._form_adapter
     original_get_form = conversion_module.get_form
     calls = []
 
+    def counting_form_adapter(item):
+        calls.append(item)
+        return original_form_adapter(item)
+
     def counting_get_form(item, *args, **kwargs):
         calls.append(item)
         return original_get_form(item, *args, **kwargs)
 
+    monkeypatch.setattr(conversion_module, "_form_adapter", counting_form_adapter)
     monkeypatch.setattr(conversion_module, "get_form", counting_get_form)
 
     assert puw.get_value(quantity, to_unit="angstrom") == pytest.approx(10.0)
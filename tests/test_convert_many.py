@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private.exceptions import ArgumentError
+
+
+def _configure(libraries=("pint",)):
+    puw.configure.reset()
+    puw.configure.load_library(list(libraries))
+
+
+def test_convert_many_matches_looping_over_convert():
+    _configure()
+
+    items = [
+        puw.quantity(1.5, "nanometer"),
+        puw.quantity(np.array([1.0, 2.0, 3.0]), "nanometer"),
+        puw.quantity(2.0, "picometer"),
+        puw.quantity(4, "nanometer"),
+    ]
+
+    output = puw.convert_many(items, to_unit="angstrom")
+    expected = [puw.convert(item, to_unit="angstrom") for item in items]
+
+    assert len(output) == len(expected)
+    for result, reference in zip(output, expected):
+        assert puw.get_form(result) == "pint"
+        assert str(puw.get_unit(result)) == str(puw.get_unit(reference))
+        np.testing.assert_allclose(puw.get_value(result), puw.get_value(reference))
+
+
+def test_convert_many_value_and_unit_output_types():
+    _configure()
+
+    items = [puw.quantity(1.0, "nanometer"), puw.quantity(3.0, "nanometer")]
+
+    values = puw.convert_many(items, to_unit="angstrom", to_type="value")
+    assert values == pytest.approx([10.0, 30.0])
+
+    units = puw.convert_many(items, to_unit="angstrom", to_type="unit")
+    assert [str(unit) for unit in units] == ["angstrom", "angstrom"]
+
+
+def test_convert_many_keeps_objects_already_in_target_unit():
+    _configure()
+
+    items = [puw.quantity(1.0, "angstrom"), puw.quantity(2.0, "angstrom")]
+
+    output = puw.convert_many(items, to_unit="angstrom")
+
+    assert all(result is item for result, item in zip(output, items))
+
+
+def test_convert_many_offset_units_fall_back_to_convert():
+    _configure()
+
+    items = [puw.quantity(0.0, "degC"), puw.quantity(25.0, "degC")]
+
+    values = puw.convert_many(items, to_unit="kelvin", to_type="value")
+
+    assert values == pytest.approx([273.15, 298.15])
+
+
+def test_convert_many_handles_strings_and_mixed_forms():
+    _configure(("pint", "openmm.unit"))
+
+    items = [
+        "1.0 nanometer",
+        puw.quantity(2.0, "nanometer", form="openmm.unit"),
+        puw.quantity(3.0, "nanometer", form="pint"),
+    ]
+
+    output = puw.convert_many(items, to_unit="angstrom", to_form="pint")
+
+    assert [puw.get_form(result) for result in output] == ["pint", "pint", "pint"]
+    assert [puw.get_value(result) for result in output] == pytest.approx(
+        [10.0, 20.0, 30.0]
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [7, np.array([1, 2]), np.float32(1.5), np.array(1.5, dtype=np.float32),
+     np.array([1.5, 2.5], dtype=np.float32)],
+)
+@pytest.mark.parametrize("to_unit", [None, "nanometer", "angstrom"])
+def test_convert_many_keeps_value_types_as_convert_does(value, to_unit):
+    _configure(("pint", "openmm.unit", "unyt"))
+
+    for form in ("openmm.unit", "unyt"):
+        item = puw.quantity(value, "nanometer", form=form)
+        result = puw.get_value(puw.convert_many([item], to_unit=to_unit, to_form="pint")[0])
+        reference = puw.get_value(puw.convert(item, to_unit=to_unit, to_form="pint"))
+
+        assert type(result) is type(reference)
+        assert np.asarray(result).dtype == np.asarray(reference).dtype
+        np.testing.assert_array_equal(result, reference)
+
+
+def test_convert_many_rejects_invalid_to_type():
+    _configure()
+
+    with pytest.raises(ArgumentError):
+        puw.convert_many([puw.quantity(1.0, "nm")], to_type="invalid")
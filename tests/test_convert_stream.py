@@ -0,0 +1,64 @@
+import types
+
+import numpy as np
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private.exceptions import ArgumentError
+
+
+@pytest.fixture(autouse=True)
+def _pint():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+
+
+def test_convert_stream_slices_arrays_lazily():
+    source = np.arange(10.0).reshape(5, 2)
+
+    stream = puw.convert_stream(source, 'nanometer', 'angstrom', chunk_size=2)
+
+    assert isinstance(stream, types.GeneratorType)
+    chunks = list(stream)
+    assert [chunk.shape for chunk in chunks] == [(2, 2), (2, 2), (1, 2)]
+    assert np.array_equal(np.concatenate(chunks), source*10.0)
+    assert np.array_equal(source, np.arange(10.0).reshape(5, 2))
+
+
+def test_convert_stream_matches_convert_on_the_whole_array():
+    source = np.random.default_rng(0).random(1000)
+
+    streamed = np.concatenate(list(puw.convert_stream(source, 'picometer', 'nanometer', chunk_size=64)))
+    whole = puw.convert(puw.quantity(source, 'picometer'), to_unit='nanometer', to_type='value')
+
+    assert np.allclose(streamed, whole, rtol=1e-15, atol=0.0)
+
+
+def test_convert_stream_consumes_iterables_chunk_by_chunk():
+    produced = []
+
+    def reader():
+        for start in range(0, 6, 2):
+            produced.append(start)
+            yield np.arange(start, start + 2, dtype=float)
+
+    stream = puw.convert_stream(reader(), 'meter', 'centimeter')
+    assert produced == []
+
+    first = next(stream)
+    assert produced == [0]
+    assert np.array_equal(first, [0.0, 100.0])
+    assert np.array_equal(np.concatenate(list(stream)), [200.0, 300.0, 400.0, 500.0])
+
+
+def test_convert_stream_applies_offsets():
+    chunks = list(puw.convert_stream(np.array([0.0, 25.0, 100.0]), 'degC', 'kelvin', chunk_size=2))
+
+    assert np.allclose(np.concatenate(chunks), [273.15, 298.15, 373.15])
+
+
+def test_convert_stream_validates_eagerly():
+    with pytest.raises(ArgumentError):
+        puw.convert_stream(np.arange(3.0), 'meter', 'centimeter', chunk_size=0)
+    with pytest.raises(Exception):
+        puw.convert_stream(np.arange(3.0), 'meter', 'second')
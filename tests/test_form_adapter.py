@@ -0,0 +1,73 @@
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard import forms
+from pyunitwizard.api.introspection import _form_adapter
+from pyunitwizard.forms import FormAdapter, _adapters_by_type, dict_form_adapter
+
+FORMS = ['pint', 'openmm.unit', 'unyt', 'astropy.units']
+
+
+def setup_function():
+    puw.configure.reset()
+    puw.configure.load_library(FORMS)
+    puw.configure.set_default_form('pint')
+    puw.configure.set_default_parser('pint')
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+def test_every_loaded_form_has_an_adapter():
+    for form in FORMS + ['string']:
+        adapter = dict_form_adapter[form]
+        assert isinstance(adapter, FormAdapter)
+        assert adapter.form == form
+        assert adapter.get_value is forms.dict_get_value[form]
+        assert adapter.translate_quantity is forms.dict_translate_quantity[form]
+
+
+@pytest.mark.parametrize('form', FORMS)
+def test_adapter_answers_as_the_tables(form):
+    quantity = puw.quantity(2.0, 'nanometer', form=form)
+    unit = puw.get_unit(quantity)
+    adapter = _form_adapter(quantity)
+
+    assert adapter is dict_form_adapter[form]
+    assert adapter.get_value(quantity) == forms.dict_get_value[form](quantity)
+    assert adapter.get_unit(quantity) == forms.dict_get_unit[form](quantity)
+    assert adapter.is_unit(unit) and not adapter.is_unit(quantity)
+    assert adapter.dimensionality(quantity) == forms.dict_dimensionality[form](quantity)
+    for to_form in FORMS:
+        if to_form != form:
+            assert puw.get_value(adapter.translate_quantity[to_form](quantity)) == 2.0
+
+
+def test_types_are_cached_until_reset_or_load():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+    quantity = puw.quantity(1.0, 'nanometer', form='pint')
+
+    puw.get_value(quantity)
+    assert _adapters_by_type[type(quantity)] is dict_form_adapter['pint']
+
+    puw.configure.load_library(['openmm.unit'])
+    assert type(quantity) not in _adapters_by_type
+
+    puw.get_value(quantity)
+    assert type(quantity) in _adapters_by_type
+    puw.configure.reset()
+    assert len(_adapters_by_type) == 0
+
+
+def test_unknown_objects_are_never_cached():
+    _adapters_by_type.clear()
+
+    assert _form_adapter('2 nm') is dict_form_adapter['string']
+    assert _adapters_by_type[str] is dict_form_adapter['string']
+
+    assert not puw.is_unit(object())
+    with pytest.raises(Exception):
+        _form_adapter(object())
+    assert object not in _adapters_by_type
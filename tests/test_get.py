@@ -107,6 +107,71 @@ def test_get_value_scalar_output_rejects_non_scalar():
     with pytest.raises(ValueError):
         puw.get_value(quantity, value_type=float)
 
+def test_get_value_array_to_unit_matches_convert():
+    quantity = puw.quantity(np.linspace(0.0, 1.0, 7), "nanometer")
+
+    value = puw.get_value(quantity, to_unit="angstrom")
+
+    assert np.array_equal(value, puw.convert(quantity, to_unit="angstrom", to_type="value"))
+    assert np.array_equal(puw.get_value(quantity), np.linspace(0.0, 1.0, 7))
+
+
+def test_get_value_writes_into_out():
+    quantity = puw.quantity(np.array([1.0, 2.0, 3.0]), "nanometer")
+    out = np.empty(3)
+
+    value = puw.get_value(quantity, to_unit="angstrom", out=out)
+
+    assert value is out
+    assert np.allclose(out, [10.0, 20.0, 30.0])
+
+
+def test_get_value_inplace_reuses_the_quantity_array():
+    array = np.array([1.0, 2.0, 3.0])
+    quantity = puw.quantity(array, "nanometer")
+
+    value = puw.get_value(quantity, to_unit="angstrom", inplace=True)
+
+    assert np.shares_memory(value, puw.get_value(quantity))
+    assert np.allclose(value, [10.0, 20.0, 30.0])
+
+
+def test_get_value_out_handles_offset_units():
+    quantity = puw.quantity(np.array([0.0, 25.0]), "degC")
+    out = np.empty(2)
+
+    puw.get_value(quantity, to_unit="kelvin", out=out)
+
+    assert np.allclose(out, [273.15, 298.15])
+
+
+def test_get_value_out_rejects_conflicting_options():
+    from pyunitwizard._private.exceptions import ArgumentError
+
+    quantity = puw.quantity(np.array([1.0, 2.0]), "nanometer")
+
+    with pytest.raises(ArgumentError):
+        puw.get_value(quantity, to_unit="angstrom", out=np.empty(2), inplace=True)
+    with pytest.raises(ArgumentError):
+        puw.get_value(quantity, to_unit="angstrom", out=np.empty(2), dtype=np.float32)
+    with pytest.raises(ArgumentError):
+        puw.get_value(puw.quantity(2.0, "nanometer"), to_unit="angstrom", inplace=True)
+
+
+
+def test_get_value_inplace_rejects_integer_arrays():
+    from pyunitwizard._private.exceptions import ArgumentError
+
+    array = np.array([1, 2, 3])
+
+    for to_unit in ["angstrom", "degC"]:
+        quantity = puw.quantity(array, "kelvin" if to_unit == "degC" else "nanometer")
+        with pytest.raises(ArgumentError, match="floating-point"):
+            puw.get_value(quantity, to_unit=to_unit, inplace=True)
+    assert np.array_equal(array, [1, 2, 3])
+    assert np.allclose(puw.get_value(puw.quantity(array, "nanometer"), to_unit="angstrom"),
+                       [10.0, 20.0, 30.0])
+
 #### Tests for get unit ####
 
 def test_get_unit_pint(pint_unit_registry, pint_quantity):
@@ -10,3 +10,31 @@ import sys
 def test_pyunitwizard_imported():
     """Sample test, will always pass so long as import statement worked"""
     assert "pyunitwizard" in sys.modules
+
+
+def _run_fresh(code):
+    import subprocess
+
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.split()
+
+
+def test_import_defers_diagnostics_and_backends():
+    loaded = _run_fresh(
+        "import sys, pyunitwizard; "
+        "print(' '.join(sorted(sys.modules)))"
+    )
+
+    for module in ("smonitor", "depdigest", "numpy", "pint", "importlib.metadata"):
+        assert module not in loaded
+
+
+def test_first_api_use_configures_smonitor():
+    assert _run_fresh(
+        "import pyunitwizard as puw; "
+        "print(puw._smonitor_configured); "
+        "puw.get_form; "
+        "print(puw._smonitor_configured)"
+    ) == ["False", "True"]
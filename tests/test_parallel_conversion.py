@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private import parallel
+
+
+@pytest.fixture(autouse=True)
+def small_slabs(monkeypatch):
+    # Let arrays of a few kilobytes take the threaded path.
+    monkeypatch.setattr(parallel, 'MIN_BYTES_PER_WORKER', 1024)
+    puw.configure.reset()
+    puw.configure.load_library(['pint', 'openmm.unit'])
+    yield
+    puw.configure.reset()
+
+
+@pytest.mark.parametrize('form', ['pint', 'openmm.unit'])
+def test_convert_with_workers_matches_serial(form):
+    value = np.random.default_rng(0).random((500, 3))
+    quantity = puw.quantity(value, 'nm', form=form)
+
+    serial = puw.convert(quantity, to_unit='angstrom')
+    threaded = puw.convert(quantity, to_unit='angstrom', workers=4)
+
+    assert puw.get_form(threaded) == form
+    assert puw.are_equal(threaded, serial)
+    assert np.array_equal(
+        puw.convert(quantity, to_unit='angstrom', to_type='value', workers=4), value*10.0)
+
+
+def test_get_value_with_workers_writes_into_out():
+    value = np.random.default_rng(1).random((400, 5))
+    out = np.empty_like(value)
+
+    result = puw.get_value(puw.quantity(value, 'nm', form='pint'), to_unit='angstrom',
+                           out=out, workers=3)
+
+    assert result is out
+    assert np.array_equal(out, value*10.0)
+
+
+def test_parallel_multiply_covers_non_contiguous_arrays():
+    value = np.random.default_rng(2).random((600, 4))[:, ::2]
+    out = np.empty(value.shape)
+
+    parallel.multiply(value, 2.0, out=out, workers=4)
+
+    assert np.array_equal(out, value*2.0)
+
+
+def test_conversion_workers_setting_and_context():
+    assert puw.configure.get_conversion_workers() == 1
+
+    with puw.context(workers=-1):
+        assert puw.configure.get_conversion_workers() == -1
+        quantity = puw.quantity(np.ones(1000), 'nm', form='pint')
+        assert np.allclose(puw.get_value(quantity, to_unit='angstrom'), 10.0)
+
+    assert puw.configure.get_conversion_workers() == 1
+
+    with pytest.raises(ValueError):
+        puw.configure.set_conversion_workers(0)
+
+
+def test_growing_the_pool_does_not_break_calls_in_flight(monkeypatch):
+    import threading
+
+    monkeypatch.setattr(parallel, '_executor', None)
+    monkeypatch.setattr(parallel, '_executor_workers', 0)
+    value = np.random.default_rng(2).random(64 * 1024)
+    errors = []
+    stop = threading.Event()
+
+    def scale(workers):
+        try:
+            while not stop.is_set():
+                assert np.array_equal(parallel.multiply(value, 10.0, workers=workers), value*10.0)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=scale, args=(2,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for workers in range(3, 33):
+        parallel.multiply(value, 10.0, workers=workers)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
@@ -178,3 +178,58 @@ def test_parse_rejects_unknown_to_form_for_astropy_parser():
 def test_parse_rejects_unknown_parser_before_dispatch():
     with pytest.raises(ValueError):
         parse("1 meter", parser="unknown-parser", to_form="pint")
+
+
+def test_parse_caches_the_unit_and_not_the_value():
+    from pyunitwizard.parse import _parse_cached, _parse_unit_cached
+
+    with loaded_libraries(['pint', 'openmm.unit']):
+        _parse_cached.cache_clear()
+        _parse_unit_cached.cache_clear()
+
+        quantities = [parse(f"{value} nm", to_form="openmm.unit") for value in (1.0, 1.5, 2.0)]
+
+        assert [q._value for q in quantities] == [1.0, 1.5, 2.0]
+        assert all(str(q.unit) == "nanometer" for q in quantities)
+        assert puw.configure.cache_stats()['parse_unit']['size'] == 1
+        assert all(key[0] != "1.5 nm" for key, _ in _parse_cached.cache.items())
+
+
+@pytest.mark.parametrize("string", [
+    "-2e-3 kJ/mol",
+    "7 kcal/(mol*angstrom**2)",
+    "4 nm**-1",
+    "[[1, 2], [3, 4]] nm^2",
+    "(3, 2, 1) meters",
+    "5 m / 2 s",
+])
+def test_parse_split_matches_whole_string_parsing(string):
+    from pyunitwizard.parse import _parse_cached
+
+    with loaded_libraries(['pint', 'openmm.unit']):
+        for form in ("pint", "openmm.unit", "string"):
+            assert str(parse(string, to_form=form)) == str(_parse_cached(string, "pint", form))
+
+
+@pytest.mark.parametrize("form, string, value_type", [
+    ("openmm.unit", "1 kJ/mol", int),
+    ("openmm.unit", "1/nm", int),
+    ("openmm.unit", "1 kcal/mol/angstrom**2", int),
+    ("openmm.unit", "2.5 nm", float),
+    ("pint", "2 nm", int),
+    ("pint", "1 kJ/mol", float),
+])
+def test_parse_keeps_the_type_of_the_value(form, string, value_type):
+    from pyunitwizard.parse import _parse_cached
+
+    with loaded_libraries(['pint', 'openmm.unit']):
+        value = puw.get_value(puw.quantity(string, form=form))
+        assert type(value) is value_type
+        assert type(value) is type(puw.get_value(_parse_cached(string, "pint", form)))
+
+
+def test_parse_leaves_offset_units_to_the_parser():
+    import pint
+
+    with pytest.raises(pint.errors.OffsetUnitCalculusError):
+        parse("5 degC", to_form="pint")
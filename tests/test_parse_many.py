@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private.exceptions import ArgumentError
+
+
+def setup_function():
+    puw.configure.reset()
+    puw.configure.load_library(['pint', 'openmm.unit'])
+    puw.configure.set_default_form('pint')
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+def test_parse_many_matches_converting_each_string():
+    strings = ['3.2 angstrom', '0.4 nm', '1e3pm', '-2 nm', '5  angstrom ']
+
+    output = puw.parse_many(strings, to_unit='nm')
+    expected = [puw.convert(string, to_unit='nm', to_type='value') for string in strings]
+
+    assert puw.get_form(output) == 'pint'
+    assert str(puw.get_unit(output)) == 'nanometer'
+    np.testing.assert_allclose(puw.get_value(output), expected)
+
+
+def test_parse_many_defaults_to_the_unit_of_the_first_string():
+    output = puw.parse_many(np.array(['1 nm', '20 angstrom']))
+
+    assert str(puw.get_unit(output)) == 'nanometer'
+    np.testing.assert_allclose(puw.get_value(output), [1.0, 2.0])
+
+
+def test_parse_many_applies_offsets_of_affine_units():
+    output = puw.parse_many(['25 degC', '300 K'], to_unit='K')
+
+    np.testing.assert_allclose(puw.get_value(output), [298.15, 300.0])
+
+
+def test_parse_many_converts_unsplittable_strings_one_by_one():
+    output = puw.parse_many(['5 m / 2 s', '1 m*s'], to_unit='m*s')
+
+    np.testing.assert_allclose(puw.get_value(output), [2.5, 1.0])
+
+
+def test_parse_many_output_form():
+    output = puw.parse_many(['1 kJ/mol', '2 kcal/mol'], to_form='openmm.unit')
+
+    assert puw.get_form(output) == 'openmm.unit'
+    np.testing.assert_allclose(
+        puw.get_value(output, to_unit='kJ/mol'), [1.0, 8.368]
+    )
+
+
+def test_parse_many_rejects_bad_input():
+    with pytest.raises(ArgumentError):
+        puw.parse_many(['1 nm', 2.0])
+    with pytest.raises(ArgumentError):
+        puw.parse_many([])
+
+    assert puw.get_value(puw.parse_many([], to_unit='nm')).shape == (0,)
@@ -0,0 +1,72 @@
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard import kernel
+
+
+def setup_function():
+    puw.configure.reset()
+    puw.configure.load_library(['pint', 'openmm.unit'])
+    puw.configure.set_default_form('pint')
+    puw.configure.set_default_parser('pint')
+    puw.configure.set_standard_units(['nm', 'ps'])
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+def test_policy_is_compiled_without_touching_the_active_configuration():
+    policy = puw.configure.Policy(standard_units=['angstrom', 'fs'],
+                                  default_form='openmm.unit', name='md')
+
+    assert policy.standard_units == ('angstrom', 'fs')
+    assert policy.default_form == 'openmm.unit'
+    assert policy.default_parser == 'pint'
+    assert list(kernel.standards) == ['nm', 'ps']
+    assert puw.configure.get_default_form() == 'pint'
+
+
+def test_context_activates_a_policy_and_restores_on_exit():
+    policy = puw.configure.Policy(standard_units=['angstrom', 'fs'],
+                                  default_form='openmm.unit', name='md')
+
+    with puw.context(policy):
+        assert puw.configure.get_default_form() == 'openmm.unit'
+        assert puw.configure.report()['provenance'] == 'md'
+        length = puw.standardize(puw.quantity(2.0, 'nm', form='pint'))
+        assert puw.get_form(length) == 'openmm.unit'
+        assert puw.get_value(length) == pytest.approx(20.0)
+
+    with puw.context(policy=policy, default_form='pint'):
+        assert puw.configure.get_default_form() == 'pint'
+        assert list(kernel.standards) == ['angstrom', 'fs']
+
+    assert list(kernel.standards) == ['nm', 'ps']
+    assert puw.configure.get_default_form() == 'pint'
+
+
+def test_changes_inside_a_policy_context_do_not_reach_the_policy():
+    policy = puw.configure.Policy(standard_units=['angstrom', 'fs'])
+
+    with puw.context(policy):
+        puw.get_standard_units(puw.quantity(1.0, 'nm'))
+        shared = kernel.standard_units_by_dimensionality_cache
+        entries = dict(shared)
+        puw.configure.set_standard_units(['m', 's'])
+        puw.get_standard_units(puw.quantity(1.0, 'nm'))
+        assert kernel.standard_units_by_dimensionality_cache is not shared
+
+    assert dict(shared) == entries
+    with puw.context(policy):
+        assert list(kernel.standards) == ['angstrom', 'fs']
+        assert str(puw.get_standard_units(puw.quantity(1.0, 'nm'))) == 'angstrom'
+
+
+def test_policy_is_immutable():
+    policy = puw.configure.Policy(standard_units=['nm'])
+
+    with pytest.raises(AttributeError):
+        policy.standard_units = ('m',)
+    with pytest.raises(AttributeError):
+        del policy.name
@@ -0,0 +1,66 @@
+import pyunitwizard as puw
+from pyunitwizard import kernel
+from pyunitwizard.api import standardization
+
+
+ENERGY = (2.0, 1.0, -2.0, 0.0, 0.0, 0.0, 0.0)
+FORCE = (1.0, 1.0, -2.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def setup_function():
+    puw.configure.reset()
+    puw.configure.load_library(['pint', 'openmm.unit'])
+    puw.configure.set_default_form('pint')
+    puw.configure.set_standard_units(['nm', 'ps', 'kJ', 'K', 'mole', 'kJ/mol'])
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+def test_index_covers_declared_and_common_dimensionalities():
+    index = kernel.standard_units_index
+
+    assert index[(1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)] == ('nm', False)
+    assert index[ENERGY] == ('kJ', True)
+    assert index[(2.0, 1.0, -2.0, 0.0, -1.0, 0.0, 0.0)] == ('kJ/mol', True)
+    assert FORCE in index
+    assert kernel.standard_units_by_dimensionality_cache == {}
+
+
+def test_index_hit_skips_the_solver(monkeypatch):
+    calls = []
+    solve = standardization._standard_units_exact
+
+    def counting_solve(*args):
+        calls.append(args)
+        return solve(*args)
+
+    monkeypatch.setattr(standardization, '_standard_units_exact', counting_solve)
+
+    force = puw.quantity(2.0, 'kcal/(mol*angstrom)')
+    output = puw.standardize(force)
+
+    assert calls == []
+    assert puw.get_unit(output, to_form='string') == 'kilojoule / mole / nanometer'
+    assert puw.get_value(output) == puw.get_value(puw.convert(force, to_unit='kJ/(mol*nm)'))
+
+
+def test_index_answers_match_on_demand_solution():
+    for key, (unit, verbatim) in kernel.standard_units_index.items():
+        solution = standardization.np.array(key)
+        n_dims = sum(1 for exponent in key if exponent != 0.0)
+        assert standardization._solve_standard_unit(solution, n_dims) == (unit, verbatim)
+
+
+def test_combination_standard_is_returned_verbatim_from_index():
+    assert puw.get_standard_units('kcal/mol', form='string') == 'kJ/mol'
+
+
+def test_index_follows_configuration_changes():
+    with puw.context(standard_units=['angstrom', 'fs', 'kcal', 'K', 'mole']):
+        assert kernel.standard_units_index[ENERGY] == ('kcal', True)
+    assert kernel.standard_units_index[ENERGY] == ('kJ', True)
+
+    puw.configure.reset()
+    assert kernel.standard_units_index == {}
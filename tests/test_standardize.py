@@ -5,7 +5,7 @@ import openmm.unit as openmm_unit
 import pytest
 import numpy as np
 import unyt
-from pyunitwizard.api.standardization import _standard_units_lstsq
+from pyunitwizard.api.standardization import _standard_units_exact
 
 puw.configure.reset()
 puw.configure.load_library(['pint', 'openmm.unit', 'unyt'])
@@ -234,10 +234,37 @@ def test_get_standard_units_combination_raises_without_fundamental_standards():
     with pytest.raises(NoStandardsError):
         puw.get_standard_units(dimensionality={'[L]': 1, '[T]': 1}, form='string')
 
-def test_standard_units_lstsq_returns_none_when_unsatisfied():
+def test_standard_units_exact_returns_none_when_unsatisfied():
     solution = np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
     standards = {'second': np.array([0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0])}
-    assert _standard_units_lstsq(solution, standards) is None
+    assert _standard_units_exact(solution, standards) is None
+
+
+def test_standard_units_exact_composes_without_round_off():
+    standards = {
+        'nm': np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]),
+        'ps': np.array([0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0]),
+        'kJ/mol': np.array([2.0, 1.0, -2.0, 0.0, -1.0, 0.0, 0.0]),
+    }
+
+    force = np.array([1.0, 1.0, -2.0, 0.0, -1.0, 0.0, 0.0])
+    assert _standard_units_exact(force, standards) == 'kilojoule / mole / nanometer'
+
+    third = np.array([1.0 / 3.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+    assert _standard_units_exact(third, standards) == 'nanometer ** (1/3)'
+
+    root = np.array([-0.5, 0.5, -1.0, 0.0, -0.5, 0.0, 0.0])
+    assert _standard_units_exact(root, standards) == 'kilojoule ** (1/2) / mole ** (1/2) / nanometer ** (3/2)'
+
+
+def test_standard_units_exact_prefers_the_first_standard_of_a_dimensionality():
+    standards = {
+        'nm': np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]),
+        'angstrom': np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]),
+    }
+    area = np.array([2.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+
+    assert _standard_units_exact(area, standards) == 'nanometer ** 2'
 
 
 def test_standardize_resolves_the_input_form_once(monkeypatch):
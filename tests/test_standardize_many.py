@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private.exceptions import NoStandardsError
+
+
+def setup_function():
+    puw.configure.reset()
+    puw.configure.load_library(['pint', 'openmm.unit'])
+    puw.configure.set_default_form('pint')
+    puw.configure.set_default_parser('pint')
+    puw.configure.set_standard_units(['nm', 'ps', 'kJ/mol', 'K'])
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+def test_standardize_many_matches_standardize_in_input_order():
+    items = [
+        puw.quantity(1.0, 'angstrom'),
+        puw.quantity(2.0, 'fs', form='openmm.unit'),
+        puw.quantity(np.array([1.0, 2.0]), 'kcal/mol'),
+        puw.quantity(3.0, 'angstrom'),
+        puw.quantity(25.0, 'degC'),
+        puw.unit('angstrom'),
+        '4 angstrom',
+    ]
+
+    expected = [puw.standardize(item) for item in items]
+    result = puw.standardize_many(items)
+
+    assert len(result) == len(expected)
+    for got, want in zip(result, expected):
+        assert puw.get_form(got) == puw.get_form(want)
+        if puw.is_unit(want):
+            assert got == want
+        else:
+            assert puw.get_unit(got) == puw.get_unit(want)
+            np.testing.assert_allclose(puw.get_value(got), puw.get_value(want))
+
+
+def test_standardize_many_returns_items_already_in_standard_units():
+    length = puw.quantity(1.0, 'nm')
+    assert puw.standardize_many([length])[0] is length
+
+
+def test_standardize_many_honours_to_form_and_to_unit():
+    items = [puw.quantity(1.0, 'angstrom'), puw.quantity(2.0, 'angstrom')]
+
+    result = puw.standardize_many(items, to_form='openmm.unit')
+    assert [puw.get_form(item) for item in result] == ['openmm.unit', 'openmm.unit']
+    assert puw.get_value(result[1]) == pytest.approx(0.2)
+
+    result = puw.standardize_many(items, to_unit='pm')
+    assert [puw.get_value(item) for item in result] == pytest.approx([100.0, 200.0])
+
+
+def test_standardize_many_without_standards_raises():
+    puw.configure.reset()
+    puw.configure.load_library(['pint'])
+
+    with pytest.raises(NoStandardsError):
+        puw.standardize_many([puw.quantity(1.0, 'angstrom')])
+
+
+@pytest.mark.parametrize(
+    'value',
+    [7, np.array([1, 2]), np.array(1.5, dtype=np.float32), np.array([1.5, 2.5], dtype=np.float32)],
+)
+@pytest.mark.parametrize('unit', ['nm', 'angstrom'])
+def test_standardize_many_keeps_value_types_as_standardize_does(value, unit):
+    item = puw.quantity(value, unit, form='openmm.unit')
+
+    result = puw.get_value(puw.standardize_many([item], to_form='pint')[0])
+    reference = puw.get_value(puw.standardize(item, to_form='pint'))
+
+    assert type(result) is type(reference)
+    assert np.asarray(result).dtype == np.asarray(reference).dtype
+    np.testing.assert_array_equal(result, reference)
@@ -0,0 +1,140 @@
+import os
+
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private import caches, persistent_cache
+
+
+@pytest.fixture
+def unit_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("PYUNITWIZARD_UNIT_CACHE", raising=False)
+    puw.configure.reset()
+    puw.configure.set_unit_cache(str(tmp_path))
+    yield tmp_path
+    puw.configure.set_unit_cache(None)
+    puw.configure.reset()
+
+
+def configure(standards=("nm", "ps", "kJ/mol")):
+    puw.configure.reset()
+    puw.configure.load_library(["pint"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_standard_units(list(standards))
+
+
+def test_unit_cache_restores_entries_in_a_fresh_session(unit_cache):
+    configure()
+    assert puw.conversion_factor("nm", "angstrom") == pytest.approx(10.0)
+    puw.get_standard_units("2 kcal/mol/angstrom")
+    path = puw.configure.save_unit_cache()
+    assert os.path.dirname(path) == str(unit_cache)
+
+    configure()
+    stats = puw.configure.cache_stats()
+    assert stats["conversion_factor"]["size"] >= 1
+    assert stats["standard_units"]["size"] >= 1
+
+    assert puw.conversion_factor("nm", "angstrom") == pytest.approx(10.0)
+    assert puw.configure.cache_stats()["conversion_factor"]["hits"] == 1
+
+
+def test_unit_cache_is_keyed_on_the_standards(unit_cache):
+    configure()
+    puw.conversion_factor("nm", "angstrom")
+    first = puw.configure.save_unit_cache()
+
+    configure(["angstrom", "fs"])
+    assert puw.configure.cache_stats()["conversion_factor"]["size"] == 0
+    assert puw.configure.save_unit_cache() != first
+
+
+def test_unit_cache_only_writes_plain_entries(unit_cache):
+    configure()
+    unit = puw.convert("nm", to_form="pint", to_type="unit")
+    caches.registry["conversion_factor"][("value", "pint", unit)] = 2.0
+    puw.conversion_factor("nm", "angstrom")
+    puw.configure.save_unit_cache()
+
+    configure()
+    keys = list(caches.registry["conversion_factor"])
+    assert ("nanometer", "angstrom", "pint", "pint") in keys
+    assert all(persistent_cache._is_plain(key) for key in keys)
+
+
+def test_unit_cache_ignores_unreadable_files(unit_cache):
+    configure()
+    with open(persistent_cache.cache_file(str(unit_cache)), "wb") as handle:
+        handle.write(b"not a pickle")
+
+    assert puw.configure.load_unit_cache() == 0
+    assert puw.configure.save_unit_cache() is not None
+
+
+def test_unit_cache_setting_resolves_from_environment(monkeypatch, tmp_path):
+    puw.configure.set_unit_cache(None)
+    monkeypatch.setenv("PYUNITWIZARD_UNIT_CACHE", str(tmp_path))
+    assert puw.configure.get_unit_cache() == str(tmp_path)
+
+    monkeypatch.setenv("PYUNITWIZARD_UNIT_CACHE", "off")
+    assert puw.configure.get_unit_cache() is None
+    assert puw.configure.save_unit_cache() is None
+
+    monkeypatch.delenv("PYUNITWIZARD_UNIT_CACHE")
+    assert puw.configure.get_unit_cache() is None
+
+
+def test_unit_cache_restores_before_backends_load_lazily(unit_cache):
+    # Standards first, backends on first use: the file read at startup must be
+    # the one written at exit.
+    puw.configure.reset()
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+    puw.configure.set_standard_units(["nm", "ps", "kJ/mol"])
+    first = persistent_cache.cache_file(str(unit_cache))
+
+    puw.configure.load_library(["pint", "openmm.unit"])
+    puw.conversion_factor("nm", "angstrom")
+    assert puw.configure.save_unit_cache() == first
+
+    puw.configure.reset()
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+    puw.configure.set_standard_units(["nm", "ps", "kJ/mol"])
+    assert puw.configure.cache_stats()["conversion_factor"]["size"] >= 1
+
+
+def test_unit_cache_file_is_never_unpickled(unit_cache):
+    import pickle
+
+    configure()
+    puw.conversion_factor("nm", "angstrom")
+    path = puw.configure.save_unit_cache()
+    with open(path, encoding="utf-8") as handle:
+        assert handle.read().startswith("{")
+
+    class Payload:
+        def __reduce__(self):
+            return (os.remove, (path,))
+
+    with open(path, "wb") as handle:
+        pickle.dump(Payload(), handle)
+
+    assert puw.configure.load_unit_cache() == 0
+    assert os.path.exists(path)
+
+
+def test_unit_cache_restored_in_a_context_stays_in_it(unit_cache):
+    configure(["m", "s", "J"])
+    puw.get_standard_units("2 angstrom/fs")
+    puw.configure.save_unit_cache()
+
+    configure(["nm", "ps", "kJ"])
+    quantity = puw.quantity(1.0, "angstrom/fs", form="pint")
+    with puw.context(standard_units=["m", "s", "J"]):
+        assert str(puw.get_unit(puw.standardize(quantity))) == "meter / second"
+    with puw.context(puw.configure.Policy(standard_units=["m", "s", "J"])):
+        assert str(puw.get_unit(puw.standardize(quantity))) == "meter / second"
+
+    assert str(puw.get_unit(puw.standardize(quantity))) == "nanometer / picosecond"
+    assert "meter / second" not in puw.kernel.standard_units_by_dimensionality_cache.values()
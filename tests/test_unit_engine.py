@@ -0,0 +1,169 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private import unit_engine
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "nm",
+        "nanometers",
+        "kJ/mol",
+        "kilojoule / mole",
+        "kcal/mol/angstrom**2",
+        "1 / picosecond",
+        "nm^-1",
+        "hPa",
+        "µm",
+    ],
+)
+def test_native_dimensionality_matches_pint(expression):
+    puw.configure.reset()
+    puw.configure.load_library(["pint"])
+
+    expected = puw.get_dimensionality(puw.unit(expression, form="pint"))
+
+    assert unit_engine.dimensionality(expression) == expected
+
+
+@pytest.mark.parametrize(
+    "from_unit, to_unit",
+    [
+        ("nm", "angstroms"),
+        ("kcal/mol", "kJ/mol"),
+        ("ps", "fs"),
+        ("bar", "atm"),
+        ("eV", "kJ"),
+        ("L", "nm**3"),
+    ],
+)
+def test_native_factor_matches_pint(from_unit, to_unit):
+    puw.configure.reset()
+    puw.configure.load_library(["pint"])
+
+    expected = puw.get_value(puw.quantity(1.0, from_unit, form="pint"), to_unit=to_unit)
+
+    assert unit_engine.conversion_factor(from_unit, to_unit) == pytest.approx(
+        expected, rel=1e-12
+    )
+
+
+@pytest.mark.parametrize(
+    "expression", ["degC", "amu", "J mol", "2 * nm", "nm2", "yd", "[1, 2] nm"]
+)
+def test_native_engine_declines_what_it_cannot_answer_exactly(expression):
+    assert unit_engine.parse_unit(expression) is None
+
+
+def test_native_engine_refuses_incompatible_pairs():
+    assert unit_engine.conversion_factor("nm", "ps") is None
+    assert unit_engine.convert_value("1 nm", "ps") is None
+
+
+def test_magnitude_and_dimensionality_questions_load_no_backend():
+    code = """
+import json
+import pyunitwizard as puw
+
+result = {
+    'dimensionality': puw.get_dimensionality('1.5 kJ/mol'),
+    'compatible': puw.are_compatible('1 nm', '3 angstrom'),
+    'factor': puw.conversion_factor('nm', 'angstrom'),
+    # A float: whether an integer stays one is the backend's to say.
+    'value': puw.convert('2.0 nm', to_unit='angstrom', to_type='value'),
+    'loaded': puw.configure.get_libraries_loaded(),
+}
+print(json.dumps(result))
+"""
+
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result = json.loads(completed.stdout.strip())
+
+    assert result["dimensionality"]["[L]"] == 2
+    assert result["dimensionality"]["[mol]"] == -1
+    assert result["compatible"] is True
+    assert result["factor"] == pytest.approx(10.0)
+    assert result["value"] == pytest.approx(20.0)
+    assert result["loaded"] == []
+
+
+_DIFFERENTIAL_CASES = [
+    ("1 nm", "angstrom"),
+    ("1.0 nm", "angstrom"),
+    ("2 h", "s"),
+    ("2 km", "m"),
+    ("2 nm", "nanometer"),
+    ("1.5 kJ/mol", "kcal/mol"),
+    ("1 eV", "J"),
+    ("1.0 atm", "bar"),
+    ("1.0 kcal", "J"),
+]
+
+
+def _outcome(call):
+    try:
+        return call()
+    except Exception as error:
+        return type(error)
+
+
+@pytest.mark.parametrize("parser", ["pint", "astropy.units"])
+@pytest.mark.parametrize("form", ["pint", "openmm.unit", "unyt", "astropy.units"])
+def test_native_answers_match_the_backend_path(form, parser, monkeypatch):
+    puw.configure.reset()
+    puw.configure.load_library(sorted({"pint", form, parser}))
+    puw.configure.set_default_form(form)
+    puw.configure.set_default_parser(parser)
+
+    calls = {
+        "value": lambda string, unit: puw.convert(string, to_unit=unit, to_type="value"),
+        "dimensionality": lambda string, unit: puw.get_dimensionality(string),
+        "affine": lambda string, unit: puw.conversion_affine(string.split(" ", 1)[1], unit),
+    }
+    fast = {
+        (name, case): _outcome(lambda: call(*case))
+        for name, call in calls.items() for case in _DIFFERENTIAL_CASES
+    }
+
+    puw.configure.reset()
+    puw.configure.load_library(sorted({"pint", form, parser}))
+    puw.configure.set_default_form(form)
+    puw.configure.set_default_parser(parser)
+    monkeypatch.setattr(unit_engine, "answers_strings", lambda *args, **kwargs: False)
+
+    for (name, case), result in fast.items():
+        expected = _outcome(lambda: calls[name](*case))
+        assert type(result) is type(expected), (name, case, result, expected)
+        if isinstance(expected, type):
+            assert result is expected
+        elif name == "dimensionality":
+            assert result == expected
+        else:
+            assert result == pytest.approx(expected, rel=1e-12), (name, case)
+
+
+def test_native_engine_answers_for_pint_only():
+    puw.configure.reset()
+    puw.configure.load_library(["pint", "openmm.unit", "astropy.units"])
+    puw.configure.set_default_form("pint")
+    puw.configure.set_default_parser("pint")
+
+    assert unit_engine.answers_strings()
+    assert not unit_engine.answers_strings("astropy.units")
+    assert not unit_engine.answers_strings("pint", "openmm.unit")
+
+    assert unit_engine.convert_value("2 h", "s") is None
+    assert unit_engine.convert_value("2 nm", "nanometer") == 2
+    assert isinstance(unit_engine.convert_value("2 nm", "nanometer"), int)
+    assert puw.convert("2 h", to_unit="s", to_type="value") == 7200
+    assert isinstance(puw.convert("2 h", to_unit="s", to_type="value"), int)
@@ -0,0 +1,71 @@
+import pytest
+
+import pyunitwizard as puw
+from pyunitwizard._private.unit_keys import unit_key
+
+
+def setup_function():
+    puw.configure.reset()
+    puw.configure.load_library(['pint', 'openmm.unit', 'astropy.units'])
+    puw.configure.set_default_form('pint')
+    puw.configure.set_default_parser('pint')
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+@pytest.mark.parametrize(
+    'spelling', ['nm', 'nanometer', 'nanometers', 'nanometre', ' nm ', '1 nm', '1*nm']
+)
+def test_spellings_of_one_unit_share_a_key(spelling):
+    assert unit_key(spelling, 'pint') == 'nanometer'
+
+
+def test_layout_is_normalized():
+    expected = unit_key('nm**2/ps', 'pint')
+
+    for spelling in ['nm^2/ps', 'nm ** 2 / ps', 'nanometers ^ 2 / picoseconds']:
+        assert unit_key(spelling, 'pint') == expected
+
+    assert unit_key('( nm / ps )**2', 'pint') == '(nanometer/picosecond)**2'
+
+
+def test_what_the_registry_does_not_know_is_kept():
+    assert unit_key('foo', 'pint') == 'foo'
+    assert unit_key('nm2', 'pint') == 'nm2'
+    assert unit_key('1e3 nm', 'pint') == '1e3 nanometer'
+    assert unit_key('dimensionless', 'pint') == 'dimensionless'
+
+
+def test_names_come_from_the_parser_registry():
+    assert unit_key('nanometer', 'astropy.units') == 'nm'
+    assert unit_key('angstrom', 'astropy.units') == 'Angstrom'
+    # Unknown to astropy, so not merged with 'nm'.
+    assert unit_key('nanometers', 'astropy.units') == 'nanometers'
+    assert unit_key('nm', 'openmm.unit') == 'nm'
+
+
+def test_default_parser_is_used_when_omitted():
+    assert unit_key('nm') == unit_key('nm', 'pint')
+
+    puw.configure.set_default_parser('astropy.units')
+    assert unit_key('nanometer') == 'nm'
+
+
+def test_non_strings_pass_through():
+    unit = puw.unit('nm', form='pint')
+    assert unit_key(unit, 'pint') is unit
+
+
+def test_unit_caches_hold_one_entry_per_unit():
+    from pyunitwizard.api.conversion import _parse_unit_string
+
+    quantity = puw.quantity(1.0, 'nm', form='pint')
+    for spelling in ['angstrom', 'angstroms', 'Å', ' angstrom']:
+        output = puw.convert(quantity, to_unit=spelling, to_form='openmm.unit')
+        assert puw.get_value(output) == pytest.approx(10.0)
+        assert puw.has_unit(puw.quantity(2.0, spelling, form='pint'), 'angstroms')
+
+    keys = [key for key in _parse_unit_string.cache if key[2] == 'openmm.unit']
+    assert keys == [('angstrom', 'pint', 'openmm.unit')]
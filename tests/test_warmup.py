@@ -0,0 +1,54 @@
+import pytest
+
+import pyunitwizard as puw
+
+
+def setup_function():
+    puw.configure.reset()
+    puw.configure.load_library(['pint', 'openmm.unit'])
+    puw.configure.set_default_form('pint')
+    puw.configure.set_standard_units(['nm', 'ps', 'kJ/mol', 'K'])
+
+
+def teardown_function():
+    puw.configure.reset()
+
+
+def test_warmup_fills_unit_caches_for_every_form():
+    from pyunitwizard.api.introspection import _target_unit_from_string
+
+    report = puw.configure.warmup(units=['angstrom', 'kcal/mol'], forms=['pint', 'openmm.unit'])
+
+    assert report == {'units': 4, 'pairs': 0, 'skipped': []}
+    parser = puw.configure.get_default_parser()
+    for form in ('pint', 'openmm.unit'):
+        assert ('angstrom', form, parser) in _target_unit_from_string.cache
+
+    stats = puw.configure.cache_stats()
+    assert stats['unit_string']['size'] >= 4
+    assert stats['standard_units']['size'] >= 1
+
+
+def test_warmup_precomputes_conversion_factors():
+    puw.configure.warmup(units=[], pairs=[('angstrom', 'nm'), ('degC', 'K')])
+
+    cache = puw.configure.cache_stats()['conversion_factor']
+    hits = cache['hits']
+    assert puw.conversion_factor('angstrom', 'nm') == pytest.approx(0.1)
+    assert puw.conversion_affine('degC', 'K') == pytest.approx((1.0, 273.15))
+    assert puw.configure.cache_stats()['conversion_factor']['hits'] == hits + 2
+
+
+def test_warmup_defaults_to_the_standard_units_and_reports_skips():
+    report = puw.configure.warmup(forms=['pint'])
+    assert report['units'] == 4
+
+    report = puw.configure.warmup(units=['degC'], forms=['pint', 'openmm.unit'])
+    assert report['skipped'] == [('degC', 'openmm.unit')]
+
+
+def test_warmup_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        puw.configure.warmup(units='nm')
+    with pytest.raises(ValueError):
+        puw.configure.warmup(pairs={'nm': 'angstrom'})
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+import pyunitwizard as puw
+from tests.helpers import loaded_libraries
+
+# physipy stores SI magnitudes and quantities rescales string units to base
+# units, so they are exercised with a unit of scale one.
+FORMS_AND_UNITS = [
+    ("pint", "nanometer"),
+    ("openmm.unit", "nanometer"),
+    ("unyt", "nanometer"),
+    ("astropy.units", "nanometer"),
+    ("physipy", "meter"),
+    ("quantities", "meter"),
+]
+
+
+def _loaded(form):
+    if form in ("physipy", "quantities"):
+        pytest.importorskip(form)
+    return loaded_libraries(["pint", form])
+
+
+@pytest.mark.parametrize("form,unit", FORMS_AND_UNITS)
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_quantity_wraps_ndarray_without_copy(form, unit, dtype):
+    with _loaded(form):
+        array = np.arange(6, dtype=dtype).reshape(2, 3)
+
+        quantity = puw.quantity(array, unit, form=form)
+
+        assert np.shares_memory(array, puw.get_value(quantity))
+
+
+@pytest.mark.parametrize("form,unit", FORMS_AND_UNITS)
+def test_change_value_wraps_ndarray_without_copy(form, unit):
+    with _loaded(form):
+        quantity = puw.quantity(np.zeros(4), unit, form=form)
+        array = np.arange(4.0)
+
+        changed = puw.change_value(quantity, array)
+
+        assert puw.get_form(changed) == form
+        assert np.shares_memory(array, puw.get_value(changed))
+        assert puw.are_equal(puw.get_unit(changed), puw.get_unit(quantity))
+
+
+@pytest.mark.parametrize("form,unit", FORMS_AND_UNITS)
+def test_make_quantity_wraps_ndarray_without_copy(form, unit):
+    with _loaded(form):
+        array = np.arange(3.0)
+        form_unit = puw.unit(unit, form=form)
+
+        quantity = puw.forms.dict_make_quantity[form](array, form_unit)
+
+        assert np.shares_memory(array, puw.forms.dict_get_value[form](quantity))
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+import pyunitwizard as puw
+
+
+@pytest.fixture(autouse=True)
+def _libraries():
+    puw.configure.reset()
+    puw.configure.load_library(['pint', 'openmm.unit'])
+
+
+def test_save_and_memmap_quantity_roundtrip(tmp_path):
+    path = tmp_path / 'positions.npy'
+    puw.utils.numpy.save_quantity(path, puw.quantity(np.arange(6.0).reshape(2, 3), 'nanometer'))
+
+    quantity = puw.utils.numpy.memmap_quantity(path)
+
+    value = puw.get_value(quantity)
+    assert isinstance(value, np.memmap)
+    assert np.array_equal(value, np.arange(6.0).reshape(2, 3))
+    assert puw.get_unit(quantity, to_form='string') == 'nanometer'
+
+
+def test_memmap_quantity_wraps_the_map_in_the_requested_form(tmp_path):
+    path = tmp_path / 'positions.npy'
+    puw.utils.numpy.save_quantity(path, puw.quantity(np.ones(4), 'nanometer'))
+
+    quantity = puw.utils.numpy.memmap_quantity(path, form='openmm.unit')
+
+    assert puw.get_form(quantity) == 'openmm.unit'
+    assert isinstance(puw.get_value(quantity), np.memmap)
+
+
+def test_memmap_quantity_raw_binary_requires_unit(tmp_path):
+    path = tmp_path / 'positions.bin'
+    np.arange(4.0, dtype=np.float32).tofile(path)
+
+    with pytest.raises(ValueError):
+        puw.utils.numpy.memmap_quantity(path, dtype=np.float32)
+
+    quantity = puw.utils.numpy.memmap_quantity(path, unit='angstrom', dtype=np.float32, shape=(2, 2))
+    assert puw.get_value(quantity).shape == (2, 2)
+    assert np.allclose(puw.get_value(quantity, to_unit='nanometer'), [[0.0, 0.1], [0.2, 0.3]])
+
+
+def test_get_value_converts_a_memmap_into_another_in_blocks(tmp_path, monkeypatch):
+    from pyunitwizard.api import extraction
+
+    monkeypatch.setattr(extraction, '_SCALE_CHUNK_BYTES', 8*3*10)
+
+    source_path = tmp_path / 'source.npy'
+    puw.utils.numpy.save_quantity(source_path, puw.quantity(np.arange(300.0).reshape(100, 3), 'nanometer'))
+    source = puw.utils.numpy.memmap_quantity(source_path)
+
+    target = puw.utils.numpy.memmap_quantity(
+        tmp_path / 'target.npy', unit='angstrom', mode='w+', shape=(100, 3))
+    out = puw.get_value(target)
+
+    assert puw.get_value(source, to_unit='angstrom', out=out) is out
+    del target, out
+
+    reopened = puw.utils.numpy.memmap_quantity(tmp_path / 'target.npy')
+    assert puw.get_unit(reopened, to_form='string') == 'angstrom'
+    assert np.allclose(puw.get_value(reopened), np.arange(300.0).reshape(100, 3)*10.0)